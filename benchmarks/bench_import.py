@@ -0,0 +1,65 @@
+"""
+Import-time benchmark.
+
+Measures, in fresh interpreters, the wall time of `import ndimpute` and of
+the first call to each method (which triggers its deferred imports).
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5] [--json out.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+CASES = {
+    'import': "import ndimpute",
+    'substitution': (
+        "import ndimpute\n"
+        "ndimpute.impute_array([1.0, 2.0, 3.0], [True, False, False], method='substitution')"
+    ),
+    'ros_left': (
+        "import ndimpute\n"
+        "ndimpute.impute_array([1.0, 2.0, 3.0, 4.0], [True, False, False, False], method='ros')"
+    ),
+    'parametric_right': (
+        "import ndimpute\n"
+        "ndimpute.impute_array([1.0, 2.0, 3.0, 4.0], [False, False, False, True],"
+        " method='parametric', censoring_type='right')"
+    ),
+    'dataframe_output': (
+        "import ndimpute\n"
+        "ndimpute.impute([1.0, 2.0, 3.0], [True, False, False], method='substitution')"
+    ),
+}
+
+def time_case(code):
+    # Time inside the child so interpreter start-up is excluded
+    script = f"import time\nt0 = time.perf_counter()\n{code}\nprint(time.perf_counter() - t0)"
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    out = subprocess.run([sys.executable, "-c", script], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    return float(out.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help="Write results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in CASES.items():
+        times = [time_case(code) for _ in range(args.repeat)]
+        results[name] = {'min_s': min(times), 'median_s': sorted(times)[len(times) // 2]}
+        print(f"{name:20s} min {results[name]['min_s'] * 1e3:8.1f} ms   median {results[name]['median_s'] * 1e3:8.1f} ms")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'python': sys.version, 'timestamp': time.time(), 'results': results}, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""
+Speed and memory benchmark of `impute` across methods, censoring types and sizes.
+
+Every method / censoring_type / plotting_position (and mixed_strategy,
+Turnbull solver) combination is run on synthetic lognormal data for each
+size, plus `impute_grouped` on many small series. For each case the
+minimum and median wall time over --repeat runs are recorded, and the peak
+memory allocated during one further run (tracemalloc, which also tracks
+NumPy buffers).
+
+Sizes of a case stop growing once one run takes longer than --budget
+seconds; larger sizes are recorded as skipped.
+
+Usage:
+    python benchmarks/bench_impute.py [--sizes 100,1000,...] [--repeat 3]
+        [--budget 10] [--filter ros] [--json out.json] [--compare old.json]
+
+With --compare, cases whose median time grew by more than --threshold
+(default 1.25x) against an earlier --json file are listed, and the exit
+status is 1 if there are any.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import numpy as np  # noqa: E402
+import ndimpute  # noqa: E402
+
+DEFAULT_SIZES = [10 ** k for k in range(2, 8)]
+
+# (method, censoring_type, options)
+CASES = [
+    ('ros', 'left', {'plotting_position': 'kaplan-meier'}),
+    ('ros', 'left', {'plotting_position': 'simple'}),
+    ('substitution', 'left', {}),
+    ('ros', 'right', {'plotting_position': 'kaplan-meier'}),
+    ('ros', 'right', {'plotting_position': 'simple'}),
+    ('parametric', 'right', {}),
+    ('substitution', 'right', {}),
+    ('ros', 'mixed', {'mixed_strategy': 'joint'}),
+    ('ros', 'mixed', {'mixed_strategy': 'heuristic'}),
+    ('parametric', 'mixed', {}),
+    ('substitution', 'mixed', {}),
+    ('ros', 'interval', {'solver': 'em'}),
+    ('ros', 'interval', {'solver': 'squarem'}),
+]
+
+# Grouped runs: many series of GROUP_SIZE rows
+GROUP_SIZE = 20
+GROUPED_CASES = [
+    ('ros', 'left', {}),
+    ('parametric', 'right', {}),
+    ('ros', 'interval', {}),
+    ('substitution', 'left', {}),
+]
+
+def make_data(censoring_type, n, seed=0):
+    """
+    Lognormal data with about 30% censored rows (values, status).
+
+    Left limits take a few reporting-limit values and right-censoring times
+    are rounded, as in laboratory and reliability data; interval bounds are
+    the values rounded down and up to 0.1.
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.lognormal(1.0, 1.0, n)
+
+    if censoring_type == 'interval':
+        low = np.floor(x * 10) / 10
+        return np.column_stack((low, low + 0.1)), None
+
+    limits = rng.choice([1.0, 1.5, 2.0], n)
+    cutoff = np.round(rng.uniform(4.0, 12.0, n))
+    if censoring_type == 'left':
+        status = x < limits
+        return np.where(status, limits, x), status
+    if censoring_type == 'right':
+        status = x > cutoff
+        return np.where(status, cutoff, x), status
+
+    status = np.where(x < limits, -1, np.where(x > cutoff, 1, 0))
+    return np.where(status == -1, limits, np.where(status == 1, cutoff, x)), status
+
+def case_name(method, censoring_type, options, grouped=False):
+    parts = [('grouped_' if grouped else '') + method, censoring_type] + [str(v) for v in options.values()]
+    return '/'.join(parts)
+
+def make_call(method, censoring_type, options, n, grouped):
+    values, status = make_data(censoring_type, n)
+
+    if not grouped:
+        return lambda: ndimpute.impute(values, status, method=method, censoring_type=censoring_type, **options)
+
+    import pandas as pd
+    columns = {'series': np.arange(n) // GROUP_SIZE}
+    if censoring_type == 'interval':
+        columns.update(low=values[:, 0], high=values[:, 1])
+        value_col, status_col = ('low', 'high'), None
+    else:
+        columns.update(value=values, status=status)
+        value_col, status_col = 'value', 'status'
+    df = pd.DataFrame(columns)
+    return lambda: ndimpute.impute_grouped(df, 'series', value_col, status_col, method=method,
+                                           censoring_type=censoring_type, **options)
+
+def measure(call, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times.sort()
+    return {'min_s': times[0], 'median_s': times[len(times) // 2], 'peak_mb': peak / 2 ** 20}
+
+def run_case(method, censoring_type, options, sizes, repeat, budget, grouped=False):
+    name = case_name(method, censoring_type, options, grouped)
+    results = []
+    over_budget = False
+    for n in sizes:
+        entry = {'case': name, 'method': method, 'censoring_type': censoring_type, 'options': options,
+                 'grouped': grouped, 'n': n}
+        if over_budget:
+            results.append(dict(entry, skipped=True))
+            continue
+
+        try:
+            call = make_call(method, censoring_type, options, n, grouped)
+            call()  # warm-up: deferred imports, caches
+            entry.update(measure(call, repeat))
+        except Exception as err:
+            results.append(dict(entry, error=f"{type(err).__name__}: {err}"))
+            print(f"{name:40s} n={n:<9d} error: {err}")
+            continue
+
+        results.append(entry)
+        print(f"{name:40s} n={n:<9d} min {entry['min_s'] * 1e3:10.2f} ms   median "
+              f"{entry['median_s'] * 1e3:10.2f} ms   peak {entry['peak_mb']:9.1f} MB")
+        over_budget = entry['min_s'] > budget
+    return results
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path) as f:
+        baseline = {(r['case'], r['n']): r for r in json.load(f)['results'] if 'median_s' in r}
+
+    slower = []
+    for r in results:
+        old = baseline.get((r['case'], r['n']))
+        if old is not None and 'median_s' in r and r['median_s'] > threshold * old['median_s']:
+            slower.append((r['case'], r['n'], r['median_s'] / old['median_s']))
+
+    for case, n, ratio in slower:
+        print(f"SLOWER {case:40s} n={n:<9d} {ratio:.2f}x")
+    if not slower:
+        print(f"No case slower than {threshold:.2f}x the baseline.")
+    return slower
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=','.join(str(n) for n in DEFAULT_SIZES),
+                        help="Comma-separated sample sizes")
+    parser.add_argument('--group-sizes', default=None,
+                        help="Total rows for the grouped cases (default: same as --sizes)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget', type=float, default=10.0,
+                        help="Skip larger sizes of a case once one run exceeds this many seconds")
+    parser.add_argument('--filter', default=None, help="Only run cases whose name contains this string")
+    parser.add_argument('--json', help="Write results to this file")
+    parser.add_argument('--compare', help="Earlier --json output to compare median times against")
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args()
+
+    sizes = [int(float(s)) for s in args.sizes.split(',')]
+    group_sizes = [int(float(s)) for s in args.group_sizes.split(',')] if args.group_sizes else sizes
+
+    results = []
+    for grouped, cases, case_sizes in ((False, CASES, sizes), (True, GROUPED_CASES, group_sizes)):
+        for method, censoring_type, options in cases:
+            if args.filter and args.filter not in case_name(method, censoring_type, options, grouped):
+                continue
+            results += run_case(method, censoring_type, options, case_sizes, args.repeat, args.budget, grouped)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'python': sys.version, 'numpy': np.__version__, 'commit': git_commit(),
+                       'timestamp': time.time(), 'results': results}, f, indent=2)
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,36 @@
-from .api import impute
+# Public names are resolved on first access (PEP 562), so `import ndimpute`
+# does not import numpy, pandas or scipy until a function is actually used.
+_LAZY = {
+    "impute": "api",
+    "impute_array": "api",
+    "impute_grouped": "api",
+    "impute_columns": "api",
+    "impute_stream": "api",
+    "impute_multiple": "api",
+    "impute_parquet": "_parquet",
+    "read_parquet_censored": "_parquet",
+    "decode_qualifier": "_parquet",
+    "profile": "_profile",
+    "Profile": "_profile",
+    "TurnbullNPMLE": "_turnbull",
+    "ROSImputer": "_estimators",
+    "IncrementalROSImputer": "_estimators",
+    "WeibullConditionalImputer": "_estimators",
+    "TurnbullROSImputer": "_estimators",
+}
 
-__all__ = ["impute"]
+__all__ = ["impute", "impute_array", "impute_grouped", "impute_columns", "impute_stream", "impute_multiple", "impute_parquet",
+           "read_parquet_censored", "decode_qualifier", "profile", "Profile", "TurnbullNPMLE",
+           "ROSImputer", "IncrementalROSImputer", "WeibullConditionalImputer", "TurnbullROSImputer"]
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,80 @@
+import numpy as np
+from ._dispatch import coerce_status
+
+# Wide (n_samples, n_analytes) tables. Cells are read column by column into
+# one flat array, so every analyte is a contiguous group and the grouped
+# engine imputes all of them together: one lexsort and segment-wise
+# regressions for left/right ROS, one batched Newton solve for the Weibull,
+# a single pass for substitution. Missing cells (NaN) are dropped before
+# imputation and come back as NaN.
+
+def _column_major(a, n_extra):
+    # (n_samples, n_columns, ...) -> (n_columns * n_samples, ...)
+    return np.swapaxes(a, 0, 1).reshape((-1,) + a.shape[2:2 + n_extra])
+
+def _align_status(status, index, labels):
+    # Two DataFrames are matched by label, not by position
+    if status.index.equals(index) and status.columns.equals(labels):
+        return status
+    if set(status.columns) != set(labels) or set(status.index) != set(index):
+        raise ValueError("status DataFrame must have the same index and columns as values (in any order).")
+    return status.reindex(index=index, columns=labels)
+
+def impute_columns(values, status=None, method='ros', censoring_type='left', n_jobs=None, executor='auto',
+                   **kwargs):
+    """
+    Imputes every column of a wide table; see `ndimpute.impute_columns`.
+
+    Returns:
+        np.ndarray or pd.DataFrame: Imputed values with the shape of
+            `values` (a DataFrame when `values` is one), NaN where missing.
+    """
+    from ._parallel import impute_groups_parallel
+
+    labels = getattr(values, 'columns', None)
+    index = getattr(values, 'index', None)
+    x = np.asarray(values, dtype=float)
+
+    interval = censoring_type == 'interval'
+    if interval and (x.ndim != 3 or x.shape[2] != 2):
+        raise ValueError("For censoring_type='interval', values must be an (n_samples, n_analytes, 2) array "
+                         "of bounds.")
+    if not interval and x.ndim != 2:
+        raise ValueError(f"values must be a 2-D (n_samples, n_analytes) array, got {x.ndim} dimension(s).")
+
+    n_samples, n_columns = x.shape[:2]
+    flat = _column_major(x, 1 if interval else 0)
+    missing = np.isnan(flat).any(axis=1) if interval else np.isnan(flat)
+    keep = ~missing
+
+    flat_status = None
+    if not interval:
+        if status is None:
+            raise ValueError("Status argument is required for left/right/mixed censoring.")
+        if labels is not None and hasattr(status, 'columns'):
+            status = _align_status(status, index, labels)
+        status = np.asarray(status)
+        if status.shape != x.shape:
+            raise ValueError(f"status has shape {status.shape}, expected {x.shape}.")
+        # Status of missing cells is ignored (it may be NaN or None)
+        flat_status, _ = coerce_status(_column_major(status, 0)[keep], censoring_type)
+
+    # Columns with at least one value, each one contiguous group
+    counts = keep.reshape(n_columns, n_samples).sum(axis=1)
+    present = np.flatnonzero(counts)
+    stops = np.cumsum(counts[present])
+    starts = stops - counts[present]
+    keys = list(labels[present]) if labels is not None else present.tolist()
+
+    result = np.full(n_columns * n_samples, np.nan)
+    if len(present):
+        result[keep] = impute_groups_parallel(flat[keep], flat_status, starts, stops, method, censoring_type,
+                                              n_jobs=n_jobs, executor=executor, keys=keys, key_name='column',
+                                              **kwargs)
+    result = np.ascontiguousarray(result.reshape(n_columns, n_samples).T)
+
+    if labels is None:
+        return result
+
+    import pandas as pd
+    return pd.DataFrame(result, index=index, columns=labels)
@@ -0,0 +1,183 @@
+import numpy as np
+from ._profile import stage
+
+# Method modules are imported on first use of each method: scipy.stats is
+# only loaded by the methods that need it, keeping `import ndimpute` cheap.
+#
+# Inputs are taken with np.asarray semantics: NumPy arrays, np.memmap, pandas
+# columns and buffer-protocol / __array__ objects (e.g. Arrow arrays) are
+# used without copying when their dtype already fits.
+
+def prepare_output(values, out=None):
+    """
+    Returns the float array imputed values are written into, holding `values`.
+
+    Args:
+        values (array): Input values.
+        out (array, optional): Caller-supplied output (e.g. an np.memmap). May
+            be `values` itself to impute in place.
+
+    Returns:
+        array: A new float copy of values, or `out` filled with them.
+    """
+    if out is None:
+        return np.array(values, dtype=float)
+
+    if not isinstance(out, np.ndarray) or not np.issubdtype(out.dtype, np.floating):
+        raise ValueError("out must be a floating-point NumPy array (or np.memmap).")
+    if out.shape != np.shape(values):
+        raise ValueError(f"out has shape {out.shape}, expected {np.shape(values)}.")
+
+    # Already holding the values (in-place imputation): nothing to copy
+    if not _same_memory(out, values):
+        out[...] = values
+    return out
+
+def _same_memory(a, b):
+    if not isinstance(b, np.ndarray) or a.dtype != b.dtype or a.strides != b.strides:
+        return False
+    return a.__array_interface__['data'][0] == b.__array_interface__['data'][0]
+
+def _write_output(imputed, out):
+    if out is None or imputed is out:
+        return imputed
+    out[...] = imputed
+    return out
+
+def coerce_status(status, censoring_type):
+    """
+    Converts a status indicator to the dtype used by the censoring type.
+
+    Returns:
+        tuple: (status, is_imputed)
+    """
+    if status is None:
+        raise ValueError("Status argument is required for left/right/mixed censoring.")
+
+    if censoring_type == 'mixed':
+        status = np.asarray(status, dtype=int)
+        is_imputed = (status != 0)
+    else:
+        status = np.asarray(status, dtype=bool)
+        is_imputed = status
+
+    return status, is_imputed
+
+def split_bounds(values):
+    """
+    Splits an (N, 2) array of interval bounds into (left, right).
+    """
+    bounds = np.asarray(values)
+    if bounds.ndim != 2 or bounds.shape[1] != 2:
+        raise ValueError("For censoring_type='interval', values must be (N, 2) array of bounds.")
+
+    return bounds[:, 0], bounds[:, 1]
+
+def impute_values(values, status, method, censoring_type, out=None, **kwargs):
+    """
+    Dispatches to the imputation routine for a method and censoring type.
+
+    Args:
+        values (array): 1D data values, or (N, 2) bounds for interval censoring.
+        status (array): Status already coerced by `coerce_status` (ignored for intervals).
+        method (str): 'ros', 'parametric', or 'substitution'.
+        censoring_type (str): 'left', 'right', 'mixed', or 'interval'.
+        out (array, optional): Float array to write the result into (see
+            `prepare_output`).
+        **kwargs: Method options (dist, plotting_position, strategy, draw,
+            random_state, etc.)
+
+    Returns:
+        array: Imputed values (`out` when given).
+    """
+    with stage('impute'):
+        return _impute_values(values, status, method, censoring_type, out=out, **kwargs)
+
+def _impute_values(values, status, method, censoring_type, out=None, **kwargs):
+    dist = kwargs.get('dist', 'lognormal')
+    plotting_position = kwargs.get('plotting_position', 'kaplan-meier')
+    draw = kwargs.get('draw', 'mean')
+    random_state = kwargs.get('random_state')
+
+    if draw != 'mean' and method == 'substitution':
+        raise NotImplementedError("Substitution is deterministic; draw='random' needs method 'ros' or 'parametric'.")
+
+    if censoring_type == 'interval':
+        left, right = split_bounds(values)
+
+        if method == 'ros':
+            from ._interval import impute_interval_ros
+            return _write_output(impute_interval_ros(left, right, dist=dist, solver=kwargs.get('solver', 'em'),
+                                                     draw=draw, random_state=random_state,
+                                                     backend=kwargs.get('backend', 'numpy')), out)
+        else:
+            raise NotImplementedError(f"Method '{method}' not implemented for interval censoring.")
+
+    if censoring_type == 'left':
+        if method == 'ros':
+            from ._ros_left import impute_ros_left
+            imputed_vals = impute_ros_left(values, status, dist=dist, plotting_position=plotting_position, out=out,
+                                           draw=draw, random_state=random_state)
+        elif method == 'substitution':
+            from ._substitution import impute_sub_left
+            strategy = kwargs.get('strategy', 'half')
+            multiplier = kwargs.get('multiplier', None)
+            imputed_vals = impute_sub_left(values, status, strategy=strategy, multiplier=multiplier, out=out)
+        else:
+            raise NotImplementedError(f"Method '{method}' not implemented for left censoring.")
+
+    elif censoring_type == 'right':
+        if method == 'ros':
+            from ._ros_right import impute_ros_right
+            imputed_vals = impute_ros_right(values, status, dist=dist, plotting_position=plotting_position,
+                                            draw=draw, random_state=random_state)
+        elif method == 'parametric':
+            from ._parametric import impute_right_conditional
+            imputed_vals = impute_right_conditional(values, status, init=kwargs.get('init'), out=out,
+                                                    draw=draw, random_state=random_state)
+        elif method == 'substitution':
+            from ._substitution import impute_sub_right
+            strategy = kwargs.get('strategy', 'value')
+            multiplier = kwargs.get('multiplier', None)
+            imputed_vals = impute_sub_right(values, status, strategy=strategy, multiplier=multiplier, out=out)
+        else:
+            raise ValueError(f"Unknown method '{method}' for right censoring.")
+
+    elif censoring_type == 'mixed':
+        if method == 'parametric':
+            from ._parametric import impute_mixed_parametric
+            imputed_vals = impute_mixed_parametric(values, status, init=kwargs.get('init'), out=out,
+                                                   draw=draw, random_state=random_state)
+        elif method == 'substitution':
+            from ._substitution import impute_sub_mixed
+            # Extract mixed kwargs
+            left_kwargs = {
+                'strategy': kwargs.get('left_strategy', 'half'),
+                'multiplier': kwargs.get('left_multiplier', None)
+            }
+            right_kwargs = {
+                'strategy': kwargs.get('right_strategy', 'value'),
+                'multiplier': kwargs.get('right_multiplier', None)
+            }
+            imputed_vals = impute_sub_mixed(values, status, left_kwargs=left_kwargs, right_kwargs=right_kwargs,
+                                            out=out)
+        elif method == 'ros':
+            mixed_strategy = kwargs.get('mixed_strategy', 'joint')
+            if mixed_strategy == 'joint':
+                from ._ros_mixed import impute_ros_mixed
+                imputed_vals = impute_ros_mixed(values, status, dist=dist, solver=kwargs.get('solver', 'em'),
+                                                draw=draw, random_state=random_state,
+                                                backend=kwargs.get('backend', 'numpy'))
+            elif mixed_strategy == 'heuristic':
+                from ._ros_mixed import impute_ros_mixed_heuristic
+                imputed_vals = impute_ros_mixed_heuristic(values, status, draw=draw, random_state=random_state)
+            else:
+                raise ValueError(f"Unknown mixed_strategy '{mixed_strategy}'. Options: 'joint', 'heuristic'.")
+        else:
+            raise ValueError(f"Unknown method '{method}' for mixed censoring.")
+
+    else:
+        raise ValueError("censoring_type must be 'left', 'right', 'mixed', or 'interval'")
+
+    # Routines without an `out` argument (reverse/mixed ROS) are copied in
+    return _write_output(imputed_vals, out)
@@ -0,0 +1,316 @@
+import numpy as np
+from ._dispatch import coerce_status, split_bounds
+from ._ros_left import _fit_ros_counts, _impute_limits
+from ._ros_right import _mirror
+
+# Estimators split fitting from imputation so a model fitted on a reference
+# window can impute new batches without refitting. `fit_transform` on the
+# same data gives the same result as the matching `impute` method.
+
+def _check_fitted(estimator, attribute):
+    if getattr(estimator, attribute) is None:
+        raise ValueError(f"This {type(estimator).__name__} is not fitted yet. Call 'fit' first.")
+
+def _value_counts(values, is_censored):
+    """
+    Sorted unique values with the number of detects and limits at each.
+    """
+    support, inverse = np.unique(values, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n_detect = np.bincount(inverse[~is_censored], minlength=len(support))
+    n_limit = np.bincount(inverse[is_censored], minlength=len(support))
+    return support, n_detect, n_limit
+
+class ROSImputer:
+    """
+    Robust ROS with Kaplan-Meier (Hirsch-Stedinger) plotting positions.
+
+    `transform` places each limit at the plotting position the fitted data
+    gives its value and imputes the conditional mean below it under the
+    fitted regression. Right-censored data is handled as in
+    `impute_ros_right`, on the mirrored values.
+
+    Args:
+        censoring_type (str): 'left' or 'right'.
+        dist (str): Distribution assumption ('lognormal' or 'normal').
+
+    Attributes:
+        intercept (float): Regression intercept (mean of the, possibly
+            log-transformed, mirrored data for right censoring).
+        slope (float): Regression slope (standard deviation).
+        n_samples (int): Number of rows in the fitted data.
+    """
+
+    def __init__(self, censoring_type='left', dist='lognormal'):
+        if censoring_type not in ('left', 'right'):
+            raise ValueError("ROSImputer supports censoring_type 'left' or 'right'.")
+        self.censoring_type = censoring_type
+        self.dist = dist
+        self.intercept = None
+        self.slope = None
+        self.n_samples = None
+
+    def _to_left(self, values):
+        values = np.array(values, dtype=float)
+        if self.dist == 'lognormal' and (values <= 0).any():
+            raise ValueError("Values must be positive for lognormal distribution.")
+        if self.censoring_type == 'right':
+            return _mirror(values, self.dist)
+        return values
+
+    def fit(self, values, status):
+        """
+        Fits the plotting positions and regression.
+
+        Args:
+            values (array-like): Observed values (limits for censored rows).
+            status (array-like): True if censored.
+
+        Returns:
+            ROSImputer: self.
+        """
+        status, _ = coerce_status(status, self.censoring_type)
+        support, n_detect, n_limit = _value_counts(self._to_left(values), status)
+        self._refit(support, n_detect, n_limit)
+        return self
+
+    def _refit(self, support, n_detect, n_limit):
+        self._support, self._n_detect, self._n_limit = support, n_detect, n_limit
+        self.intercept, self.slope, positions = _fit_ros_counts(support, n_detect, n_limit, self.dist)
+        self.n_samples = int(n_detect.sum() + n_limit.sum())
+
+        # A limit above every fitted value has plotting position 1 (scaled)
+        self._positions = np.append(positions, self.n_samples / (self.n_samples + 1))
+
+    def transform(self, values, status):
+        """
+        Imputes censored values with the fitted model.
+
+        Returns:
+            np.ndarray: Observed values, with censored rows imputed.
+        """
+        _check_fitted(self, 'intercept')
+        status, _ = coerce_status(status, self.censoring_type)
+        result = self._to_left(values)
+
+        # KM position of a limit: that of the first fitted value at or above it
+        limits = result[status]
+        positions = self._positions[np.searchsorted(self._support, limits, side='left')]
+        result[status] = _impute_limits(limits, positions, self.intercept, self.slope, self.dist,
+                                        self.n_samples)
+
+        if self.censoring_type == 'right':
+            return _mirror(result, self.dist)
+        return result
+
+    def fit_transform(self, values, status):
+        """
+        Fits on the data and imputes it.
+        """
+        return self.fit(values, status).transform(values, status)
+
+class IncrementalROSImputer(ROSImputer):
+    """
+    ROSImputer that can be refitted as new observations arrive.
+
+    The fitted data is held only as counts of detects and limits per unique
+    value (sorted), so the raw history is neither stored nor re-sorted.
+    Each `partial_fit` is not an incremental update but a full refit on the
+    count table: merging the batch and recomputing every plotting position
+    and the regression costs O(U + k log U) for U unique values and k new
+    rows. A new row changes the at-risk counts, and hence the plotting
+    position, of every support point (and n), so no position or
+    regression sum carries over unchanged.
+
+    Args:
+        censoring_type (str): 'left' or 'right'.
+        dist (str): Distribution assumption ('lognormal' or 'normal').
+    """
+
+    def __init__(self, censoring_type='left', dist='lognormal'):
+        super().__init__(censoring_type=censoring_type, dist=dist)
+        self._reset()
+
+    def _reset(self):
+        self._support = np.array([], dtype=float)
+        self._n_detect = np.zeros(0, dtype=np.int64)
+        self._n_limit = np.zeros(0, dtype=np.int64)
+        self.intercept = self.slope = self.n_samples = None
+
+    def fit(self, values, status):
+        """
+        Discards any previous data and fits on this batch.
+
+        Returns:
+            IncrementalROSImputer: self.
+        """
+        self._reset()
+        return self.partial_fit(values, status)
+
+    def partial_fit(self, values, status):
+        """
+        Adds a batch of observations and refits on the updated count table.
+
+        The model stays unfitted until at least two detects have been seen.
+
+        Returns:
+            IncrementalROSImputer: self.
+        """
+        status, _ = coerce_status(status, self.censoring_type)
+        batch, batch_detect, batch_limit = _value_counts(self._to_left(values), status)
+
+        support = self._support
+        n_detect = self._n_detect.astype(np.int64)
+        n_limit = self._n_limit.astype(np.int64)
+
+        # Values already present: add to their counts
+        pos = np.searchsorted(support, batch)
+        found = pos < len(support)
+        found[found] = support[pos[found]] == batch[found]
+        n_detect[pos[found]] += batch_detect[found]
+        n_limit[pos[found]] += batch_limit[found]
+
+        # New values: insert in sorted position
+        new = ~found
+        support = np.insert(support, pos[new], batch[new])
+        n_detect = np.insert(n_detect, pos[new], batch_detect[new])
+        n_limit = np.insert(n_limit, pos[new], batch_limit[new])
+
+        if n_detect.sum() < 2:
+            self._support, self._n_detect, self._n_limit = support, n_detect, n_limit
+            return self
+
+        self._refit(support, n_detect, n_limit)
+        return self
+
+class WeibullConditionalImputer:
+    """
+    Conditional mean imputation under a fitted two-parameter Weibull.
+
+    Right-censored values become E[T | T > C] and, for mixed censoring,
+    left-censored values E[T | T < L].
+
+    Args:
+        censoring_type (str): 'right' (boolean status) or 'mixed'
+            (-1: Left, 0: Observed, 1: Right).
+        warm_start (bool): If True, refitting starts from the current
+            shape and scale (e.g. a new batch or a bootstrap resample of
+            similar data), which converges in fewer Newton steps.
+
+    Attributes:
+        shape (float): Weibull shape k.
+        scale (float): Weibull scale lambda.
+    """
+
+    def __init__(self, censoring_type='right', warm_start=False):
+        if censoring_type not in ('right', 'mixed'):
+            raise ValueError("WeibullConditionalImputer supports censoring_type 'right' or 'mixed'.")
+        self.censoring_type = censoring_type
+        self.warm_start = warm_start
+        self.shape = None
+        self.scale = None
+
+    def fit(self, values, status):
+        """
+        Fits the Weibull by censored maximum likelihood.
+
+        Returns:
+            WeibullConditionalImputer: self.
+        """
+        from ._parametric import _fit_weibull
+
+        data = np.array(values, dtype=float)
+        status, _ = coerce_status(status, self.censoring_type)
+        status = status.astype(int)
+
+        init = (self.shape, self.scale) if self.warm_start and self.shape is not None else None
+        self.shape, self.scale = _fit_weibull(data[status == 0], left=data[status == -1],
+                                              right=data[status == 1], init=init)
+        return self
+
+    def transform(self, values, status):
+        """
+        Imputes censored values with the fitted Weibull.
+
+        Returns:
+            np.ndarray: Observed values, with censored rows imputed.
+        """
+        from ._parametric import _expected_above, _expected_below
+
+        _check_fitted(self, 'shape')
+        result = np.array(values, dtype=float)
+        status, _ = coerce_status(status, self.censoring_type)
+        status = status.astype(int)
+
+        mask_left = status == -1
+        mask_right = status == 1
+        if np.any(mask_left):
+            result[mask_left] = _expected_below(result[mask_left], self.shape, self.scale)
+        if np.any(mask_right):
+            result[mask_right] = _expected_above(result[mask_right], self.shape, self.scale)
+        return result
+
+    def fit_transform(self, values, status):
+        """
+        Fits on the data and imputes it.
+        """
+        return self.fit(values, status).transform(values, status)
+
+class TurnbullROSImputer:
+    """
+    Interval-censored ROS on Turnbull plotting positions.
+
+    Each interval is imputed with the conditional mean of the fitted
+    (log-)normal within its bounds.
+
+    Args:
+        dist (str): Distribution assumption ('lognormal' or 'normal').
+        solver (str): Turnbull iteration scheme ('em' or 'squarem').
+
+    Attributes:
+        intercept (float): Fitted mean (of log values for 'lognormal').
+        slope (float): Fitted standard deviation.
+    """
+
+    def __init__(self, dist='lognormal', solver='em'):
+        self.dist = dist
+        self.solver = solver
+        self.intercept = None
+        self.slope = None
+
+    def fit(self, bounds):
+        """
+        Fits the Turnbull estimator and regression.
+
+        Args:
+            bounds (array-like): (N, 2) array of (left, right) bounds.
+
+        Returns:
+            TurnbullROSImputer: self.
+        """
+        from ._interval import _fit_interval_ros
+
+        left, right = split_bounds(bounds)
+        self.intercept, self.slope = _fit_interval_ros(left.astype(float), right.astype(float),
+                                                       dist=self.dist, solver=self.solver)
+        return self
+
+    def transform(self, bounds):
+        """
+        Imputes every interval with the fitted model.
+
+        Returns:
+            np.ndarray: Imputed values.
+        """
+        from ._interval import _predict_interval
+
+        _check_fitted(self, 'intercept')
+        left, right = split_bounds(bounds)
+        return _predict_interval(left.astype(float), right.astype(float), self.intercept, self.slope,
+                                 dist=self.dist)
+
+    def fit_transform(self, bounds):
+        """
+        Fits on the intervals and imputes them.
+        """
+        return self.fit(bounds).transform(bounds)
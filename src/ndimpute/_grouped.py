@@ -0,0 +1,138 @@
+import numpy as np
+from ._dispatch import impute_values
+
+# Plotting positions supported by the segmented (all groups at once) ROS engine
+_SEGMENTED_POSITIONS = ('kaplan-meier', 'ecdf', 'hirsch-stedinger', 'simple', 'weibull')
+
+def group_bounds(codes):
+    """
+    Sorts rows by integer group code once and finds each group's slice.
+
+    Args:
+        codes (array): Integer group code per row.
+
+    Returns:
+        tuple: (order, starts, stops)
+            order: Stable permutation that sorts rows by group.
+            starts, stops: Slice bounds of each group within the sorted rows.
+    """
+    codes = np.asarray(codes)
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+
+    breaks = np.flatnonzero(sorted_codes[1:] != sorted_codes[:-1]) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [len(codes)]))
+    if len(codes) == 0:
+        starts, stops = starts[:0], stops[:0]
+
+    return order, starts, stops
+
+def impute_groups(values, status, starts, stops, method, censoring_type, keys=None, key_name='group', **kwargs):
+    """
+    Imputes many independent groups stored contiguously in sorted arrays.
+
+    Substitution does not depend on the rest of the group, so it runs in a
+    single pass over all rows. Left/right ROS and the parametric Weibull fit
+    are solved for all groups together; groups those batched paths cannot
+    handle, and the other methods, fit one model per group on array slices
+    (no per-group copies or DataFrames).
+
+    Args:
+        values (array): Values sorted by group (or (N, 2) bounds for intervals).
+        status (array): Coerced status sorted by group (None for intervals).
+        starts, stops (array): Slice bounds of each group.
+        method (str): Imputation method.
+        censoring_type (str): Censoring type.
+        keys (sequence, optional): Group labels, used in error messages.
+        key_name (str): What a group is called in error messages.
+        **kwargs: Method options passed to the imputation routine.
+
+    Returns:
+        array: Imputed values in the sorted row order.
+    """
+    if method == 'substitution' and censoring_type != 'interval':
+        return impute_values(values, status, method, censoring_type, **kwargs)
+
+    imputed = np.empty(len(values), dtype=float)
+
+    dist = kwargs.get('dist', 'lognormal')
+    plotting_position = kwargs.get('plotting_position', 'kaplan-meier')
+
+    if kwargs.get('draw', 'mean') != 'mean':
+        # Random draws: one stream through the groups in order, so a seed
+        # reproduces the result
+        kwargs['random_state'] = np.random.default_rng(kwargs.get('random_state'))
+        remaining = range(len(starts))
+    elif method == 'parametric' and censoring_type in ('right', 'mixed'):
+        remaining = _impute_parametric_batched(imputed, values, status, starts, stops, censoring_type,
+                                               init=kwargs.get('init'))
+    elif (method == 'ros' and censoring_type in ('left', 'right') and dist in ('lognormal', 'normal')
+          and plotting_position in _SEGMENTED_POSITIONS):
+        from ._segmented import impute_ros_segmented
+        remaining = impute_ros_segmented(imputed, values, status, starts, stops, censoring_type=censoring_type,
+                                         dist=dist, plotting_position=plotting_position)
+    else:
+        remaining = range(len(starts))
+
+    for g in remaining:
+        start, stop = starts[g], stops[g]
+        group_status = None if status is None else status[start:stop]
+        try:
+            imputed[start:stop] = impute_values(values[start:stop], group_status,
+                                                method, censoring_type, **kwargs)
+        except ValueError as err:
+            label = keys[g] if keys is not None else g
+            raise ValueError(f"Imputation failed for {key_name} {label!r}: {err}") from err
+
+    return imputed
+
+def _impute_parametric_batched(imputed, values, status, starts, stops, censoring_type, init=None):
+    """
+    Fits the Weibull of every group in one batched Newton solve and imputes
+    all rows with the conditional-mean formulas.
+
+    Groups the batch cannot handle (invalid values, or no converged MLE)
+    are left for the per-group path, which falls back to scipy's fit.
+
+    Returns:
+        array: Indices of the groups still to impute.
+    """
+    from ._weibull import fit_weibull_batched
+    from ._parametric import _expected_above, _expected_below
+
+    values = np.asarray(values, dtype=float)
+    codes = status.astype(int)
+    sizes = stops - starts
+    gid = np.repeat(np.arange(len(starts)), sizes)
+
+    # Right censoring without censored rows needs no fit
+    n_censored = np.bincount(gid, weights=codes != 0, minlength=len(starts))
+    needs_fit = (n_censored > 0) if censoring_type == 'right' else np.ones(len(starts), dtype=bool)
+
+    valid = (values > 0) & np.isfinite(values)
+    fits = needs_fit & (np.bincount(gid, weights=~valid, minlength=len(starts)) == 0)
+    fit_groups = np.flatnonzero(fits)
+
+    shapes = np.full(len(starts), np.nan)
+    scales = np.full(len(starts), np.nan)
+    if len(fit_groups):
+        # Fitted groups packed contiguously
+        rows = np.flatnonzero(fits[gid])
+        fit_sizes = sizes[fit_groups]
+        fit_stops = np.cumsum(fit_sizes)
+        s, c, info = fit_weibull_batched(values[rows], codes[rows], fit_stops - fit_sizes, fit_stops,
+                                         init=init, return_info=True)
+        ok = info['converged']
+        shapes[fit_groups[ok]], scales[fit_groups[ok]] = s[ok], c[ok]
+
+    done = np.isfinite(shapes) | ~needs_fit
+    row_done = done[gid]
+    imputed[row_done] = values[row_done]
+
+    for code, expected in ((1, _expected_above), (-1, _expected_below)):
+        mask = row_done & (codes == code)
+        if mask.any():
+            imputed[mask] = expected(values[mask], shapes[gid[mask]], scales[gid[mask]])
+
+    return np.flatnonzero(~done)
@@ -1,17 +1,125 @@
 import numpy as np
-from scipy.stats import norm, linregress
-from ._turnbull import turnbull_em, predict_turnbull
+from scipy.special import erfcx, log_ndtr, ndtr, ndtri, ndtri_exp
+from ._profile import stage
+from ._turnbull import turnbull_em, turnbull_em_batched
 
-def impute_interval_ros(left, right, dist='lognormal'):
+# Below this width (in Z units) a second-order expansion about the midpoint
+# is more accurate than the closed form, which loses digits to cancellation.
+_MIN_WIDTH = 1e-4
+
+# Largest plotting position below 1
+_MAX_PP = np.nextafter(1.0, 0.0)
+
+def _truncnorm_mean(a, b):
     """
-    Imputes interval-censored data using ROS with plotting positions derived
-    from the Turnbull Estimator.
+    Vectorized E[Z | a < Z < b] for a standard normal Z.
+
+    Stable far into either tail: intervals are reflected into the lower half
+    (E[Z | a < Z < b] = -E[Z | -b < Z < -a]) and, when wholly below zero,
+    evaluated with the scaled complementary error function (Mills ratio)
+    instead of differencing CDF values that underflow.
+
+    Args:
+        a (array): Lower bounds (may be -inf).
+        b (array): Upper bounds (may be inf), b >= a.
+
+    Returns:
+        array: Conditional means. Zero-width intervals return their point.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a, b = a.copy(), b.copy()
+
+    # Reflect so the interval sits mostly below zero ((-inf, inf) is left alone)
+    with np.errstate(invalid='ignore'):
+        flip = (a + b) > 0
+    a[flip], b[flip] = -b[flip], -a[flip]
+
+    e_z = np.zeros_like(a)
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        point = (b - a) < _MIN_WIDTH
+        lower = ~point & (b <= 0)
+        straddle = ~point & ~lower
+
+        # Wholly below zero. With Phi(x) = phi(x) * m(x), where
+        # m(x) = sqrt(pi/2) * erfcx(-x / sqrt(2)), and r = phi(a) / phi(b):
+        # E = (r - 1) / (m(b) - r * m(a))
+        al, bl = a[lower], b[lower]
+        log_r = (bl - al) * (bl + al) / 2.0
+        m_a = np.sqrt(np.pi / 2) * erfcx(-al / np.sqrt(2))
+        m_b = np.sqrt(np.pi / 2) * erfcx(-bl / np.sqrt(2))
+        r_m_a = np.where(np.isinf(al), 0.0, np.exp(log_r) * m_a)
+        e_z[lower] = np.expm1(log_r) / (m_b - r_m_a)
+
+        # Interval around zero: the direct formula has no cancellation
+        as_, bs = a[straddle], b[straddle]
+        phi_a = np.exp(-as_**2 / 2.0) / np.sqrt(2 * np.pi)
+        phi_b = np.exp(-bs**2 / 2.0) / np.sqrt(2 * np.pi)
+        e_z[straddle] = (phi_a - phi_b) / (ndtr(bs) - ndtr(as_))
+
+        # Narrow interval: E ~ mid - mid * width^2 / 12 (exact for width 0)
+        mid = (a[point] + b[point]) / 2.0
+        e_z[point] = mid - mid * (b[point] - a[point])**2 / 12.0
+
+    e_z[flip] = -e_z[flip]
+    return e_z
+
+def _sample_truncnorm(a, b, u):
+    """
+    Vectorized inverse-CDF draws of a standard normal Z truncated to [a, b].
+
+    The draw is Phi^-1((1 - u) * Phi(a) + u * Phi(b)). Intervals are
+    reflected into the lower half as in `_truncnorm_mean`, where that convex
+    combination has no cancellation, and it is formed in log space
+    (log_ndtr / ndtri_exp) so it stays exact where Phi underflows.
+
+    Args:
+        a (array): Lower bounds (may be -inf).
+        b (array): Upper bounds (may be inf), b >= a.
+        u (array): Uniform(0, 1) variates; all three broadcast together.
+
+    Returns:
+        array: Draws, within [a, b].
+    """
+    a, b, u = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                  np.asarray(u, dtype=float))
+
+    with np.errstate(invalid='ignore'):
+        flip = (a + b) > 0
+    lo = np.where(flip, -b, a)
+    hi = np.where(flip, -a, b)
+
+    # Reflection reverses the order, so u weights the other bound
+    with np.errstate(divide='ignore'):
+        log_u, log_1mu = np.log(u), np.log1p(-u)
+        log_p = np.logaddexp(log_ndtr(lo) + np.where(flip, log_u, log_1mu),
+                             log_ndtr(hi) + np.where(flip, log_1mu, log_u))
+    z = np.clip(ndtri_exp(log_p), lo, hi)
+
+    return np.where(flip, -z, z)
+
+def _turnbull_z(probs):
     """
-    left = np.array(left)
-    right = np.array(right)
+    Z-scores of the Turnbull plotting positions (midpoints of the CDF steps)
+    along the last axis.
 
+    Trailing intervals with negligible mass (left over by EM) can sit where
+    the cumulative sum has already rounded to 1; their positions are kept
+    just below 1 so the Z-scores stay finite.
+    """
+    pp = np.cumsum(probs, axis=-1) - probs / 2.0
+    return ndtri(np.minimum(pp, _MAX_PP))
+
+def _fit_interval_ros(left, right, dist='lognormal', solver='em', backend='numpy'):
+    """
+    Fits the interval ROS regression on Turnbull plotting positions.
+
+    Returns:
+        tuple: (intercept, slope) of the fitted (log-)normal: mean and
+            standard deviation.
+    """
     # 1. Turnbull Estimator
-    intervals, probs = turnbull_em(left, right)
+    intervals, probs = turnbull_em(left, right, solver=solver, backend=backend)
 
     if len(probs) == 0:
         raise ValueError("Turnbull estimator failed to find valid intervals.")
@@ -20,16 +128,17 @@ def impute_interval_ros(left, right, dist='lognormal'):
     # Fit regression to Turnbull CDF points
     mids = np.mean(intervals, axis=1)
 
-    # Cumulative Probabilities
-    cdf_vals = np.cumsum(probs)
-    pp_turnbull = cdf_vals - (probs / 2.0)
+    # Plotting positions from the cumulative probabilities
+    z_turnbull = _turnbull_z(probs)
 
-    z_turnbull = norm.ppf(pp_turnbull)
+    # Unbounded innermost intervals (e.g. (L, inf)) carry mass into the
+    # cumulative probabilities but have no midpoint to regress on.
+    finite_mids = np.isfinite(mids)
 
     if dist == 'lognormal':
         # Handle non-positive midpoints if any (though Turnbull intervals should be within obs range)
         # If mid <= 0, we can't take log.
-        valid_mids = mids > 0
+        valid_mids = finite_mids & (mids > 0)
         if not np.any(valid_mids):
              raise ValueError("Intervals must be positive for lognormal distribution.")
 
@@ -37,59 +146,111 @@ def impute_interval_ros(left, right, dist='lognormal'):
         z_fit = z_turnbull[valid_mids]
         weights = probs[valid_mids]
     else:
-        y_fit = mids
-        z_fit = z_turnbull
-        weights = probs
+        if not np.any(finite_mids):
+            raise ValueError("Turnbull estimator found no bounded intervals to fit.")
+
+        y_fit = mids[finite_mids]
+        z_fit = z_turnbull[finite_mids]
+        weights = probs[finite_mids]
 
     # Weighted OLS
-    w_mean_x = np.average(z_fit, weights=weights)
-    w_mean_y = np.average(y_fit, weights=weights)
+    with stage('regression'):
+        w_mean_x = np.average(z_fit, weights=weights)
+        w_mean_y = np.average(y_fit, weights=weights)
 
-    numerator = np.sum(weights * (z_fit - w_mean_x) * (y_fit - w_mean_y))
-    denominator = np.sum(weights * (z_fit - w_mean_x)**2)
+        numerator = np.sum(weights * (z_fit - w_mean_x) * (y_fit - w_mean_y))
+        denominator = np.sum(weights * (z_fit - w_mean_x)**2)
 
-    slope = numerator / denominator
-    intercept = w_mean_y - slope * w_mean_x
+        slope = numerator / denominator
+        intercept = w_mean_y - slope * w_mean_x
 
-    # 3. Impute
-    mu_model = intercept
-    sigma_model = slope
+    return intercept, slope
 
-    imputed = np.zeros_like(left, dtype=float)
+def _fit_interval_ros_batched(left, right, weights, dist='lognormal'):
+    """
+    `_fit_interval_ros` for many weightings of the same intervals (e.g.
+    bootstrap counts), with one batched NPMLE (`turnbull_em_batched`) and
+    the weighted regressions done as (B, M) array operations.
 
-    for i in range(len(left)):
-        l_i, r_i = left[i], right[i]
+    Returns:
+        tuple: (intercept, slope) arrays, one entry per row of `weights`;
+            NaN where the regression is undefined.
+    """
+    intervals, probs, _ = turnbull_em_batched(left, right, weights)
 
-        # Transform bounds to Z-space
-        if dist == 'lognormal':
-            with np.errstate(divide='ignore'):
-                z_l = (np.log(l_i) - mu_model) / sigma_model if l_i > 0 else -np.inf
-                z_r = (np.log(r_i) - mu_model) / sigma_model if not np.isinf(r_i) else np.inf
-        else:
-            z_l = (l_i - mu_model) / sigma_model
-            z_r = (r_i - mu_model) / sigma_model if not np.isinf(r_i) else np.inf
+    mids = np.mean(intervals, axis=1)
+    valid = np.isfinite(mids)
+    if dist == 'lognormal':
+        valid &= mids > 0
+    with np.errstate(divide='ignore'):
+        y = np.log(np.where(valid, mids, 1.0)) if dist == 'lognormal' else np.where(valid, mids, 0.0)
 
-        # Expected Z in truncated range
-        phi_a = norm.pdf(z_l)
-        phi_b = norm.pdf(z_r) if not np.isinf(z_r) else 0.0
+    # Intervals without mass (or without a midpoint) get zero weight
+    w = np.where(valid, probs, 0.0)
+    z = np.where(w > 0, _turnbull_z(probs), 0.0)
 
-        Phi_a = norm.cdf(z_l)
-        Phi_b = norm.cdf(z_r) if not np.isinf(z_r) else 1.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w_sum = w.sum(axis=1, keepdims=True)
+        z_mean = (w * z).sum(axis=1, keepdims=True) / w_sum
+        y_mean = (w * y).sum(axis=1, keepdims=True) / w_sum
+        slope = (w * (z - z_mean) * (y - y_mean)).sum(axis=1) / (w * (z - z_mean) ** 2).sum(axis=1)
+    intercept = y_mean[:, 0] - slope * z_mean[:, 0]
+    return intercept, slope
 
-        denom = Phi_b - Phi_a
-        if denom < 1e-9:
-            # Interval is extremely far in tail or tiny. Use midpoint logic.
-            # If lognormal, geometric mean? Or just transformed Z.
-            e_z = (z_l + z_r) / 2 if not np.isinf(z_r) and not np.isinf(z_l) else z_l + 1
-        else:
-            e_z = (phi_a - phi_b) / denom
+def _predict_interval(left, right, intercept, slope, dist='lognormal', u=None):
+    """
+    Conditional mean of the fitted (log-)normal within each interval.
 
-        # Back transform
-        pred_val = mu_model + sigma_model * e_z
+    Given Uniform(0, 1) variates `u`, returns random draws from the fitted
+    distribution truncated to each interval instead. Parameters broadcast
+    with the bounds.
+    """
+    mu_model = intercept
+    sigma_model = slope
 
+    # Transform bounds to Z-space (non-positive lower bounds map to -inf)
+    with np.errstate(divide='ignore', invalid='ignore'):
         if dist == 'lognormal':
-            imputed[i] = np.exp(pred_val)
+            log_l = np.full_like(left, -np.inf)
+            np.log(left, out=log_l, where=left > 0)
+            z_l = (log_l - mu_model) / sigma_model
+            z_r = (np.log(right) - mu_model) / sigma_model
         else:
-            imputed[i] = pred_val
+            z_l = (left - mu_model) / sigma_model
+            z_r = (right - mu_model) / sigma_model
+
+    # Expected (or drawn) Z in truncated range, then back transform
+    e_z = _truncnorm_mean(z_l, z_r) if u is None else _sample_truncnorm(z_l, z_r, u)
+    pred_val = mu_model + sigma_model * e_z
+
+    if dist == 'lognormal':
+        return np.exp(pred_val)
+    else:
+        return pred_val
+
+def impute_interval_ros(left, right, dist='lognormal', solver='em', draw='mean', random_state=None,
+                        backend='numpy'):
+    """
+    Imputes interval-censored data using ROS with plotting positions derived
+    from the Turnbull Estimator.
+
+    Args:
+        left (array): Lower bounds of intervals.
+        right (array): Upper bounds of intervals (np.inf if right-censored).
+        dist (str): Distribution assumption ('lognormal' or 'normal').
+        solver (str): Turnbull iteration scheme ('em' or 'squarem').
+        backend (str): Turnbull EM implementation ('numpy' or 'numba').
+        draw (str): 'mean' (default) imputes the conditional mean within each
+            interval; 'random' draws from the fitted distribution truncated
+            to the interval.
+        random_state (int or np.random.Generator, optional): Seed for draw='random'.
+    """
+    if draw not in ('mean', 'random'):
+        raise ValueError(f"Unknown draw '{draw}'. Options: 'mean', 'random'.")
+
+    left = np.asarray(left, dtype=float)
+    right = np.asarray(right, dtype=float)
 
-    return imputed
+    intercept, slope = _fit_interval_ros(left, right, dist=dist, solver=solver, backend=backend)
+    u = np.random.default_rng(random_state).random(len(left)) if draw == 'random' else None
+    return _predict_interval(left, right, intercept, slope, dist=dist, u=u)
@@ -0,0 +1,247 @@
+import numpy as np
+from scipy.special import ndtri
+from ._dispatch import coerce_status, split_bounds
+
+# Multiple imputation. Each imputation refits the model to a bootstrap
+# resample of the data (so parameter uncertainty is carried through) and
+# then draws every censored value from the refitted distribution truncated
+# to its censoring range, instead of using the conditional mean.
+#
+# Replicates are produced in chunks of rows of the (B, n) result. Bootstrap
+# refits within a chunk are batched (segmented ROS, batched Newton Weibull),
+# and each chunk has its own random stream, so results depend on
+# random_state and chunk_size but not on n_jobs.
+
+# Rows of the (B, n) result held per chunk: chunk_size * n ~ this many values
+_CHUNK_ELEMENTS = 1 << 22
+
+# Resamples that cannot be fitted (e.g. fewer than two detects) are redrawn
+_MAX_REDRAWS = 20
+
+def _seed_sequence(random_state):
+    if isinstance(random_state, np.random.Generator):
+        return np.random.SeedSequence(random_state.integers(0, 2**63, size=4))
+    return np.random.SeedSequence(random_state)
+
+def _bootstrap_fit(fit, n, k, rng):
+    """
+    Fits k bootstrap resamples of n rows, redrawing those that fail.
+
+    Args:
+        fit (callable): Takes a (m, n) array of row indices and returns
+            (params, ok): a tuple of length-m parameter arrays and a boolean
+            mask of the resamples that could be fitted.
+
+    Returns:
+        list: One length-k array per parameter.
+    """
+    params = None
+    todo = np.arange(k)
+    for _ in range(_MAX_REDRAWS):
+        fitted, ok = fit(rng.integers(0, n, size=(len(todo), n)))
+        if params is None:
+            params = [np.full(k, np.nan) for _ in fitted]
+        for dst, src in zip(params, fitted):
+            dst[todo[ok]] = src[ok]
+        todo = todo[~ok]
+        if len(todo) == 0:
+            return params
+
+    raise ValueError("Could not fit bootstrap resamples of the data (too few uncensored observations?). "
+                     "Use bootstrap=False to draw from the fit to the full data.")
+
+def _limit_z(x, cens, plotting_position):
+    """
+    Z-score of the plotting position of each censored row (as in impute_ros_left).
+    """
+    from ._ros_left import _km_plotting_positions
+
+    n = len(x)
+    if plotting_position in ('kaplan-meier', 'ecdf', 'hirsch-stedinger'):
+        pp = _km_plotting_positions(x, cens)[cens] * (n / (n + 1))
+        pp[pp == 0] = 0.5 / (n + 1)
+        return ndtri(pp)
+
+    if plotting_position in ('simple', 'weibull'):
+        order = np.lexsort((~cens, x))
+        z = np.empty(n)
+        z[order] = ndtri(np.arange(1, n + 1) / (n + 1))
+        return z[cens]
+
+    raise ValueError(f"Unknown plotting_position '{plotting_position}'.")
+
+def _ros_sampler(values, is_censored, censoring_type, bootstrap, dist='lognormal',
+                 plotting_position='kaplan-meier', **kwargs):
+    from ._ros_left import _sample_limits, _sample_ranks
+    from ._ros_right import _mirror
+    from ._segmented import _ENGINES
+
+    observed = np.asarray(values, dtype=float)
+    cens = np.asarray(is_censored, dtype=bool)
+    x = observed
+    n = len(x)
+
+    if dist not in ('lognormal', 'normal'):
+        raise ValueError(f"Unknown distribution '{dist}'")
+    if dist == 'lognormal' and (x <= 0).any():
+        raise ValueError("Values must be positive for lognormal distribution.")
+    if (~cens).sum() < 2:
+        raise ValueError("Too few uncensored observations to fit regression.")
+    if plotting_position not in _ENGINES:
+        raise ValueError(f"Unknown plotting_position '{plotting_position}'.")
+
+    if censoring_type == 'right':
+        x = _mirror(x, dist)
+
+    engine = _ENGINES[plotting_position]
+    limits = x[cens]
+    z_limits = _limit_z(x, cens, plotting_position)
+
+    def fit(idx):
+        m = len(idx)
+        _, intercept, slope = engine(x[idx].ravel(), cens[idx].ravel(), np.repeat(np.arange(m), n), m,
+                                     np.full(m, n), dist)
+        return (intercept, slope), np.isfinite(intercept) & np.isfinite(slope) & (slope > 0)
+
+    (base_intercept,), (base_slope,) = fit(np.arange(n)[None, :])[0]
+    if not (np.isfinite(base_intercept) and np.isfinite(base_slope)):
+        raise ValueError("Regression on the uncensored values is degenerate (all detects tied?).")
+
+    def draw(k, rng):
+        if bootstrap:
+            intercept, slope = _bootstrap_fit(fit, n, k, rng)
+        else:
+            intercept, slope = np.full(k, base_intercept), np.full(k, base_slope)
+        u = rng.random((k, len(limits)))
+        if plotting_position in ('simple', 'weibull'):
+            imputed = _sample_ranks(limits, z_limits, n, intercept[:, None], slope[:, None], dist, u)
+        else:
+            imputed = _sample_limits(limits, z_limits, intercept[:, None], slope[:, None], dist, u)
+        result = np.repeat(observed[None, :], k, axis=0)
+        result[:, cens] = imputed if censoring_type == 'left' else _mirror(imputed, dist)
+        return result
+
+    return draw
+
+def _parametric_sampler(values, status, censoring_type, bootstrap, init=None, **kwargs):
+    from ._parametric import _fit_weibull, _sample_above, _sample_below
+    from ._weibull import fit_weibull_batched
+
+    x = np.asarray(values, dtype=float)
+    codes = np.asarray(status, dtype=int)
+    n = len(x)
+    left, right = codes == -1, codes == 1
+
+    shape, scale = _fit_weibull(x[codes == 0], left=x[left], right=x[right], init=init)
+
+    def fit(idx):
+        m = len(idx)
+        stops = np.arange(1, m + 1) * n
+        shapes, scales, info = fit_weibull_batched(x[idx].ravel(), codes[idx].ravel(), stops - n, stops,
+                                                   init=(shape, scale), return_info=True)
+        return (shapes, scales), info['converged']
+
+    def draw(k, rng):
+        if bootstrap:
+            shapes, scales = _bootstrap_fit(fit, n, k, rng)
+        else:
+            shapes, scales = np.full(k, shape), np.full(k, scale)
+        shapes, scales = shapes[:, None], scales[:, None]
+
+        result = np.repeat(x[None, :], k, axis=0)
+        if left.any():
+            result[:, left] = _sample_below(x[left], shapes, scales, rng.random((k, left.sum())))
+        if right.any():
+            result[:, right] = _sample_above(x[right], shapes, scales, rng.random((k, right.sum())))
+        return result
+
+    return draw
+
+def _interval_sampler(values, bootstrap, dist='lognormal', solver='em', backend='numpy', **kwargs):
+    from ._interval import _fit_interval_ros, _fit_interval_ros_batched, _predict_interval
+
+    left, right = (np.asarray(b, dtype=float) for b in split_bounds(values))
+    n = len(left)
+
+    base = _fit_interval_ros(left, right, dist=dist, solver=solver, backend=backend)
+
+    def fit_each(idx):
+        # One NPMLE per resample, with the requested solver and backend
+        params = np.full((len(idx), 2), np.nan)
+        for i, rows in enumerate(idx):
+            try:
+                params[i] = _fit_interval_ros(left[rows], right[rows], dist=dist, solver=solver, backend=backend)
+            except ValueError:
+                pass
+        return params.T
+
+    def fit(idx):
+        if solver == 'em' and backend == 'numpy':
+            # Resamples as bootstrap counts on the shared intervals: one
+            # batched NPMLE (plain EM, as turnbull_em) for all of them
+            m = len(idx)
+            counts = np.bincount((idx + n * np.arange(m)[:, None]).ravel(), minlength=m * n).reshape(m, n)
+            intercept, slope = _fit_interval_ros_batched(left, right, counts, dist=dist)
+        else:
+            intercept, slope = fit_each(idx)
+        return (intercept, slope), np.isfinite(intercept) & np.isfinite(slope) & (slope > 0)
+
+    def draw(k, rng):
+        if bootstrap:
+            intercept, slope = _bootstrap_fit(fit, n, k, rng)
+        else:
+            intercept, slope = np.full(k, base[0]), np.full(k, base[1])
+        return _predict_interval(left, right, intercept[:, None], slope[:, None], dist=dist,
+                                 u=rng.random((k, n)))
+
+    return draw
+
+def impute_multiple(values, status=None, method='ros', censoring_type='left', n_imputations=20,
+                    bootstrap=True, random_state=None, n_jobs=None, chunk_size=None, **kwargs):
+    """
+    Draws multiple stochastic imputations; see `ndimpute.impute_multiple`.
+
+    Returns:
+        np.ndarray: (n_imputations, n) array, one imputed dataset per row.
+    """
+    from ._parallel import resolve_n_jobs
+
+    if n_imputations < 1:
+        raise ValueError("n_imputations must be at least 1.")
+
+    if censoring_type == 'interval':
+        if method != 'ros':
+            raise NotImplementedError(f"Method '{method}' not implemented for interval censoring.")
+        draw = _interval_sampler(values, bootstrap, **kwargs)
+    else:
+        status, _ = coerce_status(status, censoring_type)
+        if method == 'ros' and censoring_type in ('left', 'right'):
+            draw = _ros_sampler(values, status, censoring_type, bootstrap, **kwargs)
+        elif method == 'parametric' and censoring_type in ('right', 'mixed'):
+            draw = _parametric_sampler(values, status, censoring_type, bootstrap, **kwargs)
+        else:
+            raise NotImplementedError(f"Multiple imputation is not implemented for method '{method}' "
+                                      f"with {censoring_type} censoring.")
+
+    n = len(values)
+    if chunk_size is None:
+        chunk_size = max(1, _CHUNK_ELEMENTS // max(n, 1))
+    bounds = list(range(0, n_imputations, chunk_size)) + [n_imputations]
+    seeds = _seed_sequence(random_state).spawn(len(bounds) - 1)
+
+    result = np.empty((n_imputations, n))
+
+    def run(i):
+        lo, hi = bounds[i], bounds[i + 1]
+        result[lo:hi] = draw(hi - lo, np.random.default_rng(seeds[i]))
+
+    n_workers = min(resolve_n_jobs(n_jobs), len(seeds))
+    if n_workers == 1:
+        for i in range(len(seeds)):
+            run(i)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(n_workers) as pool:
+            list(pool.map(run, range(len(seeds))))
+
+    return result
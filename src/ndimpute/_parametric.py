@@ -1,35 +1,49 @@
 import numpy as np
-from scipy.stats import weibull_min, CensoredData
 from scipy.special import gamma, gammaincc, gammainc
+from ._weibull import fit_weibull_censored
+from ._dispatch import prepare_output
+from ._profile import stage
 
-def impute_right_conditional(values, is_censored):
-    """
-    Imputes right-censored data using Conditional Mean Imputation (Vectorized).
-    """
-    data = np.array(values)
-    cens = np.array(is_censored, dtype=bool)
-
-    if not np.any(cens):
-        return data.copy()
-
-    # 1. Fit Weibull using scipy's CensoredData
-    uncensored_vals = data[~cens]
-    censored_vals = data[cens]
+# Below this F(L), E[T | T < L] and draws below L use the tail limit
+_MIN_F = 1e-15
 
-    cd = CensoredData(uncensored=uncensored_vals, right=censored_vals)
-    # weibull_min shape=k, scale=lambda
-    shape, loc, scale = weibull_min.fit(cd, floc=0)
+def _check_draw(draw):
+    if draw not in ('mean', 'random'):
+        raise ValueError(f"Unknown draw '{draw}'. Options: 'mean', 'random'.")
 
-    # 2. Vectorized Imputation
-    imputed = data.copy()
+def _fit_weibull(uncensored, left=None, right=None, init=None):
+    """
+    Fits a two-parameter Weibull (location fixed at 0) to censored data.
 
-    # Extract censored values C
-    C = data[cens]
+    Uses the dedicated Newton MLE, warm-started from `init` (shape, scale)
+    when given. Falls back to scipy's generic fit when Newton does not
+    converge (e.g. no exact observations, where the MLE may not exist).
 
+    Returns:
+        tuple: (shape, scale)
+    """
+    try:
+        shape, scale, info = fit_weibull_censored(uncensored, left=left, right=right, init=init,
+                                                  return_info=True)
+        if info['converged']:
+            return shape, scale
+    except ValueError:
+        pass
+
+    from scipy.stats import weibull_min, CensoredData
+
+    with stage('weibull_scipy_fit'):
+        cd = CensoredData(uncensored=uncensored, left=left, right=right)
+        # weibull_min shape=k, scale=lambda
+        shape, loc, scale = weibull_min.fit(cd, floc=0)
+    return shape, scale
+
+def _expected_above(C, shape, scale):
+    """
+    Weibull conditional mean E[T | T > C] (C where S(C) underflows).
+    """
     # E[T | T > C] = C + (Integral_C^inf S(t) dt) / S(C)
     # For Weibull: S(t) = exp(-(t/scale)^shape)
-
-    # Calculate terms
     u_c = (C / scale) ** shape
     mean_unconditional = scale * gamma(1 + 1.0/shape)
 
@@ -43,71 +57,128 @@ def impute_right_conditional(values, is_censored):
     valid_mask = S_C > 1e-15
 
     # E[T|T>C] = integral_upper / S_C
-    expected_val = C.copy()
+    expected_val = np.array(C, dtype=float)
     expected_val[valid_mask] = integral_upper[valid_mask] / S_C[valid_mask]
+    return expected_val
 
-    imputed[cens] = expected_val
+def _expected_below(L, shape, scale):
+    """
+    Weibull conditional mean E[T | T < L].
 
-    return imputed
+    Where F(L) is negligible (L far below the scale) the ratio below loses
+    all precision; there F(t) ~ (t / scale)^shape on (0, L), so T / L given
+    T < L is Beta(shape, 1) with mean shape / (shape + 1).
+    """
+    u_L = (L / scale) ** shape
+    F_L = 1.0 - np.exp(-u_L) # CDF
+    mean_unconditional = scale * gamma(1 + 1.0/shape)
+
+    # Integral of t*f(t) from 0 to L
+    # Use gammainc(1 + 1/k, u_L) for lower integral
+    # Note: gammainc vs gammaincc. 'inc' is lower regularized.
+    # Parameter 'a' must be 1 + 1/shape for the first moment.
+    integral_lower = mean_unconditional * gammainc(1.0 + 1.0/shape, u_L)
 
-def impute_mixed_parametric(values, status):
+    valid_mask = F_L > _MIN_F
+    vals = np.array(L, dtype=float)
+    vals[valid_mask] = integral_lower[valid_mask] / F_L[valid_mask]
+    tail = ~valid_mask
+    vals[tail] = L[tail] * np.broadcast_to(shape / (shape + 1.0), np.shape(L))[tail]
+    return vals
+
+def _sample_above(C, shape, scale, u):
     """
-    Imputes mixed-censored data (left and right) using Conditional Mean Imputation.
+    Inverse-CDF draws of T | T > C for a Weibull, given uniforms u.
+
+    (T / scale)^shape - (C / scale)^shape is a unit exponential given T > C.
     """
-    data = np.array(values)
-    status = np.array(status, dtype=int)
+    return scale * ((C / scale) ** shape - np.log1p(-u)) ** (1.0 / shape)
 
-    # Masks
-    mask_obs = (status == 0)
-    mask_left = (status == -1)
-    mask_right = (status == 1)
+def _sample_below(L, shape, scale, u):
+    """
+    Inverse-CDF draws of T | T < L for a Weibull, given uniforms u.
 
-    # Construct CensoredData
-    cd = CensoredData(
-        uncensored=data[mask_obs],
-        left=data[mask_left],
-        right=data[mask_right]
-    )
+    Where F(L) is negligible the draw is L * u^(1 / shape), the same
+    Beta(shape, 1) tail limit as in `_expected_below` (and never 0).
+    """
+    F_L = -np.expm1(-(L / scale) ** shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        draws = scale * (-np.log1p(-u * F_L)) ** (1.0 / shape)
+    return np.where(F_L > _MIN_F, draws, L * u ** (1.0 / shape))
 
-    shape, loc, scale = weibull_min.fit(cd, floc=0)
-    dist = weibull_min(shape, loc=loc, scale=scale)
+def impute_right_conditional(values, is_censored, init=None, out=None, draw='mean', random_state=None):
+    """
+    Imputes right-censored data using Conditional Mean Imputation (Vectorized).
 
-    imputed = data.copy()
-    mean_unconditional = scale * gamma(1 + 1.0/shape)
+    Args:
+        values (array): Observed values (censoring time C for censored).
+        is_censored (bool array): True if value is censored (>).
+        init (tuple, optional): Starting (shape, scale) for the Weibull fit.
+        out (array, optional): Float array to write into (may be `values`).
+        draw (str): 'mean' (default) imputes E[T | T > C]; 'random' draws
+            T | T > C from the fitted Weibull instead.
+        random_state (int or np.random.Generator, optional): Seed for draw='random'.
+    """
+    _check_draw(draw)
+    data = np.asarray(values)
+    cens = np.asarray(is_censored, dtype=bool)
 
-    # Impute Left Censored: E[T | T < L]
-    if np.any(mask_left):
-        L = data[mask_left]
-        u_L = (L / scale) ** shape
-        F_L = 1.0 - np.exp(-u_L) # CDF
+    if not np.any(cens):
+        return prepare_output(data, out)
 
-        # Integral of t*f(t) from 0 to L
-        # Use gammainc(1 + 1/k, u_L) for lower integral
-        # Note: gammainc vs gammaincc. 'inc' is lower regularized.
-        # Parameter 'a' must be 1 + 1/shape for the first moment.
-        integral_lower = mean_unconditional * gammainc(1.0 + 1.0/shape, u_L)
+    # 1. Fit Weibull by censored maximum likelihood
+    shape, scale = _fit_weibull(data[~cens], right=data[cens], init=init)
 
-        valid_mask = F_L > 1e-15
-        vals = L.copy()
-        vals[valid_mask] = integral_lower[valid_mask] / F_L[valid_mask]
-        vals[~valid_mask] = L[~valid_mask] / 2.0 # Fallback for very small L
+    # 2. Vectorized Imputation
+    if draw == 'random':
+        u = np.random.default_rng(random_state).random(int(cens.sum()))
+        expected = _sample_above(data[cens], shape, scale, u)
+    else:
+        expected = _expected_above(data[cens], shape, scale)
+    imputed = prepare_output(data, out)
+    imputed[cens] = expected
 
-        imputed[mask_left] = vals
+    return imputed
+
+def impute_mixed_parametric(values, status, init=None, out=None, draw='mean', random_state=None):
+    """
+    Imputes mixed-censored data (left and right) using Conditional Mean Imputation.
+
+    Args:
+        values (array): Data values (limits for censored).
+        status (array): Status codes (-1: Left, 0: Obs, 1: Right).
+        init (tuple, optional): Starting (shape, scale) for the Weibull fit.
+        out (array, optional): Float array to write into (may be `values`).
+        draw (str): 'mean' (default) imputes conditional means; 'random'
+            draws from the fitted Weibull below / above each limit instead.
+        random_state (int or np.random.Generator, optional): Seed for draw='random'.
+    """
+    _check_draw(draw)
+    data = np.asarray(values)
+    status = np.asarray(status, dtype=int)
+
+    # Masks
+    mask_obs = (status == 0)
+    mask_left = (status == -1)
+    mask_right = (status == 1)
 
-    # Impute Right Censored: E[T | T > R]
-    if np.any(mask_right):
-        R = data[mask_right]
-        u_R = (R / scale) ** shape
-        S_R = np.exp(-u_R)
+    shape, scale = _fit_weibull(data[mask_obs], left=data[mask_left], right=data[mask_right], init=init)
 
-        # Integral of t*f(t) from R to inf
-        # Use gammaincc(1 + 1/k, u_R) for upper integral
-        integral_upper = mean_unconditional * gammaincc(1.0 + 1.0/shape, u_R)
+    if draw == 'random':
+        rng = np.random.default_rng(random_state)
+        left_vals = _sample_below(data[mask_left], shape, scale, rng.random(int(mask_left.sum())))
+        right_vals = _sample_above(data[mask_right], shape, scale, rng.random(int(mask_right.sum())))
+    else:
+        # Impute Left Censored: E[T | T < L]
+        left_vals = _expected_below(data[mask_left], shape, scale) if np.any(mask_left) else None
 
-        valid_mask = S_R > 1e-15
-        vals = R.copy()
-        vals[valid_mask] = integral_upper[valid_mask] / S_R[valid_mask]
+        # Impute Right Censored: E[T | T > R]
+        right_vals = _expected_above(data[mask_right], shape, scale) if np.any(mask_right) else None
 
-        imputed[mask_right] = vals
+    imputed = prepare_output(data, out)
+    if left_vals is not None:
+        imputed[mask_left] = left_vals
+    if right_vals is not None:
+        imputed[mask_right] = right_vals
 
     return imputed
@@ -0,0 +1,213 @@
+import numpy as np
+from ._dispatch import coerce_status
+
+# Parquet front end. pyarrow is an optional dependency (ndimpute[parquet]);
+# it is imported when a Parquet function is called, never at package import.
+
+_QUALIFIERS = ("'<'", "'>'", "''")
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.dataset  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as err:
+        raise ImportError("Parquet support requires pyarrow. Install it with: pip install 'ndimpute[parquet]'") from err
+
+def decode_qualifier(qualifier, censoring_type=None):
+    """
+    Decodes a qualifier column into the status encoding used by `impute`.
+
+    Args:
+        qualifier (array-like): '<' (left-censored, value is a limit), '>'
+            (right-censored) or '' / None (observed) per row.
+        censoring_type (str, optional): 'left', 'right' or 'mixed'. Inferred
+            from the qualifiers present when None ('mixed' if both appear).
+
+    Returns:
+        tuple: (status, censoring_type). Status is boolean for 'left' and
+            'right' and integer codes (-1, 0, 1) for 'mixed'.
+    """
+    q = np.asarray(qualifier, dtype=object)
+    is_left = q == '<'
+    is_right = q == '>'
+    blank = (q == '') | np.equal(q, None)
+
+    unknown = ~(is_left | is_right | blank)
+    if unknown.any():
+        found = sorted({str(v) for v in q[unknown][:10]})
+        raise ValueError(f"Unknown qualifier(s) {found}; expected {', '.join(_QUALIFIERS)} or null.")
+
+    if censoring_type is None:
+        if is_left.any() and is_right.any():
+            censoring_type = 'mixed'
+        else:
+            censoring_type = 'right' if is_right.any() else 'left'
+
+    if censoring_type == 'left':
+        if is_right.any():
+            raise ValueError("Found '>' qualifiers but censoring_type='left'.")
+        return is_left, censoring_type
+    if censoring_type == 'right':
+        if is_left.any():
+            raise ValueError("Found '<' qualifiers but censoring_type='right'.")
+        return is_right, censoring_type
+    if censoring_type == 'mixed':
+        status, _ = coerce_status(is_right.astype(int) - is_left.astype(int), 'mixed')
+        return status, censoring_type
+
+    raise ValueError("censoring_type must be 'left', 'right' or 'mixed' for qualifier columns.")
+
+def _dataset(source, filters):
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    dataset = ds.dataset(source, format='parquet')
+    if filters is not None and not isinstance(filters, ds.Expression):
+        # DNF list of (column, op, value) tuples, as in pyarrow.parquet.read_table
+        filters = pq.filters_to_expression(filters)
+    return dataset, filters
+
+def _to_numpy(column, dtype=None):
+    # Table columns are ChunkedArrays, whose to_numpy() only takes
+    # zero_copy_only from pyarrow 13; join the chunks into one Array first
+    if hasattr(column, 'combine_chunks'):
+        column = column.combine_chunks()
+    # Zero-copy for primitive columns without nulls; converts otherwise
+    array = column.to_numpy(zero_copy_only=False)
+    return array if dtype is None else np.asarray(array, dtype=dtype)
+
+def _read_columns(value_col, qualifier_col, interval_cols, columns):
+    needed = list(interval_cols) if interval_cols is not None else [value_col, qualifier_col]
+    extra = [c for c in (columns or []) if c not in needed]
+    return extra + needed
+
+def _infer_censoring_type(dataset, qualifier_col, filters, batch_size):
+    seen = set()
+    for batch in dataset.to_batches(columns=[qualifier_col], filter=filters, batch_size=batch_size):
+        seen.update(np.unique(_to_numpy(batch.column(qualifier_col), dtype=object).astype(str)))
+    has_left, has_right = '<' in seen, '>' in seen
+    if has_left and has_right:
+        return 'mixed'
+    return 'right' if has_right else 'left'
+
+def read_parquet_censored(source, value_col='value', qualifier_col='qualifier', interval_cols=None,
+                          censoring_type=None, filters=None):
+    """
+    Reads censored data from Parquet into the arrays `impute` expects.
+
+    Only the value/qualifier (or interval bound) columns are read, and
+    `filters` are pushed down to skip row groups and rows.
+
+    Args:
+        source (str or list): Parquet file, directory or list of files.
+        value_col (str): Column of values (limits for censored rows).
+        qualifier_col (str): Column of '<', '>' or '' qualifiers.
+        interval_cols (tuple, optional): (left, right) bound columns. When
+            given, the data is read as interval-censored.
+        censoring_type (str, optional): Forced type; inferred when None.
+        filters (optional): pyarrow.dataset Expression, or DNF list of
+            (column, op, value) tuples as in pyarrow.parquet.read_table.
+
+    Returns:
+        tuple: (values, status, censoring_type). For intervals, values is the
+            (N, 2) bounds array and status is None.
+    """
+    _require_pyarrow()
+    dataset, filters = _dataset(source, filters)
+    table = dataset.to_table(columns=_read_columns(value_col, qualifier_col, interval_cols, None), filter=filters)
+
+    if interval_cols is not None:
+        left_col, right_col = interval_cols
+        bounds = np.column_stack((_to_numpy(table.column(left_col), dtype=float),
+                                  _to_numpy(table.column(right_col), dtype=float)))
+        return bounds, None, 'interval'
+
+    values = _to_numpy(table.column(value_col))
+    status, censoring_type = decode_qualifier(_to_numpy(table.column(qualifier_col)), censoring_type)
+    return values, status, censoring_type
+
+def impute_parquet(source, dest, value_col='value', qualifier_col='qualifier', interval_cols=None,
+                   method='ros', censoring_type=None, columns=None, filters=None, output_col='imputed_value',
+                   batch_size=1 << 20, **kwargs):
+    """
+    Imputes a Parquet dataset batch by batch and writes the result to Parquet.
+
+    Left/right/mixed data is imputed with the two-pass streaming engine
+    (see `impute_stream`), so memory is bounded by `batch_size`. Interval
+    data is read whole (only its two bound columns), as the Turnbull
+    estimator needs all intervals at once.
+
+    Args:
+        source (str or list): Parquet file, directory or list of files.
+        dest (str): Output Parquet file.
+        value_col, qualifier_col, interval_cols: As in `read_parquet_censored`.
+        method (str): Imputation method.
+        censoring_type (str, optional): Forced type; inferred from the
+            qualifier column when None.
+        columns (list, optional): Extra columns to carry through to the
+            output (e.g. identifiers). Only these and the value columns are read.
+        filters (optional): Row filter pushed down to the scan (see
+            `read_parquet_censored`).
+        output_col (str): Name of the imputed column appended to the output.
+        batch_size (int): Maximum rows per batch.
+        **kwargs: Method options, as for `impute_stream` / `impute`.
+
+    Returns:
+        int: Number of rows written.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from .api import impute_array, impute_stream
+
+    dataset, filters = _dataset(source, filters)
+    read_cols = _read_columns(value_col, qualifier_col, interval_cols, columns)
+
+    def with_output(batch, imputed):
+        return pa.Table.from_arrays(list(batch.columns) + [pa.array(imputed, type=pa.float64())],
+                                    names=list(batch.schema.names) + [output_col])
+
+    if interval_cols is not None:
+        table = dataset.to_table(columns=read_cols, filter=filters)
+        left_col, right_col = interval_cols
+        bounds = np.column_stack((_to_numpy(table.column(left_col), dtype=float),
+                                  _to_numpy(table.column(right_col), dtype=float)))
+        out = with_output(table, impute_array(bounds, method=method, censoring_type='interval', **kwargs))
+        pq.write_table(out, dest)
+        return out.num_rows
+
+    if censoring_type is None:
+        censoring_type = _infer_censoring_type(dataset, qualifier_col, filters, batch_size)
+
+    # The chunk source remembers the batch it last produced. The streaming
+    # generator imputes each chunk before requesting the next, so on the
+    # second pass current[0] is the batch the latest result belongs to.
+    current = [None]
+
+    def chunks():
+        for batch in dataset.to_batches(columns=read_cols, filter=filters, batch_size=batch_size):
+            current[0] = batch
+            status, _ = decode_qualifier(_to_numpy(batch.column(qualifier_col)), censoring_type)
+            yield _to_numpy(batch.column(value_col)), status
+
+    writer = None
+    n_rows = 0
+    try:
+        for imputed in impute_stream(chunks, method=method, censoring_type=censoring_type, **kwargs):
+            out = with_output(current[0], imputed)
+            if writer is None:
+                writer = pq.ParquetWriter(dest, out.schema)
+            writer.write_table(out)
+            n_rows += out.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        # No rows matched: still write a file with the output schema
+        schema = dataset.schema
+        fields = [schema.field(name) for name in read_cols] + [pa.field(output_col, pa.float64())]
+        pq.write_table(pa.schema(fields).empty_table(), dest)
+
+    return n_rows
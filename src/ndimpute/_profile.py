@@ -0,0 +1,218 @@
+import contextlib
+import json
+import threading
+import time
+
+# Opt-in instrumentation. Library code wraps its stages in `stage(name)` and
+# reports iterative fits with `record_fit`; both are no-ops unless a
+# `profile()` block is active, so the cost when profiling is off is one
+# global lookup per stage.
+#
+# Records from every thread go to the active profile (grouped runs on a
+# thread pool are aggregated); work done in worker processes is not seen.
+
+_ACTIVE = None
+_NULL = contextlib.nullcontext()
+
+class Profile:
+    """
+    Per-stage timings and fit diagnostics collected by `profile()`.
+
+    Stage times are wall times and include nested stages (e.g.
+    'turnbull_em' inside 'npmle'). Stages run once per group in grouped
+    runs are aggregated under the same name.
+
+    Attributes:
+        stages (dict): Stage name -> {'count', 'total_s', 'max_s'}, plus
+            'peak_mb' (largest peak traced allocation above the memory in use
+            at stage entry) when memory tracking is on.
+        fits (dict): Iterative fit ('turnbull_em', 'weibull') ->
+            {'count', 'iterations', 'max_iterations', 'not_converged'}.
+            A batched Weibull fit counts once per group.
+        events (list): With trace=True, one dict per stage run or fit, in
+            completion order.
+    """
+
+    def __init__(self, memory=False, trace=False):
+        self.memory = memory
+        self.trace = trace
+        self.stages = {}
+        self.fits = {}
+        self.events = []
+        self.wall_s = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _add_stage(self, name, elapsed, peak_mb):
+        with self._lock:
+            entry = self.stages.get(name)
+            if entry is None:
+                entry = self.stages[name] = {'count': 0, 'total_s': 0.0, 'max_s': 0.0}
+                if self.memory:
+                    entry['peak_mb'] = 0.0
+            entry['count'] += 1
+            entry['total_s'] += elapsed
+            entry['max_s'] = max(entry['max_s'], elapsed)
+            if peak_mb is not None:
+                entry['peak_mb'] = max(entry['peak_mb'], peak_mb)
+            if self.trace:
+                event = {'stage': name, 'time_s': elapsed}
+                if peak_mb is not None:
+                    event['peak_mb'] = peak_mb
+                self.events.append(event)
+
+    def _add_fit(self, name, n_iter, converged):
+        with self._lock:
+            entry = self.fits.setdefault(name, {'count': 0, 'iterations': 0, 'max_iterations': 0,
+                                                'not_converged': 0})
+            entry['count'] += len(n_iter)
+            entry['iterations'] += int(sum(n_iter))
+            entry['max_iterations'] = max(entry['max_iterations'], int(max(n_iter, default=0)))
+            entry['not_converged'] += sum(not c for c in converged)
+            if self.trace:
+                self.events.append({'fit': name, 'n_iter': [int(i) for i in n_iter],
+                                    'converged': [bool(c) for c in converged]})
+
+    def to_dict(self):
+        """
+        Returns the profile as plain Python types (JSON-serializable).
+        """
+        out = {'wall_s': self.wall_s,
+               'stages': {name: dict(entry) for name, entry in self.stages.items()},
+               'fits': {name: dict(entry) for name, entry in self.fits.items()}}
+        if self.trace:
+            out['events'] = list(self.events)
+        return out
+
+    def to_json(self, path=None, **kwargs):
+        """
+        Serializes `to_dict()` to JSON, written to `path` when given.
+
+        Returns:
+            str: The JSON text.
+        """
+        text = json.dumps(self.to_dict(), **kwargs)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+    def summary(self):
+        """
+        Returns a table of stages sorted by total time, for printing.
+        """
+        lines = [f"{'stage':24s} {'count':>8s} {'total ms':>12s} {'max ms':>10s}"]
+        for name, entry in sorted(self.stages.items(), key=lambda item: -item[1]['total_s']):
+            lines.append(f"{name:24s} {entry['count']:8d} {entry['total_s'] * 1e3:12.2f} {entry['max_s'] * 1e3:10.2f}")
+        for name, entry in self.fits.items():
+            lines.append(f"{name}: {entry['count']} fit(s), {entry['iterations']} iterations "
+                         f"(max {entry['max_iterations']}), {entry['not_converged']} not converged")
+        return "\n".join(lines)
+
+class _Stage:
+    __slots__ = ('profile', 'name', 'start', 'mem_start', 'peak_before', 'inner_peak')
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        if self.profile.memory:
+            import tracemalloc
+            self.mem_start, self.peak_before = tracemalloc.get_traced_memory()
+            self.inner_peak = 0
+            tracemalloc.reset_peak()
+            self.profile._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        peak_mb = None
+        if self.profile.memory:
+            import tracemalloc
+            _, peak = tracemalloc.get_traced_memory()
+            # Nested stages reset the peak: fold theirs back in
+            peak = max(peak, self.inner_peak)
+            stack = self.profile._stack()
+            stack.pop()
+            if stack:
+                parent = stack[-1]
+                parent.inner_peak = max(parent.inner_peak, peak, self.peak_before)
+            peak_mb = max(peak - self.mem_start, 0) / 2 ** 20
+        self.profile._add_stage(self.name, elapsed, peak_mb)
+        return False
+
+def stage(name):
+    """
+    Context manager timing one stage of the active profile (no-op if none).
+    """
+    active = _ACTIVE
+    if active is None:
+        return _NULL
+    return _Stage(active, name)
+
+def record_fit(name, n_iter, converged):
+    """
+    Records the iterations and convergence of one fit, or of a batch of fits
+    (array arguments), in the active profile (no-op if none).
+    """
+    active = _ACTIVE
+    if active is None:
+        return
+    if hasattr(n_iter, '__len__'):
+        active._add_fit(name, list(n_iter), list(converged))
+    else:
+        active._add_fit(name, [n_iter], [converged])
+
+@contextlib.contextmanager
+def profile(memory=False, trace=False):
+    """
+    Records per-stage timings and fit diagnostics of imputations in a block.
+
+    Every call to the package inside the block is recorded (from any thread;
+    not inside worker processes), and calls repeating a stage, such as the
+    groups of `impute_grouped`, are aggregated.
+
+    Args:
+        memory (bool): Also track the peak memory allocated in each stage
+            (tracemalloc, which sees NumPy buffers). Slows the code down
+            noticeably; peaks are only meaningful without concurrent threads.
+        trace (bool): Also keep one event per stage run and fit.
+
+    Yields:
+        Profile: Filled in as the block runs; see `Profile.to_dict()`.
+
+    Example:
+        with ndimpute.profile() as prof:
+            ndimpute.impute(values, status)
+        print(prof.summary())
+        prof.to_json('profile.json')
+    """
+    global _ACTIVE
+    if _ACTIVE is not None:
+        raise RuntimeError("A profile is already active; profiles cannot be nested.")
+
+    prof = Profile(memory=memory, trace=trace)
+    started_tracing = False
+    if memory:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+
+    _ACTIVE = prof
+    start = time.perf_counter()
+    try:
+        yield prof
+    finally:
+        prof.wall_s = time.perf_counter() - start
+        _ACTIVE = None
+        if started_tracing:
+            tracemalloc.stop()
@@ -1,8 +1,171 @@
 import numpy as np
-import pandas as pd
-from scipy.stats import norm, linregress, ecdf, CensoredData
+from scipy.stats import linregress
+from scipy.special import ndtr, ndtri
+from ._dispatch import prepare_output
+from ._profile import stage
 
-def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='kaplan-meier'):
+# Same constant scipy.stats.norm uses, so the density is bit-for-bit identical
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+# Imputation modes: conditional mean, or a random draw from the same model
+_DRAWS = ('mean', 'random')
+
+def _left_km_survival(n_detect, n_limit):
+    """
+    Hirsch-Stedinger / Kaplan-Meier plotting positions for left-censored data.
+
+    Works on counts over a sorted support of unique values: the number of
+    detects and of detection limits at each support point. The estimate at
+    x is the product over detects u >= x of (r_u - d_u) / r_u, where r_u is
+    the number of values <= u (the left-censored analogue of "at risk").
+
+    This is the Kaplan-Meier survival of the negated data, computed in the
+    same order as scipy.stats.ecdf, so the positions are identical.
+
+    Args:
+        n_detect (int array): Detects at each support point.
+        n_limit (int array): Censored values (limits) at each support point.
+
+    Returns:
+        array: Plotting position at each support point.
+    """
+    at_risk = np.cumsum(n_detect + n_limit)
+    factors = (at_risk - n_detect) / at_risk
+    return np.cumprod(factors[::-1])[::-1]
+
+def _km_plotting_positions(values, is_censored):
+    """
+    Hirsch-Stedinger plotting position of every observation.
+
+    Sorts once (np.unique), counts detects and limits per unique value and
+    maps the positions back with the inverse index.
+    """
+    support, inverse = np.unique(values, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n_support = len(support)
+
+    n_detect = np.bincount(inverse[~is_censored], minlength=n_support)
+    n_limit = np.bincount(inverse[is_censored], minlength=n_support)
+
+    return _left_km_survival(n_detect, n_limit)[inverse]
+
+def _fit_ros_counts(support, n_detect, n_limit, dist):
+    """
+    Kaplan-Meier ROS regression from per-value counts.
+
+    Equivalent to the 'kaplan-meier' branch of `impute_ros_left`, with each
+    support point standing for all rows at that value (the regression is
+    weighted by the detect counts).
+
+    Args:
+        support (array): Sorted unique values.
+        n_detect, n_limit (int arrays): Detects and limits at each value.
+        dist (str): 'lognormal' or 'normal'.
+
+    Returns:
+        tuple: (intercept, slope, positions) where positions are the scaled
+            plotting positions pp * n / (n + 1) at each support point.
+    """
+    n = int(n_detect.sum() + n_limit.sum())
+
+    if n_detect.sum() < 2:
+        raise ValueError("Too few uncensored observations to fit regression.")
+
+    if dist == 'lognormal':
+        if support.size and support[0] <= 0:
+            raise ValueError("Values must be positive for lognormal distribution.")
+    elif dist != 'normal':
+        raise ValueError(f"Unknown distribution '{dist}'")
+
+    positions = _left_km_survival(n_detect, n_limit) * (n / (n + 1))
+
+    det = n_detect > 0
+    pp_unc = positions[det]
+    pp_unc[pp_unc == 0] = 0.5 / (n + 1)
+    pp_unc[pp_unc == 1] = 1.0 - (0.5 / (n + 1))
+
+    z_unc = ndtri(pp_unc)
+    y_unc = np.log(support[det]) if dist == 'lognormal' else support[det]
+    w = n_detect[det].astype(float)
+
+    z_mean = np.average(z_unc, weights=w)
+    y_mean = np.average(y_unc, weights=w)
+    slope = np.sum(w * (z_unc - z_mean) * (y_unc - y_mean)) / np.sum(w * (z_unc - z_mean)**2)
+    intercept = y_mean - slope * z_mean
+
+    return intercept, slope, positions
+
+def _impute_limits(limits, positions, intercept, slope, dist, n):
+    """
+    Imputes limits from their scaled plotting positions (see `_fit_ros_counts`).
+
+    intercept, slope and n may be scalars or one value per limit.
+    """
+    pp_limits = np.array(positions, dtype=float)
+    floor = np.broadcast_to(0.5 / (np.asarray(n) + 1), pp_limits.shape)
+    zero = pp_limits == 0
+    pp_limits[zero] = floor[zero]
+
+    z_limits = ndtri(pp_limits)
+    z_imputed = -(np.exp(-z_limits**2 / 2.0) / _SQRT_2PI) / ndtr(z_limits)
+    predicted = intercept + slope * z_imputed
+
+    if dist == 'lognormal':
+        predicted = np.exp(predicted)
+
+    # Guardrail
+    return np.minimum(predicted, limits)
+
+def _sample_limits(limits, z_limits, intercept, slope, dist, u):
+    """
+    Random counterpart of the conditional mean imputation of limits.
+
+    Draws from the fitted distribution truncated above at each limit's
+    plotting position (Z-score `z_limits`), and never above the limit
+    itself. Parameters broadcast with the limits (e.g. (B, 1) arrays give
+    B draws per limit).
+
+    Args:
+        u (array): Uniform(0, 1) variates, one per draw.
+    """
+    from ._interval import _sample_truncnorm
+
+    y_limits = np.log(limits) if dist == 'lognormal' else limits
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z_cap = np.where(slope > 0, (y_limits - intercept) / slope, np.inf)
+    z = _sample_truncnorm(-np.inf, np.minimum(z_limits, z_cap), u)
+
+    predicted = intercept + slope * z
+    if dist == 'lognormal':
+        predicted = np.exp(predicted)
+    return np.minimum(predicted, limits)
+
+def _sample_ranks(limits, z_ranks, n, intercept, slope, dist, u):
+    """
+    Random counterpart of the simple (rank) plotting-position imputation.
+
+    Mean imputation predicts each limit at its rank's Z-score; here each
+    draw is predicted at a plotting position uniform on the rank's cell
+    (i +/- 0.5) / (n + 1), so draws centre on the mean imputation and the
+    n cells together cover the distribution. Capped at the limit as in
+    mean mode. Parameters broadcast as in `_sample_limits`.
+    """
+    pp = ndtr(z_ranks) + (u - 0.5) / (n + 1)
+    predicted = intercept + slope * ndtri(pp)
+    if dist == 'lognormal':
+        predicted = np.exp(predicted)
+    return np.minimum(predicted, limits)
+
+def _draw_result(values, out, cens_idx, sample, random_state):
+    limits = values[cens_idx]
+    u = np.random.default_rng(random_state).random(len(cens_idx))
+
+    result = prepare_output(values, out)
+    result[cens_idx] = sample(limits, u)
+    return result
+
+def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='kaplan-meier', out=None,
+                    draw='mean', random_state=None):
     """
     Imputes left-censored data using Robust ROS.
 
@@ -11,13 +174,23 @@ def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='ka
         is_censored (bool array): True if value is censored (<).
         dist (str): Distribution assumption ('lognormal' or 'normal').
         plotting_position (str): Method for calculating plotting positions.
-            - 'kaplan-meier' (default): Uses Hirsch-Stedinger logic via scipy.stats.ecdf.
-              Best for multiple detection limits.
+            - 'kaplan-meier' (default): Uses Hirsch-Stedinger logic (Kaplan-Meier
+              on the flipped data, matching scipy.stats.ecdf). Best for multiple
+              detection limits.
             - 'simple' or 'weibull': Uses simple ranking (rank/(n+1)).
               Matches simple NADA approximations for single limits.
+        out (array, optional): Float array to write into (may be `values`).
+        draw (str): 'mean' (default) imputes as described above; 'random'
+            draws each value from the fitted distribution below the limit's
+            plotting position ('kaplan-meier'), or around its rank's
+            prediction ('simple'), so imputed values keep their spread.
+        random_state (int or np.random.Generator, optional): Seed for draw='random'.
     """
-    values = np.array(values)
-    is_censored = np.array(is_censored, dtype=bool)
+    if draw not in _DRAWS:
+        raise ValueError(f"Unknown draw '{draw}'. Options: 'mean', 'random'.")
+
+    values = np.asarray(values)
+    is_censored = np.asarray(is_censored, dtype=bool)
     n = len(values)
 
     # Common Setup: Log Transform if needed for regression Y
@@ -38,107 +211,87 @@ def impute_ros_left(values, is_censored, dist='lognormal', plotting_position='ka
 
     # --- Branch 1: Kaplan-Meier (Hirsch-Stedinger) ---
     if plotting_position in ['kaplan-meier', 'ecdf', 'hirsch-stedinger']:
-        neg_values = -values
-        unc_data = neg_values[~is_censored]
-        cens_data = neg_values[is_censored]
-
-        cd = CensoredData(uncensored=unc_data, right=cens_data)
-        res = ecdf(cd)
+        with stage('plotting_positions'):
+            pp_all = _km_plotting_positions(values, is_censored)
 
         # PPs for Uncensored
-        pp_unc = res.sf.evaluate(-y_unc)
+        pp_unc = pp_all[unc_mask]
 
         # Scaling
         pp_unc = pp_unc * (n / (n + 1))
         pp_unc[pp_unc == 0] = 0.5 / (n + 1)
         pp_unc[pp_unc == 1] = 1.0 - (0.5 / (n + 1))
 
-        z_unc = norm.ppf(pp_unc)
+        # ndtri/ndtr are what norm.ppf/norm.cdf evaluate, without the
+        # rv_continuous dispatch overhead (matters for small, repeated calls).
+        z_unc = ndtri(pp_unc)
 
         # Fit
-        slope, intercept, _, _, _ = linregress(z_unc, y_reg)
+        with stage('regression'):
+            slope, intercept, _, _, _ = linregress(z_unc, y_reg)
 
         # Impute
-        y_cens = values[is_censored]
-        pp_limits = res.sf.evaluate(-y_cens)
+        pp_limits = pp_all[is_censored]
         pp_limits = pp_limits * (n / (n + 1))
         pp_limits[pp_limits == 0] = 0.5 / (n + 1)
 
-        z_limits = norm.ppf(pp_limits)
+        z_limits = ndtri(pp_limits)
+        cens_idx = np.flatnonzero(is_censored)
+        if draw == 'random':
+            return _draw_result(values, out, cens_idx,
+                                lambda limits, u: _sample_limits(limits, z_limits, intercept, slope, dist, u),
+                                random_state)
 
-        numerator = norm.pdf(z_limits)
-        denominator = norm.cdf(z_limits)
+        numerator = np.exp(-z_limits**2 / 2.0) / _SQRT_2PI
+        denominator = ndtr(z_limits)
         z_imputed = -numerator / denominator
 
         predicted = intercept + slope * z_imputed
 
     # --- Branch 2: Simple Ranking (Weibull) ---
     elif plotting_position in ['simple', 'weibull']:
-        # Sort data to assign ranks
-        df = pd.DataFrame({'val': values, 'cens': is_censored})
-        df = df.sort_values('val')
-
-        df['rank'] = np.arange(1, n + 1)
-        df['pp'] = df['rank'] / (n + 1)
-        df['z'] = norm.ppf(df['pp'])
+        # Sort data to assign ranks. A value below a limit ranks below a
+        # detect equal to that limit; other ties keep their input order.
+        with stage('plotting_positions'):
+            order = np.lexsort((~is_censored, values))
+            sorted_vals = values[order]
+            sorted_cens = is_censored[order]
 
-        # Fit on Uncensored
-        # We need to extract the Z-scores corresponding to the uncensored data *after* sorting
-        # y_reg computed above matches the order of y_unc (values[unc_mask]).
-        # But df is sorted. We must match them.
+            pp = np.arange(1, n + 1) / (n + 1)
+            z = ndtri(pp)
 
-        # Let's re-extract y_reg from the sorted dataframe to ensure alignment
-        y_reg_sorted = df.loc[~df['cens'], 'val']
+        # Fit on Uncensored, in sorted order so Z-scores and values align
+        y_reg_sorted = sorted_vals[~sorted_cens]
         if dist == 'lognormal':
             y_reg_sorted = np.log(y_reg_sorted)
 
-        x_obs = df.loc[~df['cens'], 'z']
+        x_obs = z[~sorted_cens]
 
-        slope, intercept, _, _, _ = linregress(x_obs, y_reg_sorted)
+        with stage('regression'):
+            slope, intercept, _, _, _ = linregress(x_obs, y_reg_sorted)
 
-        # Impute
-        z_cens = df.loc[df['cens'], 'z']
-        predicted_sorted = intercept + slope * z_cens
+        # Original positions of the sorted censored rows
+        cens_idx = order[sorted_cens]
+        if draw == 'random':
+            return _draw_result(values, out, cens_idx,
+                                lambda limits, u: _sample_ranks(limits, z[sorted_cens], n, intercept, slope, dist, u),
+                                random_state)
 
-        # We need to put these back into the original order.
-        # The 'predicted' array here corresponds to the sorted censored rows.
-        # We can assign them into the sorted dataframe, then resort by index.
-        predicted = predicted_sorted # Placeholder name for logic below
+        # Impute (Simple method predicts directly based on Z of that point)
+        predicted = intercept + slope * z[sorted_cens]
 
     else:
         raise ValueError(f"Unknown plotting_position '{plotting_position}'.")
 
     # --- Common Finalization ---
-    if plotting_position in ['simple', 'weibull']:
-        # Simple method predicts directly based on Z of that point
-        if dist == 'lognormal':
-            imputed_vals = np.exp(predicted)
-        else:
-            imputed_vals = predicted
-
-        # Assign back to sorted df
-        # Note: 'predicted' is a Series with index matching df[cens]
-        df.loc[df['cens'], 'imputed'] = imputed_vals
-
-        # Guardrail
-        limit_vals = df.loc[df['cens'], 'val']
-        df.loc[df['cens'], 'imputed'] = np.minimum(df.loc[df['cens'], 'imputed'], limit_vals)
-
-        # Restore order
-        result = df.sort_index()['val'].copy()
-        result[is_censored] = df.sort_index().loc[is_censored, 'imputed']
-        return result.values
-
+    if dist == 'lognormal':
+        imputed_vals = np.exp(predicted)
     else:
-        # Kaplan-Meier path (already computed 'predicted')
-        if dist == 'lognormal':
-            imputed_vals = np.exp(predicted)
-        else:
-            imputed_vals = predicted
+        imputed_vals = predicted
 
-        y_cens = values[is_censored]
-        imputed_vals = np.minimum(imputed_vals, y_cens)
+    # Guardrail
+    imputed_vals = np.minimum(imputed_vals, values[cens_idx])
 
-        result = values.copy()
-        result[is_censored] = imputed_vals
-        return result
+    result = prepare_output(values, out)
+    result[cens_idx] = imputed_vals
+    return result
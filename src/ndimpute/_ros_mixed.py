@@ -1,8 +1,182 @@
 import numpy as np
-from ._ros_left import impute_ros_left
+from scipy.stats import linregress
+from scipy.special import ndtr, ndtri
+from ._ros_left import _SQRT_2PI, _DRAWS, _sample_limits, impute_ros_left
 from ._ros_right import impute_ros_right
+from ._profile import stage
+from ._turnbull import turnbull_em
 
-def impute_ros_mixed_heuristic(values, status):
+# The joint fit needs accurate plotting positions, so the NPMLE is iterated
+# well past the default Turnbull tolerance. Its size is the number of
+# distinct limits plus detect runs, so this is cheap when there are few
+# limits; with many, plain EM needs thousands of iterations, and stops a
+# little earlier than SQUAREM (imputations agree to about 1e-6).
+_NPMLE_TOL = {'em': 1e-9, 'squarem': 1e-10}
+_NPMLE_MAX_ITER = 10_000
+
+def _npmle_cdf(values, status, lower, solver, backend='numpy'):
+    """
+    Turnbull NPMLE of mixed-censored data, as a distribution function.
+
+    Detects covered by the same set of censoring intervals get NPMLE mass in
+    proportion to their number (the self-consistency equations give
+    p_j = d_j / (n - A) with A shared), and with the detects sorted such
+    sets are contiguous runs. Each run enters the EM as one weighted exact
+    observation, alongside the unique limits with their counts, so the EM
+    size depends on the number of distinct limits, not on n.
+
+    Returns:
+        callable: cdf(v, strict) giving P(X <= v), or with strict=True the
+            Hirsch-Stedinger convention P(X < v): the mass of detects at v
+            is excluded, but not that of an interval (a, v] left by a limit.
+    """
+    detects = np.sort(values[status == 0])
+    limits_left, count_left = np.unique(values[status == -1], return_counts=True)
+    limits_right, count_right = np.unique(values[status == 1], return_counts=True)
+
+    # Censored values are strictly beyond their limit ("< L", "> R"), as in
+    # the Kaplan-Meier positions where a limit ranks below a detect at L.
+    # (lower, L) is entered as (lower, L'] with L' the float just below L.
+    below_limits = np.nextafter(limits_left, -np.inf)
+
+    # Runs of detects inside the same left and right censoring intervals
+    key = (np.searchsorted(limits_left, detects, side='right') * (len(limits_right) + 1)
+           + np.searchsorted(limits_right, detects, side='left'))
+    run_starts = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+    run_sizes = np.diff(np.append(run_starts, len(detects)))
+    reps = detects[run_starts]
+
+    intervals, probs = turnbull_em(
+        np.concatenate((reps, np.full(len(limits_left), lower), limits_right)),
+        np.concatenate((reps, below_limits, np.full(len(limits_right), np.inf))),
+        max_iter=_NPMLE_MAX_ITER, tol=_NPMLE_TOL.get(solver, 1e-10), solver=solver, backend=backend,
+        weights=np.concatenate((run_sizes, count_left, count_right)))
+
+    # Only exact observations give point intervals: split their mass over
+    # the run's detects. The other intervals hold the mass of limits only.
+    point = intervals[:, 0] == intervals[:, 1]
+    run_mass = np.zeros(len(reps))
+    run_mass[np.searchsorted(reps, intervals[point, 0])] = probs[point]
+    detect_head = np.concatenate(([0.0], np.cumsum(np.repeat(run_mass / run_sizes, run_sizes))))
+
+    interval_ends = intervals[~point, 1]
+    interval_head = np.concatenate(([0.0], np.cumsum(probs[~point])))
+
+    def cdf(v, strict=False):
+        k = np.searchsorted(detects, v, side='left' if strict else 'right')
+        return detect_head[k] + interval_head[np.searchsorted(interval_ends, v, side='right')]
+
+    return cdf
+
+def impute_ros_mixed(values, status, dist='lognormal', solver='em', draw='mean', random_state=None,
+                     backend='numpy'):
+    """
+    Imputes mixed-censored data with a single ROS fit on joint plotting positions.
+
+    Every row is an interval for the Turnbull NPMLE: detects are the point
+    [x, x], left-censored values (lower, L) and right-censored values
+    (R, inf), where lower is 0 for 'lognormal' and -inf for 'normal'. With
+    F the NPMLE distribution function, detects and left-censored values get
+    the plotting position F(v-) * n / (n + 1) and right-censored values
+    F(R) * n / (n + 1). For left censoring alone F(v-) is the
+    Hirsch-Stedinger (Kaplan-Meier) position, so the result matches
+    `impute_ros_left`; right-censored values are positioned with the same
+    estimate instead of being treated as detects in a first pass.
+
+    One regression of the (log) detects on their normal scores is then
+    used to impute left-censored values with E[Z | Z < z(L)] and
+    right-censored values with E[Z | Z > z(R)].
+
+    Args:
+        values (array): Data values (limits for censored).
+        status (array): Status codes (-1: Left, 0: Obs, 1: Right).
+        dist (str): Distribution assumption ('lognormal' or 'normal').
+        solver (str): Turnbull iteration scheme: 'em' (default, as for interval
+            ROS) or 'squarem'.
+        backend (str): Turnbull EM implementation ('numpy' or 'numba').
+        draw (str): 'mean' (default) or 'random' (draws from the fitted
+            distribution beyond each limit's plotting position).
+        random_state (int or np.random.Generator, optional): Seed for draw='random'.
+
+    Returns:
+        array: Imputed values.
+    """
+    if draw not in _DRAWS:
+        raise ValueError(f"Unknown draw '{draw}'. Options: 'mean', 'random'.")
+
+    values = np.asarray(values, dtype=float)
+    status = np.asarray(status, dtype=int)
+    n = len(values)
+
+    detect = status == 0
+    if detect.sum() < 2:
+        raise ValueError("Too few uncensored observations to fit regression.")
+    if dist == 'lognormal':
+        if (values <= 0).any():
+            raise ValueError("Values must be positive for lognormal distribution.")
+        lower = 0.0
+    elif dist == 'normal':
+        lower = -np.inf
+    else:
+        raise ValueError(f"Unknown distribution '{dist}'")
+
+    with stage('npmle'):
+        cdf = _npmle_cdf(values, status, lower, solver, backend)
+
+    with stage('plotting_positions'):
+        # Evaluate on the sorted unique values (fast, ordered binary searches)
+        support, inverse = np.unique(values, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        below = cdf(support, strict=True)[inverse]
+
+    scale = n / (n + 1)
+    floor = 0.5 / (n + 1)
+
+    # Regression on the detects
+    pp_det = below[detect] * scale
+    pp_det[pp_det == 0] = floor
+    pp_det[pp_det == 1] = 1.0 - floor
+    y_det = np.log(values[detect]) if dist == 'lognormal' else values[detect]
+    with stage('regression'):
+        slope, intercept, _, _, _ = linregress(ndtri(pp_det), y_det)
+
+    result = values.copy()
+    rng = np.random.default_rng(random_state) if draw == 'random' else None
+
+    mask_left = status == -1
+    if mask_left.any():
+        limits = values[mask_left]
+        pp = below[mask_left] * scale
+        pp[pp == 0] = floor
+        z = ndtri(pp)
+        if draw == 'random':
+            result[mask_left] = _sample_limits(limits, z, intercept, slope, dist, rng.random(len(limits)))
+        else:
+            # E[Z | Z < z]
+            predicted = intercept + slope * (-(np.exp(-z**2 / 2.0) / _SQRT_2PI) / ndtr(z))
+            if dist == 'lognormal':
+                predicted = np.exp(predicted)
+            result[mask_left] = np.minimum(predicted, limits)
+
+    mask_right = status == 1
+    if mask_right.any():
+        limits = values[mask_right]
+        z = ndtri(cdf(support)[inverse[mask_right]] * scale)
+        if draw == 'random':
+            # Mirror image of a draw below -z
+            y_limits = np.log(limits) if dist == 'lognormal' else limits
+            mirrored = _sample_limits(-y_limits, -z, -intercept, slope, 'normal', rng.random(len(limits)))
+            predicted = -mirrored
+        else:
+            # E[Z | Z > z]
+            predicted = intercept + slope * ((np.exp(-z**2 / 2.0) / _SQRT_2PI) / ndtr(-z))
+        if dist == 'lognormal':
+            predicted = np.exp(predicted)
+        result[mask_right] = np.maximum(predicted, limits)
+
+    return result
+
+def impute_ros_mixed_heuristic(values, status, draw='mean', random_state=None):
     """
     Imputes mixed-censored data using a sequential heuristic ROS.
 
@@ -15,12 +189,16 @@ def impute_ros_mixed_heuristic(values, status):
     Args:
         values (array): Data values.
         status (array): Status codes (-1: Left, 0: Obs, 1: Right).
+        draw (str): 'mean' or 'random' (see `impute_ros_left`).
+        random_state (int or np.random.Generator, optional): Seed for draw='random'.
 
     Returns:
         array: Imputed values.
     """
-    values = np.array(values, dtype=float)
-    status = np.array(status, dtype=int)
+    values = np.asarray(values, dtype=float)
+    status = np.asarray(status, dtype=int)
+    # One stream for both passes
+    rng = np.random.default_rng(random_state) if draw == 'random' else None
 
     # --- Pass 1: Impute Left ---
     # Treat Right Censored (1) as Observed (False in boolean mask for Left ROS)
@@ -32,7 +210,7 @@ def impute_ros_mixed_heuristic(values, status):
     # is a conservative estimate for the purpose of fitting the Left tail.
     # (Since Left tail < Right tail usually, the exact value of Right tail
     # matters less for the slope of the Left tail than the count N does).
-    pass1_values = impute_ros_left(values, mask_left)
+    pass1_values = impute_ros_left(values, mask_left, draw=draw, random_state=rng)
 
     # --- Pass 2: Impute Right ---
     # Now use the output of Pass 1.
@@ -40,6 +218,6 @@ def impute_ros_mixed_heuristic(values, status):
     # Right Censored (1) are True.
     mask_right = (status == 1)
 
-    final_values = impute_ros_right(pass1_values, mask_right)
+    final_values = impute_ros_right(pass1_values, mask_right, draw=draw, random_state=rng)
 
     return final_values
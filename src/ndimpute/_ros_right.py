@@ -1,32 +1,39 @@
 from ._ros_left import impute_ros_left
 
-def impute_ros_right(values, is_censored, dist='lognormal', plotting_position='kaplan-meier'):
+def _mirror(values, dist):
+    """
+    Maps right-censored data onto left-censored data (and back): 1/x for
+    lognormal, -x otherwise. The map is its own inverse.
+    """
+    if dist == 'lognormal':
+        return 1.0 / values
+    return -values
+
+def impute_ros_right(values, is_censored, dist='lognormal', plotting_position='kaplan-meier', draw='mean',
+                     random_state=None):
     """
     Imputes right-censored data using Reverse ROS.
+
+    `draw` and `random_state` are as in `impute_ros_left` (draws fall above
+    the censoring values).
     """
     # 1. Reverse domain
     # For lognormal (dist>0), we can't just flip sign and log.
     # Instead, we invert: y' = 1/y.
     # Large values become small (Left Censored).
+    # Right censored at 100 -> Value is > 100
+    # Inverted: Value is < 1/100 (Left Censored)
+    # For the normal distribution the sign is flipped instead.
 
     if dist == 'lognormal':
-        # Right censored at 100 -> Value is > 100
-        # Inverted: Value is < 1/100 (Left Censored)
-
         # Ensure no zeros if lognormal
         if (values <= 0).any():
              raise ValueError("Values must be positive for lognormal distribution.")
-
-        inv_values = 1.0 / values
-
-        # Call Left ROS
-        imputed_inv = impute_ros_left(inv_values, is_censored, dist='lognormal', plotting_position=plotting_position)
-
-        # Invert back
-        return 1.0 / imputed_inv
-
+        left_dist = 'lognormal'
     else:
-        # Normal distribution -> flip sign
-        flipped_values = -values
-        imputed_flipped = impute_ros_left(flipped_values, is_censored, dist='normal', plotting_position=plotting_position)
-        return -imputed_flipped
+        left_dist = 'normal'
+
+    # Call Left ROS, then map back
+    imputed_mirror = impute_ros_left(_mirror(values, dist), is_censored, dist=left_dist,
+                                     plotting_position=plotting_position, draw=draw, random_state=random_state)
+    return _mirror(imputed_mirror, dist)
@@ -0,0 +1,240 @@
+import numpy as np
+from scipy.special import ndtri
+from ._ros_left import _impute_limits
+from ._ros_right import _mirror
+from ._profile import stage
+
+# Robust ROS for many groups at once. Rows are sorted by (group, value) in
+# a single lexsort; plotting positions and regressions then come from
+# segment-wise cumulative sums and bincount reductions over the flat arrays,
+# with no Python loop over groups.
+
+def _segment_starts(seg):
+    """
+    Boolean mask of the first element of each run of equal `seg` values.
+    """
+    first = np.ones(len(seg), dtype=bool)
+    first[1:] = seg[1:] != seg[:-1]
+    return first
+
+def _segmented_cumsum(a, first):
+    """
+    Cumulative sum that restarts at every segment start.
+
+    Each restart subtracts the previous segment's own total (a pairwise
+    reduceat), so rounding error stays proportional to the segment sums
+    instead of growing with the running total over all segments.
+    """
+    a = np.asarray(a, dtype=float)
+    if len(a) == 0:
+        return a.copy()
+    bounds = np.flatnonzero(first)
+    totals = np.add.reduceat(a, bounds)
+    shifted = a.copy()
+    shifted[bounds[1:]] -= totals[:-1]
+    return np.cumsum(shifted)
+
+def _segmented_suffix_product(factors, first):
+    """
+    Product of factors from each element to the end of its segment.
+
+    Computed in log space; exact zeros are tracked separately so they
+    propagate as in a direct product.
+    """
+    n = len(factors)
+    last = np.ones(n, dtype=bool)
+    last[:-1] = first[1:]
+    zero = factors == 0
+
+    # Reverse so suffixes become prefixes; segments now start at `last`
+    with np.errstate(divide='ignore'):
+        log_f = np.log(np.where(zero, 1.0, factors))
+    log_suffix = _segmented_cumsum(log_f[::-1], last[::-1])[::-1]
+
+    # Zeros are counted with integer sums, which are exact
+    zero_count = np.cumsum(zero[::-1])
+    bounds = np.flatnonzero(last[::-1])
+    zero_base = np.concatenate(([0], zero_count[bounds[1:] - 1]))
+    seg_of = np.cumsum(last[::-1]) - 1
+    zero_suffix = (zero_count - zero_base[seg_of])[::-1]
+
+    return np.where(zero_suffix > 0, 0.0, np.exp(log_suffix))
+
+def _sort_groups(keys, gid, n_rows):
+    """
+    Row order sorting by group, then by `keys` (the last key is primary, as
+    in np.lexsort). Groups must be contiguous and in order.
+
+    When every group has the same size (e.g. the columns of a wide table, or
+    bootstrap resamples), each group is a row of a 2-D view and is sorted
+    on its own, which is several times faster than one lexsort over all rows.
+    """
+    if len(n_rows) and (n_rows == n_rows[0]).all():
+        size = int(n_rows[0])
+        if size == 0:
+            return np.arange(0)
+        shaped = [np.reshape(k, (-1, size)) for k in keys]
+        if len(shaped) == 1:
+            local = np.argsort(shaped[0], axis=1, kind='stable')
+        else:
+            local = np.lexsort(shaped, axis=-1)
+        return (local + np.arange(0, len(gid), size)[:, None]).ravel()
+
+    return np.lexsort(tuple(keys) + (gid,))
+
+def _weighted_fit(gid, n_groups, z, y, w):
+    """
+    Per-group weighted least squares of y on z (two-pass, centred sums).
+
+    Returns:
+        tuple: (intercept, slope) arrays; NaN where z has no spread.
+    """
+    w_sum = np.bincount(gid, weights=w, minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z_mean = np.bincount(gid, weights=w * z, minlength=n_groups) / w_sum
+        y_mean = np.bincount(gid, weights=w * y, minlength=n_groups) / w_sum
+        dz = z - z_mean[gid]
+        dy = y - y_mean[gid]
+        sxy = np.bincount(gid, weights=w * dz * dy, minlength=n_groups)
+        sxx = np.bincount(gid, weights=w * dz * dz, minlength=n_groups)
+        slope = sxy / sxx
+    slope[sxx <= 0] = np.nan
+    return y_mean - slope * z_mean, slope
+
+def _ros_left_km(x, cens, gid, n_groups, n_rows, dist):
+    """
+    Kaplan-Meier ROS of every group; returns (imputed rows, intercept, slope).
+    """
+    order = _sort_groups((x,), gid, n_rows)
+    xs, cs, gs = x[order], cens[order], gid[order]
+
+    # Support points: unique (group, value) pairs
+    new_pair = _segment_starts(gs) | _segment_starts(xs)
+    pair_id = np.cumsum(new_pair) - 1
+    pair_x, pair_g = xs[new_pair], gs[new_pair]
+    n_pairs = len(pair_x)
+    n_detect = np.bincount(pair_id[~cs], minlength=n_pairs)
+    n_limit = np.bincount(pair_id[cs], minlength=n_pairs)
+
+    # "At risk" counts: integer cumulative sums within each group (exact)
+    cum = np.cumsum(n_detect + n_limit)
+    group_first = _segment_starts(pair_g)
+    base = np.concatenate(([0], cum[np.flatnonzero(group_first)[1:] - 1]))
+    at_risk = cum - base[np.cumsum(group_first) - 1]
+
+    factors = (at_risk - n_detect) / at_risk
+    n = n_rows[pair_g]
+    positions = _segmented_suffix_product(factors, group_first) * (n / (n + 1))
+
+    # Regression on detect support points, weighted by their counts
+    det = n_detect > 0
+    pp_unc = positions[det]
+    n_det = n[det]
+    pp_unc = np.where(pp_unc == 0, 0.5 / (n_det + 1), pp_unc)
+    pp_unc = np.where(pp_unc == 1, 1.0 - 0.5 / (n_det + 1), pp_unc)
+    y = np.log(pair_x[det]) if dist == 'lognormal' else pair_x[det]
+    intercept, slope = _weighted_fit(pair_g[det], n_groups, ndtri(pp_unc), y, n_detect[det].astype(float))
+
+    # Impute each limit support point, then spread to its rows
+    lim = n_limit > 0
+    g_lim = pair_g[lim]
+    imputed_pairs = np.full(n_pairs, np.nan)
+    imputed_pairs[lim] = _impute_limits(pair_x[lim], positions[lim], intercept[g_lim], slope[g_lim],
+                                        dist, n[lim])
+
+    imputed = x.copy()
+    imputed[order[cs]] = imputed_pairs[pair_id[cs]]
+    return imputed, intercept, slope
+
+def _ros_left_simple(x, cens, gid, n_groups, n_rows, dist):
+    """
+    Simple-ranking (rank / (n + 1)) ROS of every group.
+    """
+    # A value below a limit ranks below a detect equal to that limit
+    order = _sort_groups((~cens, x), gid, n_rows)
+    xs, cs, gs = x[order], cens[order], gid[order]
+
+    first = _segment_starts(gs)
+    rank = np.arange(1, len(xs) + 1) - np.flatnonzero(first)[np.cumsum(first) - 1]
+    z = ndtri(rank / (n_rows[gs] + 1))
+
+    y = np.log(xs[~cs]) if dist == 'lognormal' else xs[~cs]
+    intercept, slope = _weighted_fit(gs[~cs], n_groups, z[~cs], y, np.ones(len(y)))
+
+    predicted = intercept[gs[cs]] + slope[gs[cs]] * z[cs]
+    if dist == 'lognormal':
+        predicted = np.exp(predicted)
+
+    imputed = x.copy()
+    imputed[order[cs]] = np.minimum(predicted, xs[cs])
+    return imputed, intercept, slope
+
+_ENGINES = {
+    'kaplan-meier': _ros_left_km,
+    'ecdf': _ros_left_km,
+    'hirsch-stedinger': _ros_left_km,
+    'simple': _ros_left_simple,
+    'weibull': _ros_left_simple,
+}
+
+def impute_ros_segmented(imputed, values, is_censored, starts, stops, censoring_type='left',
+                         dist='lognormal', plotting_position='kaplan-meier'):
+    """
+    Left (Robust) or right (Reverse) ROS for all groups in one pass.
+
+    Args:
+        imputed (array): Output, written for every group handled here.
+        values (array): Values sorted by group.
+        is_censored (bool array): Censoring flags sorted by group.
+        starts, stops (array): Slice bounds of each group; the slices must
+            tile the arrays.
+        censoring_type (str): 'left' or 'right'.
+        dist (str): 'lognormal' or 'normal'.
+        plotting_position (str): As in `impute_ros_left`.
+
+    Returns:
+        array: Indices of groups not handled (too few detects, invalid
+            values, or a degenerate regression), to be imputed one by one
+            so that their errors are reported per group.
+    """
+    engine = _ENGINES[plotting_position]
+    n_groups = len(starts)
+    sizes = stops - starts
+    gid = np.repeat(np.arange(n_groups), sizes)
+
+    values = np.asarray(values, dtype=float)
+    is_censored = np.asarray(is_censored, dtype=bool)
+
+    # Groups the single-group routine would reject
+    bad_row = ~np.isfinite(values)
+    if dist == 'lognormal':
+        bad_row |= values <= 0
+    n_bad = np.bincount(gid, weights=bad_row, minlength=n_groups)
+    n_detect = np.bincount(gid, weights=~is_censored, minlength=n_groups)
+    good = (n_bad == 0) & (n_detect >= 2)
+
+    if not good.any():
+        return np.arange(n_groups)
+
+    rows = good[gid]
+    # Packed group ids of the groups handled here
+    packed = np.cumsum(good) - 1
+    x = values[rows]
+    if censoring_type == 'right':
+        x = _mirror(x, dist)
+
+    with stage('segmented_ros'):
+        result, intercept, slope = engine(x, is_censored[rows], packed[gid[rows]], int(good.sum()),
+                                          sizes[good], dist)
+
+    if censoring_type == 'right':
+        result = _mirror(result, dist)
+
+    # Degenerate regressions (e.g. all detects tied) go to the per-group path
+    fitted = np.isfinite(intercept) & np.isfinite(slope)
+    good_idx = np.flatnonzero(good)
+    good[good_idx[~fitted]] = False
+    keep = fitted[packed[gid[rows]]]
+    imputed[np.flatnonzero(rows)[keep]] = result[keep]
+
+    return np.flatnonzero(~good)
@@ -0,0 +1,223 @@
+import numpy as np
+from ._dispatch import coerce_status, impute_values
+from ._ros_left import _fit_ros_counts, _impute_limits
+from ._ros_right import _mirror
+
+# Two-pass imputation over data that does not fit in memory.
+#
+# Pass 1 reduces the stream to sufficient statistics whose size does not
+# grow with the number of rows: per-unique-value counts of detects and limits
+# for ROS (plotting positions and regression moments follow from them), or a
+# fixed-size reservoir sample for the Weibull fit. Pass 2 re-reads the stream
+# and imputes chunk by chunk.
+
+_KM_POSITIONS = ('kaplan-meier', 'ecdf', 'hirsch-stedinger')
+
+def open_chunks(chunks):
+    """
+    Starts a pass over the chunk source.
+
+    Args:
+        chunks: A callable returning a fresh iterator of (values, status)
+            pairs, or a re-iterable collection of such pairs (e.g. a list).
+
+    Returns:
+        iterator: Iterator over (values, status) pairs.
+    """
+    if callable(chunks):
+        return iter(chunks())
+    if iter(chunks) is chunks:
+        raise ValueError("Streaming imputation reads the data twice: pass a callable that returns "
+                         "a fresh iterator of (values, status) chunks, not a one-shot iterator.")
+    return iter(chunks)
+
+def _merge_counts(support, counts, chunk_support, chunk_counts):
+    """
+    Merges per-value counts of a chunk into the running table.
+
+    Args:
+        support (array): Sorted unique values seen so far.
+        counts (array): (K, len(support)) counts at each value.
+        chunk_support, chunk_counts: The same for one chunk.
+    """
+    merged, inverse = np.unique(np.concatenate((support, chunk_support)), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    stacked = np.concatenate((counts, chunk_counts), axis=1)
+
+    out = np.vstack([np.bincount(inverse, weights=row, minlength=len(merged)) for row in stacked])
+    return merged, out.astype(np.int64)
+
+class _ValueCounts:
+    """
+    Running count of detects and limits at each unique value.
+
+    Memory is O(number of unique values), which for laboratory data (values
+    reported at a fixed precision) is far below the number of rows.
+    """
+
+    def __init__(self):
+        self.support = np.array([], dtype=float)
+        self.counts = np.zeros((2, 0), dtype=np.int64)
+
+    def update(self, values, is_censored):
+        chunk_support, inverse = np.unique(values, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        n_support = len(chunk_support)
+        chunk_counts = np.vstack([
+            np.bincount(inverse[~is_censored], minlength=n_support),
+            np.bincount(inverse[is_censored], minlength=n_support),
+        ])
+        self.support, self.counts = _merge_counts(self.support, self.counts, chunk_support, chunk_counts)
+
+def _reservoir_update(sample, seen, values, rng):
+    """
+    Algorithm R over a chunk: keeps a uniform sample of fixed size.
+
+    Args:
+        sample (list): [values, status] arrays of the current reservoir,
+            updated in place. Rows past `seen` are unused.
+        seen (int): Rows streamed before this chunk.
+        values (tuple): (values, status) arrays of the chunk.
+        rng (np.random.Generator): Random source.
+
+    Returns:
+        int: Rows streamed including this chunk.
+    """
+    size = len(sample[0])
+    n_chunk = len(values[0])
+    idx = seen + np.arange(n_chunk)
+
+    # Fill the reservoir first
+    fill = idx < size
+    for dst, src in zip(sample, values):
+        dst[idx[fill]] = src[fill]
+
+    # Then row i replaces a uniform slot j <= i when j lands inside it
+    rest = np.flatnonzero(~fill)
+    if len(rest):
+        j = rng.integers(0, idx[rest] + 1)
+        keep = j < size
+        rows, slots = rest[keep], j[keep]
+        # Later rows win a contested slot, as in the sequential algorithm
+        last = len(slots) - 1 - np.unique(slots[::-1], return_index=True)[1]
+        for dst, src in zip(sample, values):
+            dst[slots[last]] = src[rows[last]]
+
+    return seen + n_chunk
+
+def _fit_parametric(chunks, censoring_type, sample_size, random_state):
+    from ._parametric import _fit_weibull
+
+    rng = np.random.default_rng(random_state)
+    sample = [np.empty(sample_size, dtype=float), np.empty(sample_size, dtype=int)]
+    seen = 0
+
+    for values, status in open_chunks(chunks):
+        status, _ = coerce_status(status, censoring_type)
+        seen = _reservoir_update(sample, seen, (np.asarray(values, dtype=float), status.astype(int)), rng)
+
+    values, status = (arr[:min(seen, sample_size)] for arr in sample)
+    if censoring_type == 'right':
+        return _fit_weibull(values[status == 0], right=values[status == 1])
+    return _fit_weibull(values[status == 0], left=values[status == -1], right=values[status == 1])
+
+def _stream_parametric(chunks, censoring_type, shape, scale):
+    from ._parametric import _expected_above, _expected_below
+
+    for values, status in open_chunks(chunks):
+        status, _ = coerce_status(status, censoring_type)
+        result = np.array(values, dtype=float)
+        mask_right = status == 1
+        result[mask_right] = _expected_above(result[mask_right], shape, scale)
+        if censoring_type == 'mixed':
+            mask_left = status == -1
+            result[mask_left] = _expected_below(result[mask_left], shape, scale)
+        yield result
+
+def _to_left(values, censoring_type, dist):
+    # Reverse ROS works on the left-censored mirror image (see impute_ros_right)
+    if censoring_type == 'left':
+        return values
+    if dist == 'lognormal' and (values <= 0).any():
+        raise ValueError("Values must be positive for lognormal distribution.")
+    return _mirror(values, dist)
+
+def _fit_ros(chunks, censoring_type, dist):
+    table = _ValueCounts()
+    for values, status in open_chunks(chunks):
+        status, _ = coerce_status(status, censoring_type)
+        values = _to_left(np.asarray(values, dtype=float), censoring_type, dist)
+        table.update(values, status)
+
+    support = table.support
+    n_detect, n_limit = table.counts
+    intercept, slope, positions = _fit_ros_counts(support, n_detect, n_limit, dist)
+
+    # Imputed value for a limit at each support point (NaN where there are none)
+    imputed = np.full(len(support), np.nan)
+    lim = n_limit > 0
+    imputed[lim] = _impute_limits(support[lim], positions[lim], intercept, slope, dist,
+                                  int(n_detect.sum() + n_limit.sum()))
+    return support, imputed
+
+def _stream_ros(chunks, censoring_type, dist, support, imputed_support):
+    for values, status in open_chunks(chunks):
+        status, _ = coerce_status(status, censoring_type)
+        # Copy: the left-censored case would otherwise write into the caller's chunk
+        result = _to_left(np.array(values, dtype=float), censoring_type, dist)
+
+        limits = result[status]
+        pos = np.minimum(np.searchsorted(support, limits), max(len(support) - 1, 0))
+        if len(limits) and (np.any(support[pos] != limits) or np.isnan(imputed_support[pos]).any()):
+            raise ValueError("Chunks changed between the fitting and imputation passes.")
+
+        result[status] = imputed_support[pos]
+        yield result if censoring_type == 'left' else _mirror(result, dist)
+
+def _stream_direct(chunks, method, censoring_type, kwargs):
+    for values, status in open_chunks(chunks):
+        status, _ = coerce_status(status, censoring_type)
+        yield np.asarray(impute_values(np.asarray(values), status, method, censoring_type, **kwargs), dtype=float)
+
+def impute_stream(chunks, method='ros', censoring_type='left', sample_size=100_000, random_state=None,
+                  **kwargs):
+    """
+    Fits on a first pass over the chunks and returns a generator for the second.
+
+    Args:
+        chunks: Callable returning a fresh iterator of (values, status)
+            pairs, or a re-iterable collection of them.
+        method (str): 'ros' (Kaplan-Meier positions), 'parametric' or 'substitution'.
+        censoring_type (str): 'left', 'right' or 'mixed'.
+        sample_size (int): Reservoir size for the parametric Weibull fit.
+        random_state (int or np.random.Generator, optional): Seed for the reservoir.
+        **kwargs: Method options (dist, strategy, multiplier, ...).
+
+    Returns:
+        generator: Imputed values for each chunk, in order.
+    """
+    if censoring_type not in ('left', 'right', 'mixed'):
+        raise NotImplementedError(f"Streaming imputation is not implemented for censoring_type='{censoring_type}'.")
+
+    if kwargs.get('draw', 'mean') != 'mean':
+        raise NotImplementedError("Streaming imputation supports draw='mean' only.")
+
+    if method == 'substitution':
+        # No global statistics needed: a single pass
+        return _stream_direct(chunks, method, censoring_type, kwargs)
+
+    if method == 'ros' and censoring_type in ('left', 'right'):
+        plotting_position = kwargs.get('plotting_position', 'kaplan-meier')
+        if plotting_position not in _KM_POSITIONS:
+            raise NotImplementedError("Streaming ROS supports Kaplan-Meier plotting positions only; "
+                                      "rank-based positions need the full sort order.")
+        dist = kwargs.get('dist', 'lognormal')
+        support, imputed_support = _fit_ros(chunks, censoring_type, dist)
+        return _stream_ros(chunks, censoring_type, dist, support, imputed_support)
+
+    if method == 'parametric' and censoring_type in ('right', 'mixed'):
+        shape, scale = _fit_parametric(chunks, censoring_type, sample_size, random_state)
+        return _stream_parametric(chunks, censoring_type, shape, scale)
+
+    raise NotImplementedError(f"Streaming imputation is not implemented for method '{method}' "
+                              f"with {censoring_type} censoring.")
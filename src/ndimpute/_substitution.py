@@ -1,7 +1,7 @@
 import numpy as np
-import pandas as pd
+from ._dispatch import prepare_output
 
-def impute_sub_left(values, is_censored, strategy='half', multiplier=None):
+def impute_sub_left(values, is_censored, strategy='half', multiplier=None, out=None):
     """
     Imputes left-censored data using simple substitution.
 
@@ -14,12 +14,13 @@ def impute_sub_left(values, is_censored, strategy='half', multiplier=None):
             - 'value' or 'lod': Replace <LOD with LOD.
             - 'multiple': Replace <LOD with LOD * multiplier.
         multiplier (float, optional): Factor to multiply by when strategy='multiple'.
+        out (array, optional): Float array to write into (may be `values`).
     """
-    values = np.array(values, dtype=float)
-    is_censored = np.array(is_censored, dtype=bool)
+    values = np.asarray(values, dtype=float)
+    is_censored = np.asarray(is_censored, dtype=bool)
 
-    imputed = values.copy()
     cens_vals = values[is_censored]
+    imputed = prepare_output(values, out)
 
     if strategy == 'half':
         imputed[is_censored] = cens_vals / 2.0
@@ -36,7 +37,7 @@ def impute_sub_left(values, is_censored, strategy='half', multiplier=None):
 
     return imputed
 
-def impute_sub_right(values, is_censored, strategy='value', multiplier=None):
+def impute_sub_right(values, is_censored, strategy='value', multiplier=None, out=None):
     """
     Imputes right-censored data using simple substitution.
 
@@ -47,12 +48,13 @@ def impute_sub_right(values, is_censored, strategy='value', multiplier=None):
             - 'value' or 'c': Replace >C with C.
             - 'multiple': Replace >C with C * multiplier.
         multiplier (float, optional): Factor to multiply by when strategy='multiple'.
+        out (array, optional): Float array to write into (may be `values`).
     """
-    values = np.array(values, dtype=float)
-    is_censored = np.array(is_censored, dtype=bool)
+    values = np.asarray(values, dtype=float)
+    is_censored = np.asarray(is_censored, dtype=bool)
 
-    imputed = values.copy()
     cens_vals = values[is_censored]
+    imputed = prepare_output(values, out)
 
     if strategy in ['value', 'c']:
         imputed[is_censored] = cens_vals
@@ -65,7 +67,7 @@ def impute_sub_right(values, is_censored, strategy='value', multiplier=None):
 
     return imputed
 
-def impute_sub_mixed(values, status, left_kwargs=None, right_kwargs=None):
+def impute_sub_mixed(values, status, left_kwargs=None, right_kwargs=None, out=None):
     """
     Imputes mixed-censored data using substitution.
 
@@ -74,29 +76,28 @@ def impute_sub_mixed(values, status, left_kwargs=None, right_kwargs=None):
         status (array): Status codes (-1: Left, 0: Obs, 1: Right).
         left_kwargs (dict): Arguments for left substitution (strategy, multiplier).
         right_kwargs (dict): Arguments for right substitution (strategy, multiplier).
+        out (array, optional): Float array to write into (may be `values`).
     """
-    values = np.array(values, dtype=float)
-    status = np.array(status, dtype=int)
+    values = np.asarray(values, dtype=float)
+    status = np.asarray(status, dtype=int)
 
     if left_kwargs is None: left_kwargs = {}
     if right_kwargs is None: right_kwargs = {}
 
-    imputed = values.copy()
-
-    # Left Censored
+    # Each side is substituted on its own subset (every element is
+    # independent), before anything is written to the output.
     mask_left = (status == -1)
-    if np.any(mask_left):
-        # We pass only the left-censored subset to the helper, BUT helper expects boolean array
-        # simpler to just call helper on the whole array with a constructed boolean mask
-        # and update only the relevant parts?
-        # impute_sub_left returns a full array with imputations.
-        left_imputed = impute_sub_left(values, mask_left, **left_kwargs)
-        imputed[mask_left] = left_imputed[mask_left]
-
-    # Right Censored
     mask_right = (status == 1)
+    left_vals = values[mask_left]
+    right_vals = values[mask_right]
+
+    if np.any(mask_left):
+        left_vals = impute_sub_left(left_vals, np.ones(len(left_vals), dtype=bool), **left_kwargs)
     if np.any(mask_right):
-        right_imputed = impute_sub_right(values, mask_right, **right_kwargs)
-        imputed[mask_right] = right_imputed[mask_right]
+        right_vals = impute_sub_right(right_vals, np.ones(len(right_vals), dtype=bool), **right_kwargs)
+
+    imputed = prepare_output(values, out)
+    imputed[mask_left] = left_vals
+    imputed[mask_right] = right_vals
 
     return imputed
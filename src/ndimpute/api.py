@@ -1,13 +1,40 @@
-import pandas as pd
 import numpy as np
-from ._ros_left import impute_ros_left
-from ._ros_right import impute_ros_right
-from ._ros_mixed import impute_ros_mixed_heuristic
-from ._parametric import impute_right_conditional, impute_mixed_parametric
-from ._substitution import impute_sub_left, impute_sub_right, impute_sub_mixed
-from ._interval import impute_interval_ros
-
-def impute(values, status=None, method='ros', censoring_type='left', **kwargs):
+from ._dispatch import coerce_status, split_bounds, impute_values
+from ._profile import stage
+
+# pandas is imported where a DataFrame is built, so the array/dict outputs
+# never pay for it.
+
+_OUTPUTS = ('dataframe', 'array', 'dict')
+
+def impute_array(values, status=None, method='ros', censoring_type='left', out=None, **kwargs):
+    """
+    Imputes and returns only the imputed values as a NumPy array.
+
+    Takes the same arguments as `impute` but skips building the result
+    DataFrame, which dominates the cost for small series in hot loops.
+
+    Inputs are not copied when they are already NumPy-compatible (arrays,
+    np.memmap, pandas columns, buffer-protocol or Arrow arrays of a fitting
+    dtype).
+
+    Args:
+        out (np.ndarray, optional): Float array (e.g. an np.memmap) to write
+            the result into. Passing `values` itself imputes in place.
+
+    Returns:
+        np.ndarray: The final values (observed or imputed), in input order.
+            This is `out` when given.
+    """
+    if censoring_type == 'interval':
+        return impute_values(values, None, method, censoring_type, out=out, **kwargs)
+
+    with stage('convert'):
+        values = np.asarray(values)
+        status, _ = coerce_status(status, censoring_type)
+    return impute_values(values, status, method, censoring_type, out=out, **kwargs)
+
+def impute(values, status=None, method='ros', censoring_type='left', output='dataframe', **kwargs):
     """
     Unified imputation function.
 
@@ -21,7 +48,29 @@ def impute(values, status=None, method='ros', censoring_type='left', **kwargs):
             - Mixed: Integer array (-1: Left, 0: Observed, 1: Right).
         method (str): 'ros', 'parametric', or 'substitution'.
         censoring_type (str): 'left', 'right', 'mixed', or 'interval'.
-        **kwargs: Additional arguments (dist, plotting_position, strategy, etc.)
+        output (str): Result type.
+            - 'dataframe' (default): pd.DataFrame described below.
+            - 'array': np.ndarray of the imputed values only (see `impute_array`).
+            - 'dict': The DataFrame columns as a dict of NumPy arrays, without
+              building the DataFrame.
+        **kwargs: Additional arguments (dist, plotting_position, strategy, solver, etc.)
+            - mixed_strategy (str): For method='ros' with mixed censoring,
+              'joint' (default: one fit on Turnbull NPMLE plotting positions)
+              or 'heuristic' (left ROS, then reverse ROS on the result).
+            - draw (str): 'mean' (default) imputes conditional means (or the
+              ROS prediction); 'random' draws each censored value from the
+              fitted distribution truncated to its censoring range, so
+              imputed data keep their variance. Not for 'substitution'.
+            - random_state (int or np.random.Generator): Seed for draw='random'.
+            - out (np.ndarray): Array to write the imputed values into, as in
+              `impute_array`. With out=values, 'original_value' holds a
+              copy of the input.
+            - solver (str): Turnbull iteration scheme for interval and joint
+              mixed ROS: 'em' (default) or 'squarem' (accelerated, see
+              `turnbull_em`).
+            - backend (str): Turnbull EM implementation for interval and joint
+              mixed ROS: 'numpy' (default) or 'numba' (compiled loops, see
+              `turnbull_em`).
 
     Returns:
         pd.DataFrame: A dataframe containing:
@@ -30,90 +79,251 @@ def impute(values, status=None, method='ros', censoring_type='left', **kwargs):
             - 'censoring_status': The original status input.
             - 'is_imputed': Boolean flag.
     """
-    dist = kwargs.get('dist', 'lognormal')
-    plotting_position = kwargs.get('plotting_position', 'kaplan-meier')
+    if output not in _OUTPUTS:
+        raise ValueError(f"Unknown output '{output}'. Options: 'dataframe', 'array', 'dict'.")
+
+    if output == 'array':
+        return impute_array(values, status, method=method, censoring_type=censoring_type, **kwargs)
 
     if censoring_type == 'interval':
         # Values should be (N, 2)
-        bounds = np.array(values)
-        if bounds.ndim != 2 or bounds.shape[1] != 2:
-            raise ValueError("For censoring_type='interval', values must be (N, 2) array of bounds.")
-
-        left, right = bounds[:, 0], bounds[:, 1]
+        with stage('convert'):
+            left, right = split_bounds(values)
+            out = kwargs.get('out')
+            if out is not None and (np.may_share_memory(out, left) or np.may_share_memory(out, right)):
+                left, right = left.copy(), right.copy()
+        imputed_vals = impute_values(values, None, method, censoring_type, **kwargs)
 
-        if method == 'ros':
-            imputed_vals = impute_interval_ros(left, right, dist=dist)
-        else:
-            raise NotImplementedError(f"Method '{method}' not implemented for interval censoring.")
-
-        return pd.DataFrame({
-            'imputed_value': imputed_vals,
-            'original_left': left,
-            'original_right': right,
-            'censoring_status': 'interval',
-            'is_imputed': True # All intervals are technically imputed/estimated
-        })
-
-    # ... Existing Logic for Left/Right/Mixed ...
-    values = np.array(values)
-    if status is None:
-        raise ValueError("Status argument is required for left/right/mixed censoring.")
-
-    # Status handling depends on type
-    if censoring_type == 'mixed':
-        status = np.array(status, dtype=int)
-        is_imputed = (status != 0)
-    else:
-        status = np.array(status, dtype=bool)
-        is_imputed = status
-
-    if censoring_type == 'left':
-        if method == 'ros':
-            imputed_vals = impute_ros_left(values, status, dist=dist, plotting_position=plotting_position)
-        elif method == 'substitution':
-            strategy = kwargs.get('strategy', 'half')
-            multiplier = kwargs.get('multiplier', None)
-            imputed_vals = impute_sub_left(values, status, strategy=strategy, multiplier=multiplier)
-        else:
-            raise NotImplementedError(f"Method '{method}' not implemented for left censoring.")
-
-    elif censoring_type == 'right':
-        if method == 'ros':
-            imputed_vals = impute_ros_right(values, status, dist=dist, plotting_position=plotting_position)
-        elif method == 'parametric':
-            imputed_vals = impute_right_conditional(values, status)
-        elif method == 'substitution':
-            strategy = kwargs.get('strategy', 'value')
-            multiplier = kwargs.get('multiplier', None)
-            imputed_vals = impute_sub_right(values, status, strategy=strategy, multiplier=multiplier)
-        else:
-            raise ValueError(f"Unknown method '{method}' for right censoring.")
-
-    elif censoring_type == 'mixed':
-        if method == 'parametric':
-            imputed_vals = impute_mixed_parametric(values, status)
-        elif method == 'substitution':
-            # Extract mixed kwargs
-            left_kwargs = {
-                'strategy': kwargs.get('left_strategy', 'half'),
-                'multiplier': kwargs.get('left_multiplier', None)
-            }
-            right_kwargs = {
-                'strategy': kwargs.get('right_strategy', 'value'),
-                'multiplier': kwargs.get('right_multiplier', None)
+        if output == 'dict':
+            return {
+                'imputed_value': imputed_vals,
+                'original_left': left,
+                'original_right': right,
+                'censoring_status': np.full(len(left), 'interval', dtype=object),
+                'is_imputed': np.ones(len(left), dtype=bool)
             }
-            imputed_vals = impute_sub_mixed(values, status, left_kwargs=left_kwargs, right_kwargs=right_kwargs)
-        elif method == 'ros':
-             imputed_vals = impute_ros_mixed_heuristic(values, status)
-        else:
-            raise ValueError(f"Unknown method '{method}' for mixed censoring.")
 
-    else:
-        raise ValueError("censoring_type must be 'left', 'right', 'mixed', or 'interval'")
+        with stage('dataframe'):
+            import pandas as pd
+            return pd.DataFrame({
+                'imputed_value': imputed_vals,
+                'original_left': left,
+                'original_right': right,
+                'censoring_status': 'interval',
+                'is_imputed': True # All intervals are technically imputed/estimated
+            })
+
+    with stage('convert'):
+        values = np.asarray(values)
+        status, is_imputed = coerce_status(status, censoring_type)
+        out = kwargs.get('out')
+        if out is not None and np.may_share_memory(out, values):
+            # Imputing in place would overwrite 'original_value'
+            values = values.copy()
+    imputed_vals = impute_values(values, status, method, censoring_type, **kwargs)
 
-    return pd.DataFrame({
+    columns = {
         'imputed_value': imputed_vals,
         'original_value': values,
         'censoring_status': status,
         'is_imputed': is_imputed
-    })
+    }
+
+    if output == 'dict':
+        return columns
+
+    with stage('dataframe'):
+        import pandas as pd
+        return pd.DataFrame(columns)
+
+def impute_stream(chunks, method='ros', censoring_type='left', sample_size=100_000, random_state=None,
+                  **kwargs):
+    """
+    Two-pass imputation for data too large to hold in memory.
+
+    The first pass (run before this function returns) accumulates what the
+    method needs: per-value counts of detects and limits for ROS, or a
+    reservoir sample for the Weibull fit. The returned generator makes the
+    second pass, so peak memory is bounded by the chunk size (plus the
+    number of unique values for ROS).
+
+    Args:
+        chunks: Callable returning a fresh iterator of (values, status) pairs,
+            e.g. a function reading a file batch by batch, or a re-iterable
+            collection of pairs. Status is encoded as in `impute`.
+        method (str): 'ros', 'parametric', or 'substitution'.
+            - 'ros': Left/right censoring with Kaplan-Meier plotting positions.
+              Same result as `impute` up to rounding.
+            - 'parametric': Right/mixed censoring. The Weibull is fitted to a
+              uniform sample of `sample_size` rows (all rows if fewer).
+            - 'substitution': Any non-interval type, in a single pass.
+        censoring_type (str): 'left', 'right', or 'mixed'.
+        sample_size (int): Reservoir size for method='parametric'.
+        random_state (int or np.random.Generator, optional): Seed for the reservoir.
+        **kwargs: Additional arguments (dist, strategy, multiplier, etc.)
+
+    Returns:
+        generator: np.ndarray of imputed values for each chunk, in order.
+    """
+    from ._streaming import impute_stream as _impute_stream
+    return _impute_stream(chunks, method=method, censoring_type=censoring_type, sample_size=sample_size,
+                          random_state=random_state, **kwargs)
+
+def impute_multiple(values, status=None, method='ros', censoring_type='left', n_imputations=20,
+                    bootstrap=True, random_state=None, n_jobs=None, chunk_size=None, **kwargs):
+    """
+    Multiple imputation: draws several plausible imputed datasets.
+
+    Each imputation refits the model to a bootstrap resample of the data
+    and draws every censored value at random from the refitted distribution
+    truncated to its censoring range (below a detection limit, above a
+    censoring time, or within an interval), rather than imputing the
+    conditional mean. Summaries computed on each row of the result (means,
+    percentiles, UCLs) then reflect the uncertainty due to censoring.
+
+    Args:
+        values, status, censoring_type: As in `impute`.
+        method (str):
+            - 'ros': Left/right censoring (dist, plotting_position as in
+              `impute`) and interval censoring (dist, solver, backend). With
+              the default solver='em' and backend='numpy', interval
+              resamples are refitted together as bootstrap-weighted Turnbull
+              NPMLEs on the intervals of the full data; otherwise each
+              resample is refitted on its own with the requested solver.
+            - 'parametric': Right/mixed censoring (Weibull; optional init).
+        n_imputations (int): Number of imputed datasets B.
+        bootstrap (bool): Refit the model on a bootstrap resample for each
+            imputation. If False, all draws use the fit to the full data.
+        random_state (int or np.random.Generator, optional): Seed.
+        n_jobs (int, optional): Threads over chunks of imputations. None
+            (default) runs serially; -1 uses all CPUs. Does not change the result.
+        chunk_size (int, optional): Imputations per chunk (default: about
+            4M values per chunk). Each chunk has its own random stream.
+        **kwargs: Method options.
+
+    Returns:
+        np.ndarray: (n_imputations, n) array; row b is the b-th imputed
+            dataset, with observed values unchanged.
+    """
+    from ._multiple import impute_multiple as _impute_multiple
+    return _impute_multiple(values, status, method=method, censoring_type=censoring_type,
+                            n_imputations=n_imputations, bootstrap=bootstrap, random_state=random_state,
+                            n_jobs=n_jobs, chunk_size=chunk_size, **kwargs)
+
+def impute_grouped(df, by, value_col, status_col=None, method='ros', censoring_type='left',
+                   n_jobs=None, executor='auto', **kwargs):
+    """
+    Imputes many independent series (e.g. site x analyte x period) in one call.
+
+    Rows are sorted by group once and every group is imputed on slices of
+    the same arrays, instead of calling `impute` once per group.
+    Substitution runs as a single vectorized pass over all rows.
+
+    Args:
+        df (pd.DataFrame): Long-format data, one row per sample.
+        by (str or list): Column(s) identifying a series.
+        value_col (str or tuple): Column of values (or censoring limits).
+            For censoring_type='interval', a pair of (left, right) bound columns.
+        status_col (str, optional): Column of censoring indicators, encoded as
+            in `impute`. Required for non-interval types.
+        method (str): 'ros', 'parametric', or 'substitution'.
+        censoring_type (str): 'left', 'right', 'mixed', or 'interval'.
+        n_jobs (int, optional): Number of parallel workers for independent
+            groups. None (default) runs serially; -1 uses all CPUs.
+        executor (str or concurrent.futures.Executor): Worker pool.
+            - 'auto' (default): Process pool for method='parametric' (Weibull
+              fits hold the GIL), thread pool otherwise.
+            - 'process': Process pool; input columns are shared through
+              shared memory rather than pickled.
+            - 'thread': Thread pool over the same arrays.
+            - An existing Executor instance.
+            Results are deterministic and identical to a serial run.
+        **kwargs: Additional arguments passed to every group (see `impute`).
+
+    Returns:
+        pd.DataFrame: Same columns as `impute`, indexed like `df`.
+    """
+    import pandas as pd
+    from ._grouped import group_bounds
+    from ._parallel import impute_groups_parallel
+
+    by = [by] if isinstance(by, str) else list(by)
+
+    with stage('group_sort'):
+        codes = df.groupby(by, sort=False, dropna=False).ngroup().to_numpy()
+        order, starts, stops = group_bounds(codes)
+        keys = df[by].iloc[order[starts]].itertuples(index=False, name=None)
+        keys = [key[0] if len(by) == 1 else key for key in keys]
+
+    if censoring_type == 'interval':
+        left_col, right_col = value_col
+        left = df[left_col].to_numpy(dtype=float)
+        right = df[right_col].to_numpy(dtype=float)
+        bounds = np.column_stack((left, right))
+
+        imputed_sorted = impute_groups_parallel(bounds[order], None, starts, stops, method, censoring_type,
+                                                n_jobs=n_jobs, executor=executor, keys=keys, **kwargs)
+        imputed_vals = np.empty(len(df), dtype=float)
+        imputed_vals[order] = imputed_sorted
+
+        with stage('dataframe'):
+            return pd.DataFrame({
+                'imputed_value': imputed_vals,
+                'original_left': left,
+                'original_right': right,
+                'censoring_status': 'interval',
+                'is_imputed': True
+            }, index=df.index)
+
+    if status_col is None:
+        raise ValueError("status_col is required for left/right/mixed censoring.")
+
+    with stage('convert'):
+        values = df[value_col].to_numpy()
+        status, is_imputed = coerce_status(df[status_col].to_numpy(), censoring_type)
+
+    imputed_sorted = impute_groups_parallel(values[order], status[order], starts, stops, method, censoring_type,
+                                            n_jobs=n_jobs, executor=executor, keys=keys, **kwargs)
+    imputed_vals = np.empty(len(df), dtype=float)
+    imputed_vals[order] = imputed_sorted
+
+    with stage('dataframe'):
+        return pd.DataFrame({
+            'imputed_value': imputed_vals,
+            'original_value': values,
+            'censoring_status': status,
+            'is_imputed': is_imputed
+        }, index=df.index)
+
+def impute_columns(values, status=None, method='ros', censoring_type='left', n_jobs=None, executor='auto',
+                   **kwargs):
+    """
+    Imputes every column of a wide table (e.g. one column per analyte) in one call.
+
+    Each column is an independent series with its own fit. All columns are
+    imputed together by the grouped engine (see `impute_grouped`), so
+    left/right ROS, the Weibull fit and substitution are vectorized along
+    the column axis instead of looping over columns.
+
+    Args:
+        values (array-like or pd.DataFrame): (n_samples, n_analytes) values
+            (or censoring limits). For censoring_type='interval', an
+            (n_samples, n_analytes, 2) array of (left, right) bounds.
+            NaN marks a missing cell, which is left out of its column's fit.
+        status (array-like or pd.DataFrame, optional): (n_samples, n_analytes)
+            censoring indicators, encoded as in `impute`. Required for
+            non-interval types; ignored at missing cells. When both are
+            DataFrames, status is aligned to values by index and column labels.
+        method (str): 'ros', 'parametric', or 'substitution'.
+        censoring_type (str): 'left', 'right', 'mixed', or 'interval'.
+        n_jobs, executor: Parallel workers over columns (see `impute_grouped`).
+        **kwargs: Additional arguments passed to every column (see `impute`).
+
+    Returns:
+        np.ndarray or pd.DataFrame: (n_samples, n_analytes) imputed values,
+            NaN at missing cells. A DataFrame with the same index and
+            columns when `values` is a DataFrame.
+    """
+    from ._columns import impute_columns as _impute_columns
+    return _impute_columns(values, status, method=method, censoring_type=censoring_type, n_jobs=n_jobs,
+                           executor=executor, **kwargs)
@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ndimpute import impute, impute_array
+
+class TestOutputModes(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        values = np.random.lognormal(mean=2, sigma=0.5, size=30)
+        self.status = values < 5.0
+        self.values = np.where(self.status, 5.0, values)
+
+    def test_array_output_matches_dataframe(self):
+        df = impute(self.values, self.status, method='ros', censoring_type='left')
+        arr = impute(self.values, self.status, method='ros', censoring_type='left', output='array')
+
+        self.assertIsInstance(arr, np.ndarray)
+        np.testing.assert_array_equal(arr, df['imputed_value'].values)
+        np.testing.assert_array_equal(impute_array(self.values, self.status), arr)
+
+    def test_dict_output_has_dataframe_columns(self):
+        df = impute(self.values, self.status, method='substitution', censoring_type='left')
+        res = impute(self.values, self.status, method='substitution', censoring_type='left', output='dict')
+
+        self.assertEqual(list(res), list(df.columns))
+        pd.testing.assert_frame_equal(pd.DataFrame(res), df)
+
+    def test_interval_array_output(self):
+        bounds = np.array([[0.0, 2.0], [2.0, 4.0], [2.0, 4.0], [4.0, 6.0], [6.0, np.inf]])
+        df = impute(bounds, censoring_type='interval', dist='normal')
+        arr = impute_array(bounds, censoring_type='interval', dist='normal')
+
+        np.testing.assert_array_equal(arr, df['imputed_value'].values)
+
+    def test_out_and_in_place(self):
+        for method in ['ros', 'substitution']:
+            expected = impute_array(self.values, self.status, method=method)
+
+            out = np.empty(len(self.values))
+            self.assertIs(impute_array(self.values, self.status, method=method, out=out), out)
+            np.testing.assert_array_equal(out, expected)
+
+            in_place = self.values.copy()
+            impute_array(in_place, self.status, method=method, out=in_place)
+            np.testing.assert_array_equal(in_place, expected)
+
+        with self.assertRaises(ValueError):
+            impute_array(self.values, self.status, out=np.empty(len(self.values), dtype=int))
+
+    def test_in_place_keeps_original_values(self):
+        expected = impute(self.values, self.status, output='dict')
+        in_place = self.values.copy()
+        res = impute(in_place, self.status, output='dict', out=in_place)
+
+        self.assertIs(res['imputed_value'], in_place)
+        np.testing.assert_array_equal(res['imputed_value'], expected['imputed_value'])
+        np.testing.assert_array_equal(res['original_value'], self.values)
+
+    def test_memmap_in_place(self):
+        import os
+        import tempfile
+
+        expected = impute_array(self.values, self.status, method='parametric', censoring_type='right')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'values.dat')
+            mm = np.memmap(path, dtype=float, mode='w+', shape=self.values.shape)
+            mm[:] = self.values
+            mm.flush()
+
+            data = np.memmap(path, dtype=float, mode='r+', shape=self.values.shape)
+            impute_array(data, self.status, method='parametric', censoring_type='right', out=data)
+            data.flush()
+            del data, mm
+
+            np.testing.assert_array_equal(np.fromfile(path, dtype=float), expected)
+
+    def test_buffer_input(self):
+        from array import array
+        buf = memoryview(array('d', self.values))
+
+        np.testing.assert_array_equal(impute_array(buf, self.status), impute_array(self.values, self.status))
+
+    def test_invalid_output_raises(self):
+        with self.assertRaises(ValueError):
+            impute(self.values, self.status, output='series')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ndimpute.api import impute_array, impute_columns
+
+def make_panel(n_samples=40, n_analytes=5, seed=0):
+    rng = np.random.default_rng(seed)
+    true_vals = rng.lognormal(mean=1 + 0.3 * np.arange(n_analytes), sigma=0.7, size=(n_samples, n_analytes))
+    lod = np.quantile(true_vals, 0.3, axis=0)
+    status = true_vals < lod
+    values = np.where(status, lod, true_vals)
+    # Missing cells, with a nonsense status that must be ignored
+    missing = rng.random((n_samples, n_analytes)) < 0.1
+    values[missing] = np.nan
+    return values, status, missing
+
+class TestColumnImputation(unittest.TestCase):
+    def assert_matches_columns(self, values, status, **kwargs):
+        result = impute_columns(values, status, **kwargs)
+
+        self.assertEqual(result.shape, values.shape)
+        for j in range(values.shape[1]):
+            keep = ~np.isnan(values[:, j])
+            np.testing.assert_allclose(result[keep, j], impute_array(values[keep, j], status[keep, j], **kwargs),
+                                       rtol=1e-10)
+            self.assertTrue(np.all(np.isnan(result[~keep, j])))
+
+    def test_matches_per_column(self):
+        values, status, _ = make_panel()
+        self.assert_matches_columns(values, status, method='ros', censoring_type='left')
+        self.assert_matches_columns(values, status, method='ros', censoring_type='left',
+                                    plotting_position='simple')
+        self.assert_matches_columns(values, status, method='substitution', censoring_type='left')
+        self.assert_matches_columns(values, status, method='parametric', censoring_type='right')
+
+    def test_mixed(self):
+        values, status, _ = make_panel()
+        codes = -status.astype(int)
+        codes[values > np.nanquantile(values, 0.9, axis=0)] = 1
+        self.assert_matches_columns(values, codes, method='ros', censoring_type='mixed')
+
+    def test_interval(self):
+        values, _, missing = make_panel()
+        low = np.floor(values)
+        bounds = np.stack((low, low + 1), axis=-1)
+
+        result = impute_columns(bounds, censoring_type='interval')
+        keep = ~missing[:, 0]
+        np.testing.assert_allclose(result[keep, 0], impute_array(bounds[keep, 0], censoring_type='interval'))
+        self.assertTrue(np.all(np.isnan(result[missing])))
+
+    def test_dataframe(self):
+        values, status, missing = make_panel()
+        columns = ['zinc', 'lead', 'copper', 'nickel', 'iron']
+        index = pd.RangeIndex(100, 140)
+        flags = pd.DataFrame(status, index=index, columns=columns).astype(object)
+        flags[missing] = None
+
+        result = impute_columns(pd.DataFrame(values, index=index, columns=columns), flags)
+
+        self.assertTrue(result.index.equals(index))
+        self.assertEqual(list(result.columns), columns)
+        np.testing.assert_allclose(result.to_numpy(), impute_columns(values, status), equal_nan=True)
+
+    def test_dataframe_status_aligned_by_label(self):
+        values, status, _ = make_panel(n_analytes=3)
+        names = ['lead', 'zinc', 'copper']
+        frame, flags = pd.DataFrame(values, columns=names), pd.DataFrame(status, columns=names)
+        expected = impute_columns(frame, flags)
+
+        shuffled = flags[['copper', 'lead', 'zinc']].iloc[::-1]
+        pd.testing.assert_frame_equal(impute_columns(frame, shuffled), expected)
+        with self.assertRaisesRegex(ValueError, "same index and columns"):
+            impute_columns(frame, flags.rename(columns={'zinc': 'tin'}))
+
+    def test_empty_column_and_errors(self):
+        values, status, _ = make_panel()
+        values[:, 2] = np.nan
+        self.assertTrue(np.all(np.isnan(impute_columns(values, status)[:, 2])))
+
+        with self.assertRaisesRegex(ValueError, "2-D"):
+            impute_columns(values[:, 0], status[:, 0])
+        with self.assertRaisesRegex(ValueError, "status has shape"):
+            impute_columns(values, status[:, :2])
+        values[:5, 1] = 1.0
+        status[:, 1] = True
+        status[:5, 1] = False
+        with self.assertRaisesRegex(ValueError, "column 1"):
+            impute_columns(values, status)
+        frame = pd.DataFrame(values, columns=['lead', 'zinc', 'copper', 'iron', 'nickel'])
+        with self.assertRaisesRegex(ValueError, "Imputation failed for column 'zinc'"):
+            impute_columns(frame, status)
+
+if __name__ == '__main__':
+    unittest.main()
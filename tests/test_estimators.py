@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+from ndimpute import ROSImputer, IncrementalROSImputer, WeibullConditionalImputer, TurnbullROSImputer
+from ndimpute.api import impute_array
+
+class TestEstimators(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 400
+        self.values = np.round(rng.lognormal(1, 1, n), 2) + 0.01
+        self.status = rng.random(n) < 0.3
+        self.values[self.status] = rng.choice([0.5, 1.0, 2.0], self.status.sum())
+        self.rng = rng
+
+    def test_ros_fit_transform_matches_impute(self):
+        for censoring_type in ['left', 'right']:
+            for dist in ['lognormal', 'normal']:
+                model = ROSImputer(censoring_type=censoring_type, dist=dist)
+                result = model.fit_transform(self.values, self.status)
+                expected = impute_array(self.values, self.status, censoring_type=censoring_type, dist=dist)
+                np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_ros_transform_new_batch(self):
+        model = ROSImputer().fit(self.values, self.status)
+        self.assertGreater(model.slope, 0)
+
+        # New limits reuse the fitted positions: an existing limit gets the
+        # same value, and imputations stay below their limits.
+        reference = model.transform(self.values, self.status)
+        new_values = np.array([1.0, 3.0, 0.75, 100.0])
+        new_status = np.array([True, False, True, True])
+        imputed = model.transform(new_values, new_status)
+
+        self.assertEqual(imputed[0], reference[self.status & (self.values == 1.0)][0])
+        self.assertEqual(imputed[1], 3.0)
+        self.assertTrue(np.all(imputed[new_status] <= new_values[new_status]))
+
+    def test_incremental_matches_full_fit(self):
+        model = IncrementalROSImputer()
+        for start in range(0, len(self.values), 50):
+            model.partial_fit(self.values[start:start + 50], self.status[start:start + 50])
+
+        full = ROSImputer().fit(self.values, self.status)
+        self.assertEqual(model.n_samples, len(self.values))
+        self.assertAlmostEqual(model.intercept, full.intercept, places=12)
+        self.assertAlmostEqual(model.slope, full.slope, places=12)
+        np.testing.assert_allclose(model.transform(self.values, self.status),
+                                   full.transform(self.values, self.status), rtol=1e-12)
+
+    def test_incremental_waits_for_detects(self):
+        model = IncrementalROSImputer().partial_fit([1.0, 2.0], [True, False])
+        self.assertIsNone(model.intercept)
+
+        model.partial_fit([3.0], [False])
+        self.assertIsNotNone(model.slope)
+
+    def test_weibull_matches_impute(self):
+        status = np.where(self.status, self.rng.choice([-1, 1], len(self.status)), 0)
+        model = WeibullConditionalImputer(censoring_type='mixed')
+
+        np.testing.assert_array_equal(model.fit_transform(self.values, status),
+                                      impute_array(self.values, status, method='parametric', censoring_type='mixed'))
+        self.assertGreater(model.shape, 0)
+        self.assertGreater(model.scale, 0)
+
+    def test_turnbull_matches_impute(self):
+        bounds = np.column_stack((self.values * 0.8, self.values * 1.2))
+        bounds[::7, 1] = np.inf
+        model = TurnbullROSImputer()
+
+        np.testing.assert_array_equal(model.fit_transform(bounds), impute_array(bounds, censoring_type='interval'))
+        self.assertEqual(model.transform([[2.0, 2.0]])[0], 2.0)
+
+    def test_not_fitted(self):
+        with self.assertRaises(ValueError):
+            ROSImputer().transform([1.0], [True])
+        with self.assertRaises(ValueError):
+            WeibullConditionalImputer(censoring_type='left')
+
+if __name__ == '__main__':
+    unittest.main()
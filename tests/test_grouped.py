@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ndimpute.api import impute, impute_grouped
+from ndimpute._segmented import _segmented_cumsum, _segmented_suffix_product
+
+def make_groups(n_groups=6, size=30, seed=42):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for g in range(n_groups):
+        true_vals = rng.lognormal(mean=1 + 0.2 * g, sigma=0.6, size=size)
+        lod = np.quantile(true_vals, 0.25)
+        status = true_vals < lod
+        values = np.where(status, lod, true_vals)
+        frames.append(pd.DataFrame({
+            'site': f"S{g % 3}",
+            'analyte': f"A{g // 3}",
+            'value': values,
+            'censored': status,
+        }))
+
+    df = pd.concat(frames, ignore_index=True)
+    # Interleave groups and use a non-default index to check alignment
+    df = df.sample(frac=1.0, random_state=0)
+    df.index = df.index * 10
+    return df
+
+class TestGroupedImputation(unittest.TestCase):
+    def assert_matches_loop(self, df, **kwargs):
+        result = impute_grouped(df, by=['site', 'analyte'], value_col='value', status_col='censored', **kwargs)
+
+        self.assertTrue(result.index.equals(df.index))
+        for _, group in df.groupby(['site', 'analyte']):
+            expected = impute(group['value'].values, group['censored'].values, **kwargs)
+            np.testing.assert_allclose(result.loc[group.index, 'imputed_value'].values,
+                                       expected['imputed_value'].values)
+
+    def test_grouped_ros_matches_loop(self):
+        self.assert_matches_loop(make_groups(), method='ros', censoring_type='left')
+
+    def test_grouped_ros_options_match_loop(self):
+        df = make_groups()
+        # Ties between detects and limits exercise the support-point counts
+        df['value'] = np.round(df['value'], 1)
+        for censoring_type in ['left', 'right']:
+            for plotting_position in ['kaplan-meier', 'simple']:
+                self.assert_matches_loop(df, method='ros', censoring_type=censoring_type, dist='normal',
+                                         plotting_position=plotting_position)
+
+    def test_segmented_primitives(self):
+        factors = np.array([0.5, 0.0, 0.8, 0.9, 0.25, 1.0])
+        first = np.array([True, False, False, True, False, True])
+
+        expected = np.array([0.0, 0.0, 0.8, 0.225, 0.25, 1.0])
+        np.testing.assert_allclose(_segmented_suffix_product(factors, first), expected)
+        np.testing.assert_allclose(_segmented_cumsum(factors, first), [0.5, 0.5, 1.3, 0.9, 1.15, 1.0])
+
+    def test_grouped_substitution_matches_loop(self):
+        self.assert_matches_loop(make_groups(), method='substitution', censoring_type='left', strategy='half')
+
+    def test_grouped_parametric_matches_loop(self):
+        self.assert_matches_loop(make_groups(), method='parametric', censoring_type='right')
+
+    def test_grouped_mixed_parametric_matches_loop(self):
+        df = make_groups()
+        # Alternate left and right censoring; one group fully right-censored
+        # has no Weibull MLE and takes the per-group fallback.
+        df['censored'] = np.where(df['censored'], np.where(np.arange(len(df)) % 2, 1, -1), 0)
+        df.loc[(df['site'] == 'S0') & (df['analyte'] == 'A0'), 'censored'] = 1
+        self.assert_matches_loop(df, method='parametric', censoring_type='mixed')
+
+    def test_parallel_backends_match_serial(self):
+        df = make_groups(n_groups=12)
+        kwargs = dict(by=['site', 'analyte'], value_col='value', status_col='censored',
+                      method='parametric', censoring_type='right')
+        serial = impute_grouped(df, **kwargs)
+
+        for executor in ['thread', 'process']:
+            parallel = impute_grouped(df, n_jobs=2, executor=executor, **kwargs)
+            pd.testing.assert_frame_equal(parallel, serial)
+
+    def test_group_error_names_group(self):
+        df = make_groups(n_groups=2)
+        df.loc[df['site'] == 'S1', 'censored'] = True
+
+        with self.assertRaisesRegex(ValueError, "S1"):
+            impute_grouped(df, by=['site', 'analyte'], value_col='value', status_col='censored')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import unittest
+import ndimpute
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(ndimpute.__file__)))
+
+def loaded_modules(code):
+    """Runs code in a fresh interpreter and returns the modules it loaded."""
+    script = code + "\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    out = subprocess.run([sys.executable, "-c", script], env=env, check=True,
+                         capture_output=True, text=True).stdout
+    return set(out.split())
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_is_lightweight(self):
+        modules = loaded_modules("import ndimpute")
+
+        for heavy in ["numpy", "pandas", "scipy"]:
+            self.assertNotIn(heavy, modules)
+
+    def test_substitution_skips_scipy_and_pandas(self):
+        modules = loaded_modules(
+            "from ndimpute import impute_array\n"
+            "impute_array([1.0, 2.0], [True, False], method='substitution')"
+        )
+
+        self.assertIn("numpy", modules)
+        self.assertNotIn("pandas", modules)
+        self.assertNotIn("scipy.stats", modules)
+
+    def test_turnbull_default_skips_numba(self):
+        modules = loaded_modules(
+            "from ndimpute import impute_array\n"
+            "impute_array([[1.0, 2.0], [1.5, 3.0]], censoring_type='interval')\n"
+            "impute_array([1.0, 2.0, 3.0, 4.0], [-1, 0, 0, 1], censoring_type='mixed')"
+        )
+
+        self.assertIn("ndimpute._turnbull", modules)
+        self.assertNotIn("numba", modules)
+
+    def test_public_names_resolve(self):
+        for name in ndimpute.__all__:
+            self.assertTrue(callable(getattr(ndimpute, name)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from scipy.stats import truncnorm
+from ndimpute.api import impute
+from ndimpute._interval import _truncnorm_mean
+
+class TestIntervalImputation(unittest.TestCase):
+    def test_truncnorm_mean_matches_scipy(self):
+        a = np.array([-1.0, -np.inf, -3.0, 2.0, -np.inf, 0.0, -10.0, -2.0])
+        b = np.array([1.0, 0.0, -2.0, 3.0, 2.0, np.inf, 5.0, np.inf])
+
+        np.testing.assert_allclose(_truncnorm_mean(a, b), truncnorm.mean(a, b), rtol=1e-10, atol=1e-12)
+
+    def test_truncnorm_mean_far_tails(self):
+        # E[Z | Z > c] ~ c + 1/c for large c; the naive CDF difference is 0 here.
+        c = np.array([40.0, 60.0])
+        e_upper = _truncnorm_mean(c, np.inf)
+        e_lower = _truncnorm_mean(-np.inf, -c)
+
+        np.testing.assert_allclose(e_upper, c + 1 / c - 2 / c**3, rtol=1e-6)
+        np.testing.assert_allclose(e_lower, -e_upper)
+        # Narrow far-tail interval stays inside its bounds
+        e_narrow = _truncnorm_mean(-40.0, -39.5)
+        self.assertTrue(-40.0 < e_narrow < -39.5)
+
+    def test_imputed_within_bounds(self):
+        np.random.seed(42)
+        true_vals = np.random.lognormal(mean=2, sigma=0.5, size=200)
+        inspection_times = np.arange(0, 50, 2.0)
+        idx = np.searchsorted(inspection_times, true_vals)
+        left = inspection_times[idx - 1]
+        right = np.where(idx < len(inspection_times), inspection_times[np.minimum(idx, len(inspection_times) - 1)], np.inf)
+        # Some right-censored far beyond the data
+        left[:3], right[:3] = 45.0, np.inf
+
+        for dist in ['lognormal', 'normal']:
+            imputed = impute(np.column_stack((left, right)), censoring_type='interval', dist=dist)['imputed_value']
+            self.assertTrue(np.all(imputed >= left))
+            self.assertTrue(np.all(imputed <= right))
+
+if __name__ == '__main__':
+    unittest.main()
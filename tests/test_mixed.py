@@ -1,6 +1,8 @@
 import unittest
 import numpy as np
-from ndimpute.api import impute
+from ndimpute.api import impute, impute_array
+from ndimpute._ros_mixed import _npmle_cdf
+from ndimpute._turnbull import turnbull_em
 
 class TestMixedImputation(unittest.TestCase):
     def test_mixed_substitution(self):
@@ -98,5 +100,47 @@ class TestMixedImputation(unittest.TestCase):
         self.assertGreater(np.mean(left_imputed < 4.0), 0.5)
         self.assertGreater(np.mean(right_imputed > 15.0), 0.5)
 
+class TestJointMixedROS(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = np.round(rng.lognormal(2, 0.5, 500), 1)
+        limits = rng.choice([3.0, 4.0, 5.0], 500)
+        self.status = np.where(self.x < limits, -1, 0)
+        self.status[self.x > 15] = 1
+        self.values = np.where(self.status == -1, limits, np.where(self.status == 1, 15.0, self.x))
+
+    def test_left_only_matches_robust_ros(self):
+        status = np.where(self.status == 1, 0, self.status)
+        values = np.where(self.status == 1, self.x, self.values)
+
+        # SQUAREM converges tightly enough for the NPMLE to match Kaplan-Meier
+        np.testing.assert_allclose(impute_array(values, status, censoring_type='mixed', solver='squarem'),
+                                   impute_array(values, status == -1), rtol=1e-9)
+        np.testing.assert_allclose(impute_array(values, status, censoring_type='mixed'),
+                                   impute_array(values, status == -1), rtol=1e-6)
+
+    def test_reduced_npmle_matches_full(self):
+        values, status = self.values, self.status
+        cdf = _npmle_cdf(values, status, 0.0, 'squarem')
+
+        right = np.where(status == -1, np.nextafter(values, -np.inf), np.where(status == 1, np.inf, values))
+        intervals, probs = turnbull_em(np.where(status == -1, 0.0, values), right,
+                                       max_iter=10_000, tol=1e-12, solver='squarem')
+        head = np.concatenate(([0.0], np.cumsum(probs)))
+        support = np.unique(values)
+        np.testing.assert_allclose(cdf(support), head[np.searchsorted(intervals[:, 1], support, side='right')],
+                                   atol=1e-8)
+
+    def test_bounds_and_strategies(self):
+        joint = impute_array(self.values, self.status, censoring_type='mixed')
+        heuristic = impute_array(self.values, self.status, censoring_type='mixed', mixed_strategy='heuristic')
+
+        self.assertTrue(np.all(joint[self.status == -1] <= self.values[self.status == -1]))
+        self.assertTrue(np.all(joint[self.status == 1] >= 15.0))
+        np.testing.assert_array_equal(joint[self.status == 0], self.values[self.status == 0])
+        self.assertFalse(np.allclose(joint, heuristic))
+        with self.assertRaisesRegex(ValueError, "mixed_strategy"):
+            impute_array(self.values, self.status, censoring_type='mixed', mixed_strategy='sequential')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,208 @@
+import unittest
+import numpy as np
+from scipy.stats import truncnorm, weibull_min
+import pandas as pd
+from ndimpute.api import impute_array, impute_grouped, impute_multiple, impute_stream
+from ndimpute._interval import _fit_interval_ros, _fit_interval_ros_batched, _predict_interval, _sample_truncnorm
+from ndimpute._multiple import _interval_sampler
+from ndimpute._turnbull import turnbull_em, turnbull_em_batched
+from ndimpute._parametric import _expected_below, _sample_above, _sample_below
+
+class TestSamplers(unittest.TestCase):
+    def test_truncnorm_matches_scipy(self):
+        a = np.array([-np.inf, -2.0, 0.5, -1.0, 3.0])
+        b = np.array([0.0, -1.0, np.inf, 1.0, 4.0])
+        u = np.linspace(0.05, 0.95, 7)[:, None]
+
+        np.testing.assert_allclose(_sample_truncnorm(a, b, u), truncnorm.ppf(u, a, b), rtol=1e-9)
+
+    def test_truncnorm_far_tails(self):
+        u = np.random.default_rng(0).random(1000)
+        for a, b in [(-60.0, -59.0), (40.0, np.inf), (-np.inf, -45.0)]:
+            z = _sample_truncnorm(a, b, u)
+            self.assertTrue(np.all(np.isfinite(z)))
+            self.assertTrue(np.all((z >= a) & (z <= b)))
+
+    def test_weibull_matches_scipy(self):
+        shape, scale = 1.7, 3.0
+        u = np.linspace(0.05, 0.95, 7)
+        dist = weibull_min(shape, scale=scale)
+
+        np.testing.assert_allclose(_sample_above(2.0, shape, scale, u),
+                                   dist.ppf(dist.cdf(2.0) + u * dist.sf(2.0)), rtol=1e-10)
+        np.testing.assert_allclose(_sample_below(2.0, shape, scale, u), dist.ppf(u * dist.cdf(2.0)),
+                                   rtol=1e-10)
+
+    def test_weibull_limit_far_below_scale(self):
+        # F(L) underflows (or nearly): draws stay in (0, L] and match the mean path
+        limits = np.array([1e-6, 1e-120])
+        u = np.random.default_rng(0).random((20000, 1))
+        drawn = _sample_below(limits, 3.0, 10.0, u)
+
+        self.assertTrue(np.all((drawn > 0) & (drawn <= limits)))
+        np.testing.assert_allclose(drawn.mean(axis=0), _expected_below(limits, 3.0, 10.0), rtol=0.01)
+
+class TestMultipleImputation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.x = rng.lognormal(1, 1, 300)
+        self.limit = np.quantile(self.x, 0.3)
+        self.cens = self.x < self.limit
+        self.values = np.where(self.cens, self.limit, self.x)
+
+    def test_left_ros(self):
+        draws = impute_multiple(self.values, self.cens, n_imputations=50, random_state=0)
+
+        self.assertEqual(draws.shape, (50, 300))
+        np.testing.assert_array_equal(draws[:, ~self.cens], np.tile(self.values[~self.cens], (50, 1)))
+        self.assertTrue(np.all(draws[:, self.cens] <= self.limit))
+        # Draws differ between and within imputations
+        self.assertGreater(np.std(draws[:, self.cens]), 0)
+
+    def test_reproducible_and_independent_of_n_jobs(self):
+        kwargs = dict(n_imputations=12, random_state=7, chunk_size=5)
+        first = impute_multiple(self.values, self.cens, **kwargs)
+
+        np.testing.assert_array_equal(first, impute_multiple(self.values, self.cens, **kwargs))
+        np.testing.assert_array_equal(first, impute_multiple(self.values, self.cens, n_jobs=2, **kwargs))
+
+    def test_draws_centre_on_ros(self):
+        # Without bootstrap, log-space draws average to the ROS conditional mean
+        draws = impute_multiple(self.values, self.cens, n_imputations=4000, bootstrap=False, random_state=1)
+        expected = impute_array(self.values, self.cens)
+
+        np.testing.assert_allclose(np.log(draws[:, self.cens]).mean(axis=0), np.log(expected[self.cens]),
+                                   atol=0.05)
+
+    def test_right_and_mixed_parametric(self):
+        status = np.zeros(300, dtype=int)
+        status[self.x < 1.0] = -1
+        status[self.x > 8.0] = 1
+        values = np.where(status == -1, 1.0, np.where(status == 1, 8.0, self.x))
+
+        draws = impute_multiple(values, status, method='parametric', censoring_type='mixed', n_imputations=20,
+                                random_state=0)
+        self.assertTrue(np.all(draws[:, status == -1] <= 1.0))
+        self.assertTrue(np.all(draws[:, status == 1] >= 8.0))
+
+        right = impute_multiple(self.values, self.x > 8.0, censoring_type='right', n_imputations=5,
+                                random_state=0)
+        self.assertTrue(np.all(right[:, self.x > 8.0] >= self.values[self.x > 8.0]))
+
+    def test_interval(self):
+        bounds = np.column_stack((np.floor(self.x), np.floor(self.x) + 1))
+        draws = impute_multiple(bounds, censoring_type='interval', n_imputations=10, random_state=0)
+
+        self.assertTrue(np.all((draws >= bounds[:, 0]) & (draws <= bounds[:, 1])))
+
+    def test_batched_interval_refits(self):
+        bounds = np.column_stack((np.floor(self.x), np.floor(self.x) + 1))
+        counts = np.vstack([np.ones(300), np.random.default_rng(0).multinomial(300, np.full(300, 1 / 300), 2)])
+
+        intervals, probs, _ = turnbull_em_batched(bounds[:, 0], bounds[:, 1], counts)
+        for row, weights in zip(probs, counts):
+            np.testing.assert_allclose(row, turnbull_em(bounds[:, 0], bounds[:, 1], weights=weights)[1],
+                                       atol=1e-12)
+
+        intercept, slope = _fit_interval_ros_batched(bounds[:, 0], bounds[:, 1], counts)
+        np.testing.assert_allclose((intercept[0], slope[0]), _fit_interval_ros(bounds[:, 0], bounds[:, 1]),
+                                   rtol=1e-10)
+
+    def test_batched_overlapping_refits(self):
+        # EM leaves negligible masses on trailing intervals, past where the
+        # cumulative sum rounds to 1: those must not spoil the regression
+        rng = np.random.default_rng(0)
+        left, right = self.x * rng.uniform(0.5, 1, 300), self.x * rng.uniform(1, 2, 300)
+        idx = rng.integers(0, 300, (50, 300))
+        counts = np.vstack([np.ones(300), [np.bincount(rows, minlength=300) for rows in idx]])
+
+        intercept, slope = _fit_interval_ros_batched(left, right, counts)
+        self.assertTrue(np.all(np.isfinite(intercept) & np.isfinite(slope)))
+        np.testing.assert_allclose((intercept[0], slope[0]), _fit_interval_ros(left, right), rtol=1e-8)
+
+        # Resamples match their own fits up to the NPMLE's non-uniqueness
+        own = np.array([_fit_interval_ros(left[rows], right[rows]) for rows in idx])
+        np.testing.assert_allclose(intercept[1:], own[:, 0], atol=0.05)
+        np.testing.assert_allclose(slope[1:], own[:, 1], atol=0.05)
+
+    def test_interval_refits_use_solver(self):
+        bounds = np.column_stack((self.x * 0.8, self.x * 1.5))
+        draws = _interval_sampler(bounds, True, solver='squarem')(5, np.random.default_rng(0))
+
+        rng = np.random.default_rng(0)
+        idx = rng.integers(0, 300, (5, 300))
+        params = np.array([_fit_interval_ros(bounds[rows, 0], bounds[rows, 1], solver='squarem') for rows in idx])
+        expected = _predict_interval(bounds[:, 0], bounds[:, 1], params[:, :1], params[:, 1:],
+                                     u=rng.random((5, 300)))
+        np.testing.assert_allclose(draws, expected, rtol=1e-12)
+
+    def test_invalid(self):
+        with self.assertRaises(NotImplementedError):
+            impute_multiple(self.values, self.cens, method='substitution')
+        with self.assertRaises(ValueError):
+            impute_multiple(self.values, self.cens, n_imputations=0)
+
+class TestRandomDraw(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.x = rng.lognormal(1, 1, 400)
+        self.status = np.zeros(400, dtype=int)
+        self.status[self.x < 1.0] = -1
+        self.status[self.x > 8.0] = 1
+        self.values = np.where(self.status == -1, 1.0, np.where(self.status == 1, 8.0, self.x))
+
+    def check_draws(self, method, censoring_type, status):
+        drawn = impute_array(self.values, status, method=method, censoring_type=censoring_type, draw='random',
+                             random_state=0)
+        again = impute_array(self.values, status, method=method, censoring_type=censoring_type, draw='random',
+                             random_state=0)
+        codes = np.asarray(status, dtype=int)
+        left = codes == -1 if censoring_type == 'mixed' else (codes == 1) & (censoring_type == 'left')
+        right = codes == 1 if censoring_type != 'left' else np.zeros_like(left)
+
+        np.testing.assert_array_equal(drawn, again)
+        np.testing.assert_allclose(drawn[codes == 0], self.values[codes == 0], rtol=1e-12)
+        self.assertTrue(np.all(drawn[left] <= self.values[left]))
+        self.assertTrue(np.all(drawn[right] >= self.values[right]))
+        # Values at the same limit are no longer all equal
+        self.assertGreater(len(np.unique(drawn[codes != 0])), 0.9 * np.sum(codes != 0))
+
+    def test_methods(self):
+        self.check_draws('ros', 'left', self.status == -1)
+        self.check_draws('ros', 'right', self.status == 1)
+        self.check_draws('parametric', 'right', self.status == 1)
+        self.check_draws('parametric', 'mixed', self.status)
+        self.check_draws('ros', 'mixed', self.status)
+
+    def test_simple_draws_centre_on_mean(self):
+        cens = self.status == -1
+        mean = impute_array(self.values, cens, plotting_position='simple')
+        drawn = np.mean([impute_array(self.values, cens, plotting_position='simple', draw='random',
+                                      random_state=seed) for seed in range(300)], axis=0)
+
+        np.testing.assert_allclose(drawn[cens], mean[cens], rtol=0.02)
+
+    def test_interval(self):
+        bounds = np.column_stack((np.floor(self.x), np.floor(self.x) + 1))
+        drawn = impute_array(bounds, censoring_type='interval', draw='random', random_state=0)
+
+        self.assertTrue(np.all((drawn >= bounds[:, 0]) & (drawn <= bounds[:, 1])))
+        self.assertFalse(np.allclose(drawn, impute_array(bounds, censoring_type='interval')))
+
+    def test_grouped_reproducible(self):
+        df = pd.DataFrame({'g': np.arange(400) % 4, 'v': self.values, 'c': self.status == -1})
+        serial = impute_grouped(df, 'g', 'v', 'c', draw='random', random_state=5)
+        parallel = impute_grouped(df, 'g', 'v', 'c', draw='random', random_state=5, n_jobs=2)
+
+        np.testing.assert_array_equal(serial['imputed_value'], parallel['imputed_value'])
+
+    def test_unsupported(self):
+        with self.assertRaises(NotImplementedError):
+            impute_array(self.values, self.status == -1, method='substitution', draw='random')
+        with self.assertRaises(NotImplementedError):
+            impute_stream([(self.values, self.status == -1)], draw='random')
+        with self.assertRaisesRegex(ValueError, "Unknown draw"):
+            impute_array(self.values, self.status == -1, draw='median')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+import numpy as np
+from ndimpute.api import impute_array
+from ndimpute._parquet import decode_qualifier, impute_parquet, read_parquet_censored
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+class TestDecodeQualifier(unittest.TestCase):
+    def test_infers_type(self):
+        status, censoring_type = decode_qualifier(['<', '', None, '<'])
+        self.assertEqual(censoring_type, 'left')
+        np.testing.assert_array_equal(status, [True, False, False, True])
+
+        status, censoring_type = decode_qualifier(['', '>'])
+        self.assertEqual(censoring_type, 'right')
+        np.testing.assert_array_equal(status, [False, True])
+
+        status, censoring_type = decode_qualifier(['<', '', '>'])
+        self.assertEqual(censoring_type, 'mixed')
+        np.testing.assert_array_equal(status, [-1, 0, 1])
+
+    def test_invalid(self):
+        with self.assertRaisesRegex(ValueError, "Unknown qualifier"):
+            decode_qualifier(['<', 'ND'])
+        with self.assertRaisesRegex(ValueError, "censoring_type='left'"):
+            decode_qualifier(['<', '>'], censoring_type='left')
+
+    @unittest.skipIf(HAS_PYARROW, "pyarrow is installed")
+    def test_missing_pyarrow(self):
+        with self.assertRaisesRegex(ImportError, r"ndimpute\[parquet\]"):
+            read_parquet_censored('data.parquet')
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestParquet(unittest.TestCase):
+    def setUp(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rng = np.random.default_rng(0)
+        n = 3000
+        self.values = np.round(rng.lognormal(1, 1, n), 2) + 0.01
+        self.status = rng.random(n) < 0.3
+        self.values[self.status] = rng.choice([0.5, 1.0, 2.0], self.status.sum())
+        self.site = np.arange(n) % 3
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.tmp.name, 'in.parquet')
+        self.dest = os.path.join(self.tmp.name, 'out.parquet')
+        table = pa.table({'site': self.site, 'value': self.values,
+                          'qualifier': np.where(self.status, '<', ''), 'unused': np.zeros(n)})
+        pq.write_table(table, self.source, row_group_size=500)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_impute_matches_in_memory(self):
+        import pyarrow.parquet as pq
+
+        n_rows = impute_parquet(self.source, self.dest, columns=['site'], batch_size=700)
+        out = pq.read_table(self.dest)
+
+        self.assertEqual(n_rows, len(self.values))
+        self.assertEqual(out.column_names, ['site', 'value', 'qualifier', 'imputed_value'])
+        np.testing.assert_allclose(out.column('imputed_value').to_numpy(),
+                                   impute_array(self.values, self.status), rtol=1e-12)
+
+    def test_filter_pushdown(self):
+        import pyarrow.parquet as pq
+
+        impute_parquet(self.source, self.dest, filters=[('site', '==', 1)])
+        keep = self.site == 1
+        np.testing.assert_allclose(pq.read_table(self.dest).column('imputed_value').to_numpy(),
+                                   impute_array(self.values[keep], self.status[keep]), rtol=1e-12)
+
+    def test_read(self):
+        values, status, censoring_type = read_parquet_censored(self.source)
+
+        self.assertEqual(censoring_type, 'left')
+        np.testing.assert_array_equal(values, self.values)
+        np.testing.assert_array_equal(status, self.status)
+
+if __name__ == '__main__':
+    unittest.main()
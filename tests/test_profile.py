@@ -0,0 +1,68 @@
+import json
+import unittest
+import numpy as np
+import pandas as pd
+import ndimpute
+from ndimpute import _profile
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.lognormal(1, 1, 400)
+        self.status = np.where(self.x < 1.0, -1, np.where(self.x > 8.0, 1, 0))
+        self.values = np.where(self.status == -1, 1.0, np.where(self.status == 1, 8.0, self.x))
+
+    def test_stages_and_fits(self):
+        with ndimpute.profile() as prof:
+            ndimpute.impute(self.values, self.status == -1)
+            ndimpute.impute(self.values, self.status, censoring_type='mixed')
+            ndimpute.impute_array(self.values, self.status, method='parametric', censoring_type='mixed')
+
+        for name in ('convert', 'impute', 'plotting_positions', 'regression', 'npmle', 'turnbull_em',
+                     'weibull_fit', 'dataframe'):
+            self.assertIn(name, prof.stages)
+        self.assertEqual(prof.stages['impute']['count'], 3)
+        self.assertEqual(prof.stages['dataframe']['count'], 2)
+        self.assertGreaterEqual(prof.wall_s, prof.stages['impute']['total_s'])
+
+        self.assertEqual(prof.fits['turnbull_em']['count'], 1)
+        self.assertEqual(prof.fits['weibull']['count'], 1)
+        self.assertEqual(prof.fits['weibull']['not_converged'], 0)
+        self.assertGreater(prof.fits['turnbull_em']['iterations'], 0)
+
+    def test_grouped_runs_are_aggregated(self):
+        df = pd.DataFrame({'g': np.arange(400) % 8, 'v': self.values, 'c': self.status == 1})
+        with ndimpute.profile() as prof:
+            ndimpute.impute_grouped(df, 'g', 'v', 'c', method='parametric', censoring_type='right')
+            ndimpute.impute_grouped(df, 'g', 'v', 'c', method='ros', censoring_type='right',
+                                    plotting_position='simple', n_jobs=2, executor='thread')
+
+        self.assertEqual(prof.fits['weibull']['count'], 8)
+        self.assertGreaterEqual(prof.stages['segmented_ros']['count'], 1)
+        self.assertEqual(prof.stages['group_sort']['count'], 2)
+
+    def test_export_and_trace(self):
+        with ndimpute.profile(memory=True, trace=True) as prof:
+            ndimpute.impute(self.values, self.status == -1)
+
+        exported = json.loads(prof.to_json())
+        self.assertEqual(exported, json.loads(json.dumps(prof.to_dict())))
+        self.assertIn('peak_mb', exported['stages']['impute'])
+        self.assertGreater(exported['stages']['impute']['peak_mb'], 0)
+        self.assertEqual(sum('stage' in e for e in exported['events']),
+                         sum(s['count'] for s in exported['stages'].values()))
+        self.assertIn('regression', prof.summary())
+
+    def test_inactive_and_nested(self):
+        self.assertIs(_profile.stage('impute'), _profile._NULL)
+
+        with ndimpute.profile() as prof:
+            with self.assertRaises(RuntimeError):
+                with ndimpute.profile():
+                    pass
+        ndimpute.impute_array(self.values, self.status == -1)
+        self.assertEqual(prof.stages, {})
+        self.assertIsNone(_profile._ACTIVE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,8 @@ import unittest
 import numpy as np
 import pandas as pd
 from ndimpute.api import impute
-from ndimpute._ros_left import impute_ros_left
+from scipy.stats import ecdf, CensoredData, norm, linregress
+from ndimpute._ros_left import impute_ros_left, _km_plotting_positions
 
 class TestROSLeft(unittest.TestCase):
     def test_ros_left_basic(self):
@@ -52,6 +53,33 @@ class TestROSLeft(unittest.TestCase):
         # Let's just check they are not NaN and are positive
         self.assertTrue(np.all(imputed_cens > 0))
 
+    def test_km_positions_match_scipy_ecdf(self):
+        # Multiple detection limits, ties between limits and detects
+        rng = np.random.default_rng(0)
+        values = np.round(rng.lognormal(mean=1, sigma=1, size=80), 1) + 0.1
+        limits = rng.choice([0.5, 1.0, 2.0, 3.0], size=80)
+        status = values < limits
+        values = np.where(status, limits, values)
+
+        pp = _km_plotting_positions(values, status)
+
+        res = ecdf(CensoredData(uncensored=-values[~status], right=-values[status]))
+        np.testing.assert_array_equal(pp, res.sf.evaluate(-values))
+
+    def test_simple_positions_rank_limits_below_detects(self):
+        # <2, 2 (detect), <2, 3, 5, 8: limits rank 1 and 2, the detect at 2 ranks 3
+        values = np.array([2.0, 2.0, 2.0, 3.0, 5.0, 8.0])
+        status = np.array([True, False, True, False, False, False])
+
+        result = impute_ros_left(values, status, plotting_position='simple')
+
+        z = norm.ppf(np.arange(1, 7) / 7)
+        slope, intercept, _, _, _ = linregress(z[2:], np.log(values[[1, 3, 4, 5]]))
+        expected = values.copy()
+        expected[[0, 2]] = np.minimum(np.exp(intercept + slope * z[:2]), 2.0)
+
+        np.testing.assert_allclose(result, expected)
+
     def test_few_uncensored_raises(self):
         values = [1, 1, 1]
         status = [True, True, True]
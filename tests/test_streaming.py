@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+from ndimpute.api import impute_array, impute_stream
+from ndimpute._streaming import _reservoir_update
+
+def make_chunks(values, status, size):
+    return [(values[i:i + size], status[i:i + size]) for i in range(0, len(values), size)]
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 2000
+        # Lab-style data: values at 2 decimals, a few detection limits
+        self.values = np.round(rng.lognormal(1, 1, n), 2) + 0.01
+        self.status = rng.random(n) < 0.3
+        self.values[self.status] = rng.choice([0.5, 1.0, 2.0], self.status.sum())
+
+    def test_ros_matches_in_memory(self):
+        chunks = make_chunks(self.values, self.status, 333)
+        for censoring_type in ['left', 'right']:
+            for dist in ['lognormal', 'normal']:
+                streamed = np.concatenate(list(impute_stream(chunks, censoring_type=censoring_type, dist=dist)))
+                expected = impute_array(self.values, self.status, censoring_type=censoring_type, dist=dist)
+                np.testing.assert_allclose(streamed, expected, rtol=1e-12)
+
+    def test_substitution_and_callable_source(self):
+        chunks = make_chunks(self.values, self.status, 500)
+        streamed = impute_stream(lambda: iter(chunks), method='substitution', strategy='half')
+
+        np.testing.assert_array_equal(np.concatenate(list(streamed)),
+                                      impute_array(self.values, self.status, method='substitution'))
+
+    def test_parametric_full_reservoir_matches(self):
+        status = self.status.astype(int)
+        chunks = make_chunks(self.values, status, 400)
+        streamed = impute_stream(chunks, method='parametric', censoring_type='mixed', sample_size=5000)
+
+        np.testing.assert_array_equal(np.concatenate(list(streamed)),
+                                      impute_array(self.values, status, method='parametric', censoring_type='mixed'))
+
+    def test_reservoir_is_uniform(self):
+        rng = np.random.default_rng(1)
+        hits = np.zeros(100)
+        for _ in range(500):
+            sample = [np.empty(10), np.empty(10, dtype=int)]
+            seen = 0
+            for start in range(0, 100, 7):
+                rows = np.arange(start, min(start + 7, 100))
+                seen = _reservoir_update(sample, seen, (rows.astype(float), rows), rng)
+            hits[sample[1]] += 1
+
+        # Each row kept with probability 10/100
+        self.assertLess(np.abs(hits / 500 - 0.1).max(), 0.06)
+
+    def test_unsupported_and_one_shot(self):
+        chunks = make_chunks(self.values, self.status, 500)
+        with self.assertRaises(NotImplementedError):
+            impute_stream(chunks, plotting_position='simple')
+        with self.assertRaises(ValueError):
+            impute_stream(iter(chunks))
+
+if __name__ == '__main__':
+    unittest.main()
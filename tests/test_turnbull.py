@@ -0,0 +1,153 @@
+import importlib.util
+import unittest
+import numpy as np
+from ndimpute._turnbull import (turnbull_em, predict_turnbull, TurnbullNPMLE, _compress_blocks, _em_step,
+                                _em_step_compiled, _em_step_loops, _innermost_intervals, _solve_squarem)
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+class TestTurnbull(unittest.TestCase):
+    def test_innermost_intervals(self):
+        # Observations: (0, 2], (1, 3], (2, 4], (5, 6]
+        # L/R sets give innermost intervals (1, 2], (2, 3] and (5, 6].
+        left = np.array([0.0, 1.0, 2.0, 5.0])
+        right = np.array([2.0, 3.0, 4.0, 6.0])
+
+        intervals, probs = turnbull_em(left, right)
+
+        expected = np.array([[1.0, 2.0], [2.0, 3.0], [5.0, 6.0]])
+        np.testing.assert_array_equal(intervals, expected)
+        self.assertAlmostEqual(np.sum(probs), 1.0)
+        self.assertAlmostEqual(probs[-1], 0.25)
+
+    def test_inspection_intervals_touching(self):
+        # Adjacent inspection intervals (a, b], (b, c] do not overlap at b.
+        left = np.array([0.0, 2.0, 2.0, 4.0])
+        right = np.array([2.0, 4.0, 4.0, 6.0])
+
+        intervals, probs = turnbull_em(left, right)
+
+        np.testing.assert_array_equal(intervals, [[0.0, 2.0], [2.0, 4.0], [4.0, 6.0]])
+        np.testing.assert_array_almost_equal(probs, [0.25, 0.5, 0.25])
+
+    def test_exact_and_right_censored(self):
+        # Exact observations (L == R) and right-censored (L, inf) keep their mass.
+        left = np.array([1.0, 3.0, 0.0, 5.0])
+        right = np.array([1.0, 3.0, 4.0, np.inf])
+
+        intervals, probs = turnbull_em(left, right)
+
+        np.testing.assert_array_equal(intervals, [[1.0, 1.0], [3.0, 3.0], [5.0, np.inf]])
+        self.assertAlmostEqual(np.sum(probs), 1.0)
+        self.assertAlmostEqual(probs[-1], 0.25)
+
+    def test_squarem_matches_em(self):
+        rng = np.random.default_rng(0)
+        left = np.round(rng.uniform(0, 10, 500), 1)
+        right = left + np.round(rng.uniform(0.1, 3, 500), 1)
+        right[rng.random(500) < 0.1] = np.inf
+
+        _, p_ref, info_ref = turnbull_em(left, right, max_iter=20000, tol=1e-10, return_info=True)
+        _, p_sq, info_sq = turnbull_em(left, right, max_iter=20000, tol=1e-10, solver='squarem',
+                                       return_info=True)
+
+        self.assertTrue(info_ref['converged'])
+        self.assertTrue(info_sq['converged'])
+        self.assertLess(info_sq['n_em_steps'], info_ref['n_em_steps'])
+        np.testing.assert_allclose(p_sq, p_ref, atol=1e-6)
+        self.assertAlmostEqual(info_sq['loglik'], info_ref['loglik'], places=6)
+
+    def test_weights_match_repeated_rows(self):
+        left = np.array([0.0, 1.0, 2.0, 5.0])
+        right = np.array([2.0, 3.0, 4.0, 6.0])
+        counts = np.array([3, 1, 2, 4])
+
+        _, p_weighted = turnbull_em(left, right, tol=1e-12, weights=counts)
+        _, p_repeated = turnbull_em(np.repeat(left, counts), np.repeat(right, counts), tol=1e-12)
+
+        np.testing.assert_allclose(p_weighted, p_repeated, atol=1e-10)
+
+    def test_invalid_bounds_raise(self):
+        with self.assertRaises(ValueError):
+            turnbull_em([2.0, 1.0], [1.0, 3.0])
+        with self.assertRaises(ValueError):
+            turnbull_em([0.0], [1.0], solver='newton')
+
+    def test_predict_matches_loop(self):
+        rng = np.random.default_rng(1)
+        left = np.round(rng.uniform(0, 10, 200), 1)
+        right = left + np.round(rng.uniform(0, 2, 200), 1)
+        intervals, probs = turnbull_em(left, right)
+        # Query on and between the interval starts
+        times = np.concatenate([intervals[:, 0], rng.uniform(-1, 13, 100)])
+
+        expected = np.array([np.sum(probs[intervals[:, 0] > t]) for t in times])
+        np.testing.assert_allclose(predict_turnbull(intervals, probs, times), expected, atol=1e-12)
+
+    def test_npmle_queries(self):
+        left = np.array([0.0, 2.0, 2.0, 4.0])
+        right = np.array([2.0, 4.0, 4.0, 6.0])
+        est = TurnbullNPMLE.fit(left, right)
+
+        np.testing.assert_allclose(est.sf([-1.0, 0.0, 3.0, 4.0]), [1.0, 0.75, 0.25, 0.0])
+        np.testing.assert_allclose(est.cdf([-1.0, 0.0, 3.0, 4.0]), [0.0, 0.25, 0.75, 1.0])
+        np.testing.assert_array_equal(est.quantile([0.0, 0.25, 0.5, 1.0]), [0.0, 0.0, 2.0, 4.0])
+        self.assertTrue(est.info['converged'])
+
+        with self.assertRaises(ValueError):
+            est.quantile(1.5)
+
+    def test_nan_queries(self):
+        est = TurnbullNPMLE.fit(np.array([0.0, 2.0, 4.0]), np.array([2.0, 4.0, 6.0]))
+        t = np.array([np.nan, 3.0, np.inf, -np.inf])
+
+        np.testing.assert_allclose(est.sf(t), [np.nan, 1 / 3, 0.0, 1.0])
+        np.testing.assert_allclose(est.cdf(t), [np.nan, 2 / 3, 1.0, 0.0])
+        np.testing.assert_array_equal(predict_turnbull(est.intervals, est.probs, t), est.sf(t))
+        np.testing.assert_array_equal(est.quantile([np.nan, 0.5]), [np.nan, 2.0])
+
+class TestTurnbullBackends(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        x = rng.lognormal(1, 1, 300)
+        self.left = np.floor(x * 2) / 2
+        self.right = np.where(rng.random(300) < 0.2, np.inf, self.left + rng.choice([0.5, 1.0, 2.0], 300))
+
+    def test_loops_match_numpy_bitwise(self):
+        # The kernel run uncompiled performs the same arithmetic as Numba
+        intervals, first, last = _innermost_intervals(self.left, self.right)
+        m = len(intervals)
+        first, last, counts = _compress_blocks(first, last, m, np.arange(len(self.left)) % 3 + 1.0)
+        p0 = np.ones(m) / m
+        n = counts.sum()
+
+        step = lambda p, first, last, counts, n: _em_step_compiled(p, first, last, counts, n, _em_step_loops)
+        p_ref, loglik_ref = _em_step(p0, first, last, counts, n)
+        p_new, loglik = step(p0, first, last, counts, n)
+        np.testing.assert_array_equal(p_new, p_ref)
+        self.assertEqual(loglik, loglik_ref)
+
+        ref = _solve_squarem(p0, first, last, counts, n, 50, 1e-9)
+        out = _solve_squarem(p0, first, last, counts, n, 50, 1e-9, step)
+        np.testing.assert_array_equal(out[0], ref[0])
+        self.assertEqual(out[1:], ref[1:])
+
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def test_numba_matches_numpy(self):
+        for solver in ('em', 'squarem'):
+            ref = turnbull_em(self.left, self.right, solver=solver, return_info=True, backend='numpy')
+            out = turnbull_em(self.left, self.right, solver=solver, return_info=True, backend='numba')
+            np.testing.assert_array_equal(out[1], ref[1])
+            self.assertEqual(out[2], ref[2])
+
+    @unittest.skipIf(HAS_NUMBA, "numba is installed")
+    def test_missing_numba(self):
+        with self.assertRaisesRegex(ImportError, r"ndimpute\[numba\]"):
+            turnbull_em(self.left, self.right, backend='numba')
+
+    def test_unknown_backend(self):
+        with self.assertRaisesRegex(ValueError, "Unknown backend"):
+            turnbull_em(self.left, self.right, backend='cuda')
+
+if __name__ == '__main__':
+    unittest.main()
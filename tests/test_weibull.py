@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+from scipy.stats import weibull_min, CensoredData
+from ndimpute._weibull import fit_weibull_censored, fit_weibull_batched
+from ndimpute._parametric import _fit_weibull
+
+def loglik(shape, scale, uncensored, left, right):
+    return (weibull_min.logpdf(uncensored, shape, scale=scale).sum()
+            + weibull_min.logcdf(left, shape, scale=scale).sum()
+            + weibull_min.logsf(right, shape, scale=scale).sum())
+
+class TestWeibullMLE(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        x = weibull_min.rvs(1.7, scale=40.0, size=300, random_state=rng)
+        status = rng.choice([-1, 0, 1], size=300, p=[0.2, 0.6, 0.2])
+        self.data = (x[status == 0], x[status == -1], x[status == 1])
+
+    def test_matches_scipy_fit(self):
+        shape, scale, info = fit_weibull_censored(*self.data, return_info=True)
+        uncensored, left, right = self.data
+        ref_shape, _, ref_scale = weibull_min.fit(CensoredData(uncensored=uncensored, left=left, right=right), floc=0)
+
+        self.assertTrue(info['converged'])
+        np.testing.assert_allclose([shape, scale], [ref_shape, ref_scale], rtol=1e-4)
+        self.assertAlmostEqual(info['loglik'], loglik(shape, scale, *self.data), places=8)
+        # At least as good as the generic optimizer
+        self.assertGreaterEqual(info['loglik'], loglik(ref_shape, ref_scale, *self.data) - 1e-8)
+
+    def test_warm_start(self):
+        shape, scale, cold = fit_weibull_censored(*self.data, return_info=True)
+        warm_shape, warm_scale, warm = fit_weibull_censored(*self.data, init=(shape, scale), return_info=True)
+
+        self.assertLessEqual(warm['n_iter'], 2)
+        self.assertLess(warm['n_iter'], cold['n_iter'])
+        np.testing.assert_allclose([warm_shape, warm_scale], [shape, scale], rtol=1e-9)
+
+    def test_no_exact_observations_falls_back(self):
+        # All right-censored: no finite MLE, so the Newton fit does not converge
+        _, _, info = fit_weibull_censored([], right=[1.0, 2.0, 3.0], return_info=True)
+        self.assertFalse(info['converged'])
+
+        shape, scale = _fit_weibull(np.array([]), right=np.array([1.0, 2.0, 3.0]))
+        self.assertTrue(np.isfinite(shape) and np.isfinite(scale))
+
+    def test_batched_matches_single_fits(self):
+        rng = np.random.default_rng(1)
+        groups = []
+        for shape in [0.7, 1.5, 3.0]:
+            x = weibull_min.rvs(shape, scale=10 * shape, size=50, random_state=rng)
+            groups.append((x, rng.choice([-1, 0, 1], size=50, p=[0.2, 0.6, 0.2])))
+        # No exact observations: no MLE
+        groups.append((np.array([1.0, 2.0, 3.0]), np.array([1, 1, 1])))
+
+        values = np.concatenate([x for x, _ in groups])
+        status = np.concatenate([st for _, st in groups])
+        sizes = np.array([len(x) for x, _ in groups])
+        stops = np.cumsum(sizes)
+        shapes, scales, info = fit_weibull_batched(values, status, stops - sizes, stops, return_info=True)
+
+        np.testing.assert_array_equal(info['converged'], [True, True, True, False])
+        for g, (x, st) in enumerate(groups[:3]):
+            shape, scale = fit_weibull_censored(x[st == 0], left=x[st == -1], right=x[st == 1])
+            self.assertAlmostEqual(shapes[g], shape, places=10)
+            self.assertAlmostEqual(scales[g] / scale, 1.0, places=10)
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            fit_weibull_censored([1.0, 0.0, 2.0])
+        with self.assertRaises(ValueError):
+            fit_weibull_censored([])
+
+if __name__ == '__main__':
+    unittest.main()